@@ -0,0 +1,474 @@
+# Performance benchmarks for psi_creature.py
+# Nothing is rendered, so this runs headless (with manim's low quality settings).
+# From the repository root:
+#   python benchmarks.py                         # run every benchmark
+#   python benchmarks.py resize                  # only benchmarks whose name contains "resize"
+#   python benchmarks.py --json results.json     # also save the results
+#   python benchmarks.py --compare               # fail on regressions against benchmarks_baseline.json
+#   python benchmarks.py --update-baseline       # store this run as the baseline
+#
+# Timings depend on the machine, so every run also times a fixed calibration
+# workload, and --compare judges each timing relative to its own run's
+# calibration: a uniformly faster or slower machine is not a regression.
+
+import argparse
+import copy
+import inspect
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+import wave
+
+import manim
+from manim import *
+from manim.utils import hashing as manim_hashing
+import psi_creature
+from psi_creature import PsiCreature, AlignedTransform, Become, CreatureCrowd, Sclera, compile_asset_bundle, load_bundled_template, SCLERA_DEFORMATION_CACHE
+from lip_sync import LipSyncTrack, lip_sync
+from culling import CullingCamera, Culled
+
+BASELINE_PATH = "benchmarks_baseline.json"
+BENCHMARKS = {}
+RESULTS = []
+
+def benchmark(func):
+    """Registers `func` to be run by `main`."""
+    BENCHMARKS[func.__name__] = func
+    return func
+
+def measure(func, repeat: int = 5) -> tuple:
+    """
+    Calls `func` once to warm up caches, then `repeat` times for timing and
+    once more under tracemalloc.
+
+    Returns:
+        tuple: (best wall time in seconds, peak traced allocation in bytes)
+    """
+    func()
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+def report(name: str, seconds: float, peak_bytes: int) -> None:
+    RESULTS.append({"name": name, "seconds": seconds, "peak_bytes": peak_bytes})
+    print(f"{name:<52} {seconds * 1e3:10.3f} ms {peak_bytes / 1024:12.1f} KiB peak")
+
+def report_bytes(name: str, retained: float) -> None:
+    RESULTS.append({"name": name, "retained_bytes": retained})
+    print(f"{name:<52} {retained / 1024:10.1f} KiB")
+
+def _calibration_workload() -> None:
+    # Small array math driven from Python, like the frames and setups measured here
+    points = np.linspace(0.0, 1.0, 3 * 256).reshape(-1, 3)
+    for _ in range(200):
+        points = points * 0.999 + 0.001
+        points[::4] = np.cross(points[::4], UP)
+        _ = [float(value) for value in points[:32, 0]]
+
+def calibrate() -> tuple:
+    """Times the calibration workload: (best wall time in seconds, peak traced allocation in bytes)."""
+    return measure(_calibration_workload, repeat=20)
+
+def run_animation(animation: Animation) -> None:
+    """Drives an animation through begin, one mid frame and finish, as a Scene would."""
+    animation.begin()
+    animation.interpolate(0.5)
+    animation.finish()
+
+# ====================================================================
+#  Benchmarks
+# ====================================================================
+@benchmark
+def bench_construction():
+    for body_scale in (0.5, 1.0, 2.0, 4.0):
+        report(f"PsiCreature(body_scale={body_scale})", *measure(lambda: PsiCreature(body_scale=body_scale)))
+    report("PsiCreature() + change_state", *measure(lambda: PsiCreature().change_state("pondering")))
+    report("PsiCreature.layout_for (cached)", *measure(lambda: PsiCreature.layout_for("pondering")))
+
+@benchmark
+def bench_change_state():
+    psi = PsiCreature()
+    states = {"flip": True}
+    def build(**options):
+        # Alternate the target state, so every build really changes state
+        states["flip"] = not states["flip"]
+        return psi.change_state("pondering" if states["flip"] else "default", **options)
+    report("change_state (body only)", *measure(build))
+    report("change_state (look_at, mouth, squint, bend)", *measure(
+        lambda: build(look_at_target=UP + RIGHT, change_mouth_to="happy", squint_amount=PI / 6, bend_direction=UP)
+    ))
+    report("change_state (look_straight, resets)", *measure(
+        lambda: build(look_straight=True, reset_squint=True, reset_sclera=True)
+    ))
+
+    options = dict(look_at_target=UP + RIGHT, change_mouth_to="happy", squint_amount=PI / 6)
+    def play_instantly():
+        animation = build(**options)
+        animation.begin()
+        animation.finish()
+    report("change_state + begin/finish (instant setup, before)", *measure(play_instantly))
+    report("apply_state (instant setup)", *measure(
+        lambda: psi.apply_state("pondering" if states["flip"] else "default", **options)
+    ))
+
+    def body_transition(aligned: bool):
+        states["flip"] = not states["flip"]
+        new_state = "pondering" if states["flip"] else "default"
+        if aligned:
+            target_body = psi._get_aligned_bodies(psi.current_state_name, new_state, psi.anchor_pos)
+            animation = AlignedTransform(psi.body, target_body, psi._create_body_at_anchor(new_state, psi.anchor_pos))
+        else:
+            animation = Transform(psi.body, psi._create_body_at_anchor(new_state, psi.anchor_pos))
+        run_animation(animation)
+        psi.current_state_name = new_state
+    psi.apply_state("default")
+    report("body transition (Transform, aligned on begin)", *measure(lambda: body_transition(False)))
+    psi.apply_state("default")
+    report("body transition (cached aligned pair)", *measure(lambda: body_transition(True)))
+
+@benchmark
+def bench_sclera_targets():
+    psi = PsiCreature()
+    scleras = [psi.eyes.left_eye.sclera, psi.eyes.right_eye.sclera]
+    report("Sclera bend target", *measure(lambda: scleras[0]._get_bend_target(UP, 0.4)))
+    report("Sclera squint target", *measure(lambda: scleras[0]._get_squint_target(PI / 6)))
+    report("Sclera.get_bend_targets (2 eyes)", *measure(lambda: Sclera.get_bend_targets(scleras, [UP, UP])))
+    report("Sclera.get_squint_targets (2 eyes)", *measure(lambda: Sclera.get_squint_targets(scleras, PI / 6)))
+
+    def uncached(func):
+        SCLERA_DEFORMATION_CACHE.clear()
+        return func()
+    report("Sclera bend target (cache miss)", *measure(lambda: uncached(lambda: scleras[0]._get_bend_target(UP, 0.4))))
+    report("Sclera.get_bend_targets (2 eyes, cache miss)", *measure(lambda: uncached(lambda: Sclera.get_bend_targets(scleras, [UP, UP]))))
+
+@benchmark
+def bench_change_mouth():
+    psi = PsiCreature()
+    emotions = iter(["happy", "sad"] * 100)
+    report("change_mouth", *measure(lambda: psi.change_mouth(next(emotions))))
+
+@benchmark
+def bench_frames():
+    """The cost of one `interpolate` call (one frame) of each kind of creature animation."""
+    builders = {
+        "change_state (all options)": lambda psi: psi.change_state(
+            "pondering", look_at_target=UP + RIGHT, change_mouth_to="happy", squint_amount=PI / 6, bend_direction=UP
+        ),
+        "move_anchor_to": lambda psi: psi.move_anchor_to(RIGHT),
+        "resize (analytic)": lambda psi: psi.resize(1.5),
+        "resize (rebuild)": lambda psi: psi.resize(1.5, rebuild=True),
+        "blink": lambda psi: psi.blink(),
+        "look_at": lambda psi: psi.look_at(UP + RIGHT),
+        "change_mouth": lambda psi: psi.change_mouth("happy"),
+        "squint": lambda psi: psi.squint(PI / 6),
+        "bend_sclera": lambda psi: psi.bend_sclera(UP),
+        "blend_expression": lambda psi: psi.blend_expression(squint_amount=0.3, mouth_weights={"happy": 0.5, "sad": 0.5}),
+    }
+    for name, build in builders.items():
+        animation = build(PsiCreature())
+        animation.begin()
+        alphas = iter(np.tile(np.linspace(0.1, 0.9, 9), 100))
+        report(f"frame: {name}", *measure(lambda: animation.interpolate(next(alphas))))
+
+@benchmark
+def bench_detail_levels():
+    """Frame costs of small creatures at full detail and at the level their on-screen size picks."""
+    for level, label in ((0, "full detail"), (None, "auto detail")):
+        psi = PsiCreature(body_scale=0.5, detail_level=level)
+        animation = psi.change_state("pondering", look_at_target=UP + RIGHT, change_mouth_to="happy", squint_amount=PI / 6)
+        animation.begin()
+        alphas = iter(np.tile(np.linspace(0.1, 0.9, 9), 100))
+        report(f"frame: change_state (body_scale=0.5, {label})", *measure(lambda: animation.interpolate(next(alphas))))
+        animation.finish()
+        psi.start_idle(seed=0)
+        report(f"idle frame (body_scale=0.5, {label})", *measure(lambda: psi.update(1 / 60)))
+        crowd = CreatureCrowd(_crowd_anchors(1000), body_scale=0.5, detail_level=level)
+        animation = crowd.change_state("pondering", look_at_target=ORIGIN, change_mouth_to="happy")
+        animation.begin()
+        report(f"crowd frame (N=1000, body_scale=0.5, {label})", *measure(lambda: animation.interpolate(0.5)))
+
+@benchmark
+def bench_fused_transform():
+    """change_state played as its animation group and as one fused CreatureTransform, in frames per second."""
+    options = dict(look_at_target=UP + RIGHT, change_mouth_to="happy", squint_amount=PI / 6, bend_direction=UP)
+    for fused, label in ((False, "group"), (True, "fused")):
+        psi = PsiCreature()
+        animation = psi.change_state("pondering", fused=fused, **options)
+        animation.begin()
+        alphas = iter(np.tile(np.linspace(0.1, 0.9, 9), 100))
+        seconds, peak = measure(lambda: animation.interpolate(next(alphas)))
+        report(f"frame: change_state ({label})", seconds, peak)
+        print(f"{'':<52} {1 / seconds:10.0f} fps")
+        animation.finish()
+        states = iter(["default", "pondering"] * 100)
+        report(f"change_state + begin/mid frame/finish ({label})", *measure(
+            lambda: run_animation(psi.change_state(next(states), fused=fused, **options))
+        ))
+
+@benchmark
+def bench_template_loading():
+    with tempfile.TemporaryDirectory() as assets_dir:
+        for filename in os.listdir("assets"):
+            if filename.endswith(".svg"):
+                shutil.copy(os.path.join("assets", filename), assets_dir)
+        compile_asset_bundle(assets_dir)
+        svg_paths = [os.path.join(assets_dir, f) for f in sorted(os.listdir(assets_dir)) if f.endswith(".svg")]
+        report(f"parse {len(svg_paths)} SVGs", *measure(lambda: [SVGMobject(p, use_svg_cache=False) for p in svg_paths]))
+        report(f"load {len(svg_paths)} bundled templates", *measure(lambda: [load_bundled_template(p) for p in svg_paths]))
+
+@benchmark
+def bench_resize():
+    for rebuild in (True, False):
+        psi = PsiCreature(body_scale=2.0)
+        state = {"grow": True}
+        def resize_once():
+            factor = 1.5 if state["grow"] else 1 / 1.5
+            state["grow"] = not state["grow"]
+            run_animation(psi.resize(factor, rebuild=rebuild))
+        report(f"resize ({'rebuild' if rebuild else 'analytic'})", *measure(resize_once))
+
+class _CopyingBecome(Transform):
+    """`Become` as it was before it reused the Transform's target: one extra deep copy up front."""
+    def __init__(self, mobject, target_mobject, **kwargs):
+        self.extra_target_copy = target_mobject.copy()
+        super().__init__(mobject, target_mobject, **kwargs)
+
+    def finish(self) -> None:
+        super().finish()
+        self.mobject.__dict__.update(self.target_copy.__dict__)
+
+@benchmark
+def bench_become_memory():
+    psi = PsiCreature(body_scale=2.0)
+    for label, become_class in (("before", _CopyingBecome), ("after", Become)):
+        def mouth_become():
+            target = psi.mouth.copy()
+            run_animation(become_class(psi.mouth, target))
+        report(f"Become mouth ({label})", *measure(mouth_become))
+
+        def creature_become():
+            target = PsiCreature(body_scale=psi.body_scale)
+            run_animation(become_class(psi, target))
+        report(f"Become whole creature ({label})", *measure(creature_become))
+
+def retained_bytes(build, count: int = 20) -> float:
+    """Average bytes still allocated per object after building `count` objects with `build`."""
+    build()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    kept = [build() for _ in range(count)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return (after - before) / count
+
+@benchmark
+def bench_footprint():
+    psi = PsiCreature()
+    for state in psi.state_paths:
+        psi._ensure_state(state)
+    templates = dict(psi.templates)
+    for body_scale in (0.5, 2.0):
+        report_bytes(f"bytes per PsiCreature(body_scale={body_scale})", retained_bytes(lambda: PsiCreature(body_scale=body_scale)))
+    report_bytes("bytes per copy (shared assets)", retained_bytes(psi.copy))
+    # What each copy used to duplicate on top
+    report_bytes("bytes per copy of the templates (no longer made)", retained_bytes(lambda: copy.deepcopy(templates)))
+    report("PsiCreature.copy()", *measure(psi.copy))
+    report("PsiCreature.copy() + templates (before)", *measure(lambda: (psi.copy(), copy.deepcopy(templates))))
+
+def _crowd_anchors(n: int) -> np.ndarray:
+    anchors = np.random.default_rng(0).uniform(-6, 6, (n, 3))
+    anchors[:, 2] = 0
+    return anchors
+
+@benchmark
+def bench_crowd():
+    for n in (10, 100, 1000):
+        anchors = _crowd_anchors(n)
+        report(f"crowd build (N={n})", *measure(lambda: CreatureCrowd(anchors, body_scale=0.5), repeat=3))
+        crowd = CreatureCrowd(anchors, body_scale=0.5)
+        animation = crowd.change_state("pondering", look_at_target=ORIGIN, change_mouth_to="happy")
+        animation.begin()
+        report(f"crowd frame (N={n})", *measure(lambda: animation.interpolate(0.5)))
+
+    # Individual creatures, for comparison
+    for n in (10, 100):
+        anchors = _crowd_anchors(n)
+        report(f"individual build (N={n})", *measure(lambda: [PsiCreature(initial_anchor_pos=a, body_scale=0.5) for a in anchors], repeat=1))
+        creatures = [PsiCreature(initial_anchor_pos=a, body_scale=0.5) for a in anchors]
+        group = AnimationGroup(*(psi.change_state("pondering", look_at_target=ORIGIN, change_mouth_to="happy") for psi in creatures))
+        group.begin()
+        report(f"individual frame (N={n})", *measure(lambda: group.interpolate(0.5)))
+
+@benchmark
+def bench_idle():
+    psi = PsiCreature().start_idle(seed=0)
+    report("idle frame (1 PsiCreature)", *measure(lambda: psi.update(1 / 60)))
+    for n in (100, 1000):
+        crowd = CreatureCrowd(_crowd_anchors(n), body_scale=0.5).start_idle(seed=0)
+        report(f"idle frame (crowd N={n})", *measure(lambda: crowd.update(1 / 60)))
+
+@benchmark
+def bench_culling():
+    # A row of creatures, most of them outside the frame
+    creatures = [PsiCreature(initial_anchor_pos=[x, -2, 0], body_scale=1.0) for x in range(-40, 41, 4)]
+    for label, wrap in (("", lambda animation: animation), (", culled", Culled)):
+        group = AnimationGroup(*(wrap(psi.change_state("pondering", look_at_target=ORIGIN, squint_amount=0.3)) for psi in creatures))
+        group.begin()
+        alphas = iter(np.tile(np.linspace(0.1, 0.9, 9), 100))
+        report(f"frame: {len(creatures)} creatures, most offscreen{label}", *measure(lambda: group.interpolate(next(alphas))))
+        group.finish()
+    for camera_class in (Camera, CullingCamera):
+        camera = camera_class()
+        report(f"{camera_class.__name__}.get_mobjects_to_display ({len(creatures)} creatures)", *measure(
+            lambda: camera.get_mobjects_to_display(creatures)
+        ))
+
+@benchmark
+def bench_gaze_tracking():
+    target = Dot(RIGHT * 3)
+    psi = PsiCreature().track(target, smoothing=0.1)
+    report("gaze tracking frame (1 PsiCreature)", *measure(lambda: psi.update(1 / 60)))
+    for n in (100, 1000):
+        crowd = CreatureCrowd(_crowd_anchors(n), body_scale=0.5).track(target, smoothing=0.1)
+        report(f"gaze tracking frame (crowd N={n})", *measure(lambda: crowd.update(1 / 60)))
+
+@benchmark
+def bench_lip_sync():
+    minutes, rate = 2, 44100
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "voice.wav")
+        rng = np.random.default_rng(0)
+        with wave.open(path, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(rate)
+            for _ in range(minutes * 60):
+                # One second of syllable-like bursts of noise
+                burst = rng.normal(0, 0.2, rate) * (np.sin(np.linspace(0, 8 * PI, rate)) > 0)
+                wav.writeframes((burst * 32767).clip(-32768, 32767).astype("<i2").tobytes())
+        report(f"lip-sync track ({minutes} min WAV, 60 fps)", *measure(lambda: LipSyncTrack.from_wav(path, frame_rate=60), repeat=1))
+        psi = PsiCreature()
+        lip_sync(psi, path, frame_rate=60)
+        report("lip-sync frame", *measure(lambda: psi.update(1 / 60)))
+
+@benchmark
+def bench_play_hash():
+    if not psi_creature.FINGERPRINT_HASHING:
+        # Nothing to compare: this manim version hashes creatures its own way
+        return
+    scene = Scene()
+    # Newer manim versions also key the hash on the backend and encoder settings
+    parameters = inspect.signature(manim_hashing.get_hash_from_play_call).parameters
+    cache_identity = {"backend": "cairo", "encoder_fingerprint": "benchmark", "renderer_state": None}
+    cache_identity = {key: value for key, value in cache_identity.items() if key in parameters}
+    psi = PsiCreature()
+    # A creature that has loaded every state, as one does late in a long scene
+    for state in psi.state_paths:
+        psi.change_state(state)
+    psi.change_state("default")
+    plays = {
+        "change_state": lambda: psi.change_state("pondering", look_at_target=ORIGIN, change_mouth_to="happy"),
+        "look_at": lambda: psi.look_at(UP),
+    }
+    fingerprint_default = manim_hashing._CustomEncoder.default
+    for label, default in (("manim", psi_creature._hash_by_fingerprint.manim_default), ("fingerprint", fingerprint_default)):
+        manim_hashing._CustomEncoder.default = default
+        try:
+            for name, build in plays.items():
+                animation = build()
+                hash_play = lambda: manim_hashing.get_hash_from_play_call(scene, scene.renderer.camera, [animation], [psi], **cache_identity)
+                report(f"hash play({name}) ({label})", *measure(hash_play))
+        finally:
+            manim_hashing._CustomEncoder.default = fingerprint_default
+
+# ====================================================================
+#  Results and baseline comparison
+# ====================================================================
+METRICS = ("seconds", "peak_bytes", "retained_bytes")
+CALIBRATION = "calibration (fixed numpy workload)"
+# Timings this close are within the noise of microsecond benchmarks
+MIN_SECONDS_INCREASE = 50e-6
+
+def compare(results: list, baseline: list, tolerance: float) -> list:
+    """
+    Compares results with a baseline, metric by metric.
+
+    When both runs include the `CALIBRATION` entry, baseline timings are
+    first rescaled by the ratio of the two calibrations, i.e. to what they
+    would have been on the machine (and under the load) of `results`.
+
+    Args:
+        results: Entries as collected in `RESULTS`.
+        baseline: Entries of an earlier run.
+        tolerance: The allowed relative increase (0.25 allows 25% slower or bigger).
+
+    Returns:
+        list: (name, metric, baseline value, new value) for every regression,
+              with baseline timings rescaled.
+    """
+    previous = {entry["name"]: entry for entry in baseline}
+    current = {entry["name"]: entry for entry in results}
+    speed = 1.0
+    if CALIBRATION in previous and CALIBRATION in current:
+        speed = current[CALIBRATION]["seconds"] / previous[CALIBRATION]["seconds"]
+    regressions = []
+    for entry in results:
+        if entry["name"] == CALIBRATION:
+            continue
+        old = previous.get(entry["name"], {})
+        for metric in METRICS:
+            if metric in entry and old.get(metric):
+                old_value = old[metric] * speed if metric == "seconds" else old[metric]
+                if metric == "seconds" and entry[metric] - old_value < MIN_SECONDS_INCREASE:
+                    continue
+                if entry[metric] > old_value * (1 + tolerance):
+                    regressions.append((entry["name"], metric, old_value, entry[metric]))
+    return regressions
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark psi_creature.py headless.")
+    parser.add_argument("patterns", nargs="*", help="Only run benchmarks whose name contains one of these.")
+    parser.add_argument("--json", help="Save the results to this file.")
+    parser.add_argument("--compare", action="store_true", help="Compare with the baseline; exit 1 on regressions.")
+    parser.add_argument("--update-baseline", action="store_true", help="Save the results as the new baseline.")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help=f"The baseline file (default: {BASELINE_PATH}).")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative increase (default: 0.25).")
+    arguments = parser.parse_args(argv[1:])
+
+    # Calibrated before and after, keeping the faster, like every other timing here
+    calibration = calibrate()
+    with tempconfig({"quality": "low_quality", "dry_run": True, "verbosity": "WARNING"}):
+        for name, func in BENCHMARKS.items():
+            if not arguments.patterns or any(pattern in name for pattern in arguments.patterns):
+                func()
+    report(CALIBRATION, *min(calibration, calibrate()))
+
+    document = {"python": sys.version.split()[0], "manim": manim.__version__, "results": RESULTS}
+    for path in filter(None, (arguments.json, arguments.update_baseline and arguments.baseline)):
+        with open(path, "w") as f:
+            json.dump(document, f, indent=2)
+        print(f"Saved {len(RESULTS)} results to {path}")
+    if not arguments.compare:
+        return 0
+
+    with open(arguments.baseline) as f:
+        regressions = compare(RESULTS, json.load(f)["results"], arguments.tolerance)
+    for name, metric, old, new in regressions:
+        print(f"REGRESSION {name} [{metric}]: {old:.6g} -> {new:.6g} ({new / old - 1:+.0%})")
+    print(f"{len(regressions)} regression(s) beyond {arguments.tolerance:.0%}")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
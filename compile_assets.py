@@ -0,0 +1,13 @@
+# Compiles assets/*.svg into the binary bundle PsiCreature loads instead of
+# parsing the SVGs. Rerun after editing an asset; stale entries are ignored
+# until then. From the repository root:
+#   python compile_assets.py                # writes assets/compiled/
+#   python compile_assets.py my_assets      # writes my_assets/compiled/
+
+import sys
+
+from psi_creature import compile_asset_bundle
+
+if __name__ == "__main__":
+    bundle_dir = compile_asset_bundle(*sys.argv[1:2])
+    print(f"Wrote {bundle_dir}")
@@ -0,0 +1,178 @@
+# Offscreen culling for creature scenes.
+#
+#   class Parade(CullingScene):
+#       def construct(self):
+#           creatures = [PsiCreature(initial_anchor_pos=[x, -2, 0], body_scale=1) for x in range(-20, 21, 2)]
+#           self.add(*creatures)
+#           self.play(*(psi.change_state("pondering") for psi in creatures))
+#
+# A CullingScene renders through a CullingCamera, which leaves every
+# mobject whose bounding box lies outside the camera frame out of the render
+# pass, and plays Transform-style animations (every PsiCreature animation)
+# through `Culled`, which skips their per-frame interpolation for as long as
+# everything they can sweep over lies offscreen. Skipped animations jump
+# straight to the right frame when they come into view, and always end in
+# their exact end state. Updaters are not culled.
+
+from manim import *
+from psi_creature import AnchoredResize, BlendWeights, CreatureTransform
+
+# Extra room, in scene units, around a bounding box before it counts as offscreen (strokes, antialiasing)
+CULLING_MARGIN = 0.1
+
+# Samples of a rate function taken to find its extremes
+RATE_SAMPLES = 65
+
+def get_bounding_box(mobject: Mobject) -> np.ndarray | None:
+    """
+    Returns:
+        np.ndarray: (2, 3) minimum and maximum corners of the points of
+            `mobject` and its family, or None if it has no points.
+    """
+    members = [member.points for member in mobject.get_family() if len(member.points)]
+    if not members:
+        return None
+    return np.array([
+        np.min([points.min(axis=0) for points in members], axis=0),
+        np.max([points.max(axis=0) for points in members], axis=0),
+    ])
+
+def get_frame_box(frame: Mobject = None) -> np.ndarray:
+    """The (2, 3) box of the camera frame: `frame` (a MovingCamera's `frame`, say) or the configured frame about the origin."""
+    if frame is not None:
+        return np.array([frame.get_corner(DL), frame.get_corner(UR)])
+    half = np.array([config.frame_width / 2, config.frame_height / 2, 0])
+    return np.array([-half, half])
+
+def boxes_overlap(box: np.ndarray, other: np.ndarray, margin: float = CULLING_MARGIN) -> bool:
+    """Whether two (2, 3) boxes overlap in x and y, after growing the first by `margin`."""
+    return bool(np.all(box[0, :2] - margin <= other[1, :2]) and np.all(box[1, :2] + margin >= other[0, :2]))
+
+# ====================================================================
+#  Render Pass
+# ====================================================================
+class CullingCamera(Camera):
+    """
+    A `Camera` that draws only the mobjects whose bounding box overlaps its
+    frame. The frame is read from `frame_center`, `frame_width` and
+    `frame_height`, so combined with `MovingCamera` it follows the moving frame.
+    """
+    def __init__(self, *args, culling_margin: float = CULLING_MARGIN, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.culling_margin = culling_margin
+        # How many mobjects the last capture left out
+        self.num_culled = 0
+
+    def get_frame_box(self) -> np.ndarray:
+        half = np.array([self.frame_width / 2, self.frame_height / 2, 0])
+        center = np.asarray(self.frame_center, dtype=float)
+        return np.array([center - half, center + half])
+
+    def get_mobjects_to_display(self, *args, **kwargs) -> list:
+        mobjects = super().get_mobjects_to_display(*args, **kwargs)
+        with_points = [mobject for mobject in mobjects if len(mobject.points)]
+        if not with_points:
+            self.num_culled = 0
+            return mobjects
+        # Every bounding box at once: one reduction per segment of the concatenated points
+        points = np.concatenate([mobject.points[:, :2] for mobject in with_points])
+        starts = np.cumsum([0] + [len(mobject.points) for mobject in with_points[:-1]])
+        lows, highs = np.minimum.reduceat(points, starts), np.maximum.reduceat(points, starts)
+        frame_box = self.get_frame_box()
+        margin = self.culling_margin
+        visible = np.all((lows - margin <= frame_box[1, :2]) & (highs + margin >= frame_box[0, :2]), axis=1)
+        culled = {id(mobject) for mobject, shown in zip(with_points, visible) if not shown}
+        self.num_culled = len(culled)
+        return [mobject for mobject in mobjects if id(mobject) not in culled]
+
+# ====================================================================
+#  Animations
+# ====================================================================
+# Animations that move every point along a straight line from its start to its
+# end (with the rate function's progress), so their start and end states bound
+# every frame. Transforms along an arc do not qualify; see `is_cullable`.
+CULLABLE_ANIMATIONS = (Transform, AnchoredResize, BlendWeights, CreatureTransform)
+
+def is_cullable(animation: Animation) -> bool:
+    return isinstance(animation, CULLABLE_ANIMATIONS) and not getattr(animation, "path_arc", 0)
+
+class Culled(Animation):
+    """
+    Plays `animation`, skipping its per-frame interpolation while its swept
+    box (everything it can cover between the extremes of its rate function)
+    lies outside the camera frame. Only meant for `is_cullable` animations.
+    """
+    def __init__(self, animation: Animation, frame: Mobject = None, margin: float = CULLING_MARGIN):
+        """
+        Args:
+            animation: The animation to play.
+            frame (optional): The camera frame mobject, for a moving camera
+                (default: the configured frame about the origin).
+            margin (optional): Extra room around the swept box, in scene units.
+        """
+        self.animation = animation
+        self.frame, self.margin = frame, margin
+        self.swept_box = None
+        # Frames skipped since `begin`
+        self.num_skipped = 0
+        super().__init__(
+            animation.mobject, run_time=animation.run_time, rate_func=linear,
+            introducer=animation.is_introducer(), remover=animation.is_remover(), suspend_mobject_updating=False,
+        )
+
+    def begin(self) -> None:
+        self.animation.begin()
+        self.swept_box = self.get_swept_box()
+        self.num_skipped = 0
+
+    def get_swept_box(self) -> np.ndarray | None:
+        """The box bounding the animation's every frame: its states at the lowest and highest progress."""
+        alphas = np.linspace(0, 1, RATE_SAMPLES)
+        progress = [self.animation.rate_func(alpha) for alpha in alphas]
+        boxes = []
+        for alpha in (alphas[np.argmin(progress)], alphas[np.argmax(progress)]):
+            self.animation.interpolate(alpha)
+            boxes.append(get_bounding_box(self.animation.mobject))
+        # Back to the first frame, as `begin` leaves it
+        self.animation.interpolate(0)
+        if any(box is None for box in boxes):
+            return None
+        return np.array([np.minimum(*(box[0] for box in boxes)), np.maximum(*(box[1] for box in boxes))])
+
+    def is_offscreen(self) -> bool:
+        return self.swept_box is not None and not boxes_overlap(self.swept_box, get_frame_box(self.frame), self.margin)
+
+    def interpolate(self, alpha: float) -> None:
+        if self.is_offscreen():
+            self.num_skipped += 1
+        else:
+            self.animation.interpolate(alpha)
+
+    def update_mobjects(self, dt: float) -> None: self.animation.update_mobjects(dt)
+    def finish(self) -> None: self.animation.finish()
+    def clean_up_from_scene(self, scene: Scene) -> None: self.animation.clean_up_from_scene(scene)
+    def _setup_scene(self, scene: Scene) -> None: self.animation._setup_scene(scene)
+
+def cull(animation: Animation, frame: Mobject = None) -> Animation:
+    """
+    Wraps `animation` in `Culled` if it is cullable, or each cullable
+    animation within it if it is an `AnimationGroup`; returns anything else
+    unchanged.
+    """
+    if isinstance(animation, AnimationGroup):
+        animation.animations = [cull(child, frame) for child in animation.animations]
+        animation.build_animations_with_timings()
+        return animation
+    return Culled(animation, frame) if is_cullable(animation) else animation
+
+class CullingScene(Scene):
+    """A `Scene` that renders through a `CullingCamera` and plays every animation through `cull`."""
+    def __init__(self, **kwargs):
+        kwargs.setdefault("camera_class", CullingCamera)
+        super().__init__(**kwargs)
+
+    def play(self, *args, subcaption=None, subcaption_duration=None, subcaption_offset=0, **kwargs) -> None:
+        # Play options apply to the animations themselves, as in `Scene.play`, before wrapping them
+        frame = getattr(self.camera, "frame", None)
+        animations = [cull(animation, frame) for animation in self.compile_animations(*args, **kwargs)]
+        super().play(*animations, subcaption=subcaption, subcaption_duration=subcaption_duration, subcaption_offset=subcaption_offset)
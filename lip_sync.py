@@ -0,0 +1,219 @@
+# Lip-sync for PsiCreature from local WAV files.
+#
+#   class Talk(Scene):
+#       def construct(self):
+#           psi = PsiCreature()
+#           self.add(psi)
+#           self.add_sound("voice.wav")
+#           lip_sync(psi, "voice.wav", scene=self)
+#           self.wait(LipSyncTrack.get_duration("voice.wav"))
+#
+# The WAV is streamed in blocks and reduced to one amplitude (and optionally
+# a few band energies) per video frame, so tens of minutes of audio cost a few
+# hundred KiB. A single updater then reshapes the existing mouth curve every
+# frame: no animations, no copies. Other animations keep working; while one
+# animates the mouth (a change_mouth, say), lip-sync pauses and then continues
+# from the new expression. Given the scene, the updater reads the time off its
+# renderer, so it stays in step with the audio through such pauses.
+
+import wave
+
+from manim import *
+from psi_creature import Mouth
+
+# Frequency bands (Hz) compared to round or widen the mouth: low energy reads as "oo", high as "ee"
+DEFAULT_BANDS = ((80, 500), (500, 2000), (2000, 6000))
+
+# Mouth shapes, as (start, handle1, handle2, end) offsets in units of `Mouth.emotion_intensity`
+OPEN_OFFSETS = np.array([[0, 0.2, 0], [0, -1.6, 0], [0, -1.6, 0], [0, 0.2, 0]], dtype=float)
+ROUND_OFFSETS = np.array([[0.35, 0, 0], [0.15, -0.4, 0], [-0.15, -0.4, 0], [-0.35, 0, 0]], dtype=float)
+WIDE_OFFSETS = np.array([[-0.3, 0, 0], [-0.1, 0.3, 0], [0.1, 0.3, 0], [0.3, 0, 0]], dtype=float)
+
+def _decode_samples(data: bytes, sample_width: int, channels: int) -> np.ndarray:
+    """PCM frames -> mono float samples in [-1, 1]."""
+    if sample_width == 1:
+        samples = (np.frombuffer(data, dtype=np.uint8).astype(np.float32) - 128) / 128
+    elif sample_width == 2:
+        samples = np.frombuffer(data, dtype="<i2").astype(np.float32) / 2 ** 15
+    elif sample_width == 3:
+        raw = np.frombuffer(data, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+        values = raw[:, 0] | (raw[:, 1] << 8) | (raw[:, 2] << 16)
+        samples = (np.where(values >= 2 ** 23, values - 2 ** 24, values)).astype(np.float32) / 2 ** 23
+    elif sample_width == 4:
+        samples = np.frombuffer(data, dtype="<i4").astype(np.float32) / 2 ** 31
+    else:
+        raise ValueError(f"Unsupported WAV sample width: {sample_width} bytes.")
+    return samples.reshape(-1, channels).mean(axis=1)
+
+class LipSyncTrack:
+    """
+    Per-video-frame mouth openness and brightness (high minus low band
+    energy share) of a WAV file.
+    """
+    def __init__(self, openness: np.ndarray, brightness: np.ndarray, frame_rate: float):
+        """
+        Args:
+            openness: (frames,) mouth openness, 0 (closed) to 1.
+            brightness: (frames,) -1 (all energy in the lowest band) to 1 (all in the highest).
+            frame_rate: Video frames per second.
+        """
+        self.openness, self.brightness, self.frame_rate = openness, brightness, frame_rate
+
+    @staticmethod
+    def get_duration(wav_path: str) -> float:
+        with wave.open(wav_path, "rb") as wav:
+            return wav.getnframes() / wav.getframerate()
+
+    @classmethod
+    def from_wav(
+        cls,
+        wav_path: str,
+        frame_rate: float = None,
+        bands: tuple = DEFAULT_BANDS,
+        gate: float = 0.05,
+        reference_percentile: float = 95,
+        block_seconds: float = 10.0,
+    ) -> "LipSyncTrack":
+        """
+        Streams `wav_path` and analyses it one video frame at a time.
+
+        Args:
+            wav_path: A PCM WAV file (8, 16, 24 or 32 bit, any number of channels).
+            frame_rate (optional): Video frames per second (default: the current manim config's).
+            bands (optional): (low, high) Hz bands for the brightness; None or () leaves it at 0.
+            gate (optional): Openness below this fraction of the reference level counts as silence.
+            reference_percentile (optional): The loudness percentile that opens the mouth fully.
+            block_seconds (optional): Seconds of audio read and analysed at a time.
+
+        Returns:
+            LipSyncTrack: The analysed track.
+        """
+        frame_rate = frame_rate or config.frame_rate
+        envelope, energies = cls.analyse(wav_path, frame_rate, bands, block_seconds)
+        reference = np.percentile(envelope, reference_percentile) if len(envelope) else 0
+        if reference > 0:
+            openness = np.clip((envelope / reference - gate) / (1 - gate), 0, 1)
+        else:
+            openness = np.zeros_like(envelope)
+        brightness = np.zeros_like(envelope)
+        if energies.shape[1] > 1:
+            totals = energies.sum(axis=1)
+            shares = np.divide(energies, totals[:, None], out=np.zeros_like(energies), where=totals[:, None] > 0)
+            brightness = shares[:, -1] - shares[:, 0]
+        return cls(openness, brightness, frame_rate)
+
+    @staticmethod
+    def analyse(wav_path: str, frame_rate: float, bands: tuple = DEFAULT_BANDS, block_seconds: float = 10.0) -> tuple:
+        """
+        The RMS amplitude and band energies of every video frame's worth of
+        audio, reading at most about `block_seconds` of samples at a time.
+
+        Returns:
+            tuple: (envelope (frames,), energies (frames, len(bands)))
+        """
+        bands = bands or ()
+        with wave.open(wav_path, "rb") as wav:
+            sample_rate, channels, sample_width = wav.getframerate(), wav.getnchannels(), wav.getsampwidth()
+            total_samples = wav.getnframes()
+            window = max(1, int(round(sample_rate / frame_rate)))
+            num_frames = int(np.ceil(total_samples * frame_rate / sample_rate))
+            starts = (np.arange(num_frames) * sample_rate / frame_rate).astype(np.int64)
+            envelope = np.zeros(num_frames)
+            energies = np.zeros((num_frames, len(bands)))
+            if bands:
+                frequencies = np.fft.rfftfreq(window, 1 / sample_rate)
+                masks = np.array([(frequencies >= low) & (frequencies < high) for low, high in bands], dtype=float)
+                taper = np.hanning(window).astype(np.float32)
+
+            block = max(window, int(block_seconds * sample_rate))
+            buffer, buffer_start, frame = np.zeros(0, dtype=np.float32), 0, 0
+            while frame < num_frames:
+                samples = _decode_samples(wav.readframes(block), sample_width, channels)
+                if len(samples) == 0:
+                    # The last windows run past the end of the file; pad them with silence
+                    samples = np.zeros(window, dtype=np.float32)
+                buffer = np.concatenate([buffer, samples])
+                # Every frame whose whole window is buffered, at once
+                last = int(np.searchsorted(starts + window, buffer_start + len(buffer), side="right"))
+                offsets = starts[frame:last] - buffer_start
+                windows = buffer[offsets[:, None] + np.arange(window)]
+                envelope[frame:last] = np.sqrt(np.mean(windows.astype(float) ** 2, axis=1))
+                if bands:
+                    power = np.abs(np.fft.rfft(windows * taper, axis=1)) ** 2
+                    energies[frame:last] = power @ masks.T
+                frame = last
+                # Keep what the next frames need; the next window may start past the buffered samples
+                consumed = min(starts[frame] - buffer_start, len(buffer)) if frame < num_frames else len(buffer)
+                buffer, buffer_start = buffer[consumed:], buffer_start + consumed
+        return envelope, energies
+
+    def evaluate(self, t: float) -> tuple:
+        """
+        Returns:
+            tuple: (openness, brightness) of the video frame at `t` seconds; (0, 0) outside the track.
+        """
+        frame = int(np.floor(t * self.frame_rate + 1e-6))
+        if 0 <= frame < len(self.openness):
+            return float(self.openness[frame]), float(self.brightness[frame])
+        return 0.0, 0.0
+
+class LipSync:
+    """
+    The single updater behind `lip_sync`: reshapes a `Mouth` to the track's
+    pose at the current time. Once `follow_scene` is called that is read off
+    the scene's renderer; otherwise the updater advances its own clock by
+    the dt it is given, which stops while manim suspends it (during any
+    animation of the mouth).
+    """
+    def __init__(self, track: LipSyncTrack, delay: float = 0.0):
+        """
+        Args:
+            track: The analysed audio.
+            delay (optional): Seconds from attaching the updater to the start of the audio.
+        """
+        self.track = track
+        self.time = -delay
+        self.renderer = None
+
+    def follow_scene(self, scene: Scene) -> 'LipSync':
+        """Keeps time with `scene`, from now on: the time of the frame being rendered, as the audio sees it."""
+        self.renderer = scene.renderer
+        self.time -= self.renderer.time
+        return self
+
+    def get_time(self) -> float:
+        """Seconds since the start of the audio."""
+        return self.time if self.renderer is None else self.time + self.renderer.time
+
+    def __call__(self, mouth: Mouth, dt: float) -> None:
+        if self.renderer is None:
+            self.time += dt
+        openness, brightness = self.track.evaluate(self.get_time())
+        mouth.set_control_offsets(openness * (
+            OPEN_OFFSETS + max(-brightness, 0) * ROUND_OFFSETS + max(brightness, 0) * WIDE_OFFSETS
+        ))
+
+def lip_sync(creature, wav_path: str, delay: float = 0.0, scene: Scene = None, **track_kwargs) -> LipSync:
+    """
+    Makes `creature` (a `PsiCreature`, or any object with a `mouth`) mouth
+    along to `wav_path`. The sound itself is added separately, e.g. with
+    `scene.add_sound(wav_path)` at the same moment.
+
+    Args:
+        creature: The speaker.
+        wav_path: A PCM WAV file.
+        delay (optional): Seconds until the audio starts.
+        scene (optional): The scene playing the audio. Its clock drives the
+            lip-sync, so it stays in step through animations of the mouth.
+            Without it, the mouth's own updater keeps time and falls behind
+            by the length of every such animation.
+        **track_kwargs: Options of `LipSyncTrack.from_wav` (frame_rate, bands, gate, ...).
+
+    Returns:
+        LipSync: The updater added to `creature.mouth`; remove it with `creature.mouth.remove_updater`.
+    """
+    updater = LipSync(LipSyncTrack.from_wav(wav_path, **track_kwargs), delay)
+    if scene is not None:
+        updater.follow_scene(scene)
+    creature.mouth.add_updater(updater)
+    return updater
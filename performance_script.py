@@ -0,0 +1,421 @@
+# Declarative performance scripts for PsiCreature.
+# A script describes creatures and a timeline of their actions as data, so
+# scene variants can be generated without writing Python. Render one scene per
+# script file from the repository root:
+#   python performance_script.py scripts/*.json              # 480p15 previews
+#   python performance_script.py -q high_quality intro.yaml  # YAML needs PyYAML
+#
+# Script format (JSON shown; YAML is the same structure):
+# {
+#   "scene": {"name": "Intro", "background_color": "#222222", "duration": 8},
+#   "creatures": {
+#     "psi": {"anchor": [-4, 0, 0], "body_scale": 3.0, "eye_color": "BLUE_C", "idle_seed": 1},
+#     "bob": {"anchor": [4, 0, 0], "initial_state": "pondering"}
+#   },
+#   "timeline": [
+#     {"at": 0, "creature": "psi", "action": "fade_in"},
+#     {"at": 1, "creature": "psi", "action": "change_state", "state": "hand_up", "duration": 1.5},
+#     {"at": 1, "creature": "psi", "action": "change_mouth", "emotion": "happy"},
+#     {"at": 1.5, "creature": "bob", "action": "look_at", "target": "psi"},
+#     {"at": 3, "creature": "psi", "action": "move_anchor_to", "position": [0, -1, 0], "duration": 2}
+#   ]
+# }
+#
+# Overlapping actions are played together in one `play` call, and the gaps
+# between them become waits. Overlapping face actions of one creature
+# (change_state, change_mouth, look_at, squint, ...) are merged into a single
+# `change_state` call, which already keeps them from conflicting; each part of
+# it still plays at its own action's times. An overlapping move_anchor_to and
+# resize of one creature become one resize that ends at the new anchor.
+
+import argparse
+import json
+import os
+
+import manim
+from manim import *
+from psi_creature import PsiCreature
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+DEFAULT_DURATION = 1.0
+
+# Options of `change_state` that a "change_state" action may pass through
+_CHANGE_STATE_OPTIONS = {
+    "look_at_target", "look_straight", "change_mouth_to", "squint_amount",
+    "reset_squint", "bend_direction", "bend_intensity", "reset_sclera",
+}
+# Face actions that `change_state` can combine, and how each maps to its arguments
+CHANGE_STATE_ARGUMENTS = {
+    "change_state": lambda action: dict(
+        {"new_state_name": action["state"]},
+        **{key: value for key, value in action.items() if key in _CHANGE_STATE_OPTIONS},
+    ),
+    "change_mouth": lambda action: {"change_mouth_to": action["emotion"]},
+    "look_at": lambda action: {"look_at_target": action["target"]},
+    "look_straight": lambda action: {"look_straight": True},
+    "squint": lambda action: {"squint_amount": action["amount"]},
+    "reset_squint": lambda action: {"reset_squint": True},
+    "bend_sclera": lambda action: {"bend_direction": action["direction"], "bend_intensity": action.get("intensity", 0.4)},
+    "reset_sclera": lambda action: {"reset_sclera": True},
+}
+# Fields each action must have, besides "creature" and "action"
+REQUIRED_FIELDS = {
+    "change_state": ("state",),
+    "change_mouth": ("emotion",),
+    "look_at": ("target",),
+    "squint": ("amount",),
+    "bend_sclera": ("direction",),
+    "move_anchor_to": ("position",),
+    "resize": ("factor",),
+}
+# Actions that animate the creature as a whole and cannot be merged
+BODY_ACTIONS = {"move_anchor_to", "resize", "blink", "fade_in", "fade_out"}
+# Body actions that are merged into one animation when they overlap (as in TestSimplerResize)
+COMPATIBLE_ACTIONS = {frozenset({"move_anchor_to", "resize"})}
+
+# ====================================================================
+#  Loading
+# ====================================================================
+def load_script(path: str) -> dict:
+    """Loads and validates a JSON or YAML script file."""
+    with open(path) as f:
+        if path.endswith((".yaml", ".yml")):
+            if yaml is None:
+                raise ImportError(f"Reading '{path}' requires PyYAML (pip install pyyaml).")
+            script = yaml.safe_load(f)
+        else:
+            script = json.load(f)
+    script.setdefault("scene", {}).setdefault("name", _scene_name(path))
+    validate_script(script)
+    return script
+
+def _scene_name(path: str) -> str:
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return "".join(part.capitalize() for part in stem.replace("-", "_").split("_")) or "Performance"
+
+def validate_script(script: dict) -> None:
+    creatures = script.get("creatures", {})
+    for i, action in enumerate(script.get("timeline", [])):
+        name = action.get("action")
+        if name not in CHANGE_STATE_ARGUMENTS and name not in BODY_ACTIONS:
+            raise ValueError(f"Timeline entry {i}: unknown action '{name}'.")
+        if action.get("creature") not in creatures:
+            raise ValueError(f"Timeline entry {i}: unknown creature '{action.get('creature')}'.")
+        missing = [field for field in REQUIRED_FIELDS.get(name, ()) if field not in action]
+        if missing:
+            raise ValueError(f"Timeline entry {i}: '{name}' is missing {', '.join(repr(field) for field in missing)}.")
+        if action.get("duration", DEFAULT_DURATION) < 0 or action.get("at", 0) < 0:
+            raise ValueError(f"Timeline entry {i}: 'at' and 'duration' must not be negative.")
+
+# ====================================================================
+#  Compiling
+# ====================================================================
+def compile_script(script: dict) -> list:
+    """
+    Compiles the timeline into play segments: maximal groups of actions whose
+    time windows overlap. Within a segment, overlapping face actions of one
+    creature are merged into one `change_state` call, and an overlapping
+    move_anchor_to and resize into one resize.
+
+    Returns:
+        list: One dict per segment, {"start", "end", "calls"}, where each call is
+            {"creature", "start", "end", "actions"} and becomes one animation.
+
+    Raises:
+        ValueError: If actions of one creature overlap in a way `change_state` cannot merge.
+    """
+    actions = sorted(
+        (dict(action, start=action.get("at", 0.0), end=action.get("at", 0.0) + action.get("duration", DEFAULT_DURATION))
+         for action in script.get("timeline", [])),
+        key=lambda action: action["start"],
+    )
+    segments = []
+    for action in actions:
+        if segments and action["start"] < segments[-1]["end"]:
+            segments[-1]["actions"].append(action)
+            segments[-1]["end"] = max(segments[-1]["end"], action["end"])
+        else:
+            segments.append({"start": action["start"], "end": action["end"], "actions": [action]})
+    for segment in segments:
+        segment["calls"] = _merge_calls(segment.pop("actions"))
+    return segments
+
+def _is_face_call(call: dict) -> bool:
+    return all(action["action"] in CHANGE_STATE_ARGUMENTS for action in call["actions"])
+
+def _overlap(call: dict, other: dict) -> bool:
+    return call["start"] < other["end"] and other["start"] < call["end"]
+
+def _action_names(*calls) -> frozenset:
+    return frozenset(action["action"] for call in calls for action in call["actions"])
+
+def _can_merge(call: dict, other: dict) -> bool:
+    return (_is_face_call(call) and _is_face_call(other)) or _action_names(call, other) in COMPATIBLE_ACTIONS
+
+def _merge_calls(actions: list) -> list:
+    calls = [
+        {"creature": action["creature"], "start": action["start"], "end": action["end"], "actions": [action]}
+        for action in actions
+    ]
+    # Merge overlapping face calls (or compatible body calls) of the same creature
+    # until none are left, each merged call spanning the union of its actions' windows
+    merged = True
+    while merged:
+        merged = False
+        for call in calls:
+            for other in calls:
+                if (other is not call and other["creature"] == call["creature"] and _overlap(call, other)
+                        and _can_merge(call, other)):
+                    call["actions"] += other["actions"]
+                    call["start"], call["end"] = min(call["start"], other["start"]), max(call["end"], other["end"])
+                    calls.remove(other)
+                    merged = True
+                    break
+            if merged:
+                break
+
+    for i, call in enumerate(calls):
+        for other in calls[i + 1:]:
+            if call["creature"] != other["creature"] or not _overlap(call, other):
+                continue
+            raise ValueError(
+                f"Overlapping actions {sorted(_action_names(call, other))} of '{call['creature']}' "
+                f"at t={other['start']:g}s cannot be played together."
+            )
+    return calls
+
+# ====================================================================
+#  Performing
+# ====================================================================
+def _resolve(value, creatures: dict):
+    """Turns script values into manim values: creature names, color names and point lists."""
+    if isinstance(value, str):
+        if value in creatures:
+            return creatures[value]
+        # Upper-case names are manim constants (BLUE_C, LEFT, ...)
+        constant = getattr(manim, value, None) if value.isupper() else None
+        return constant if constant is not None else value
+    if isinstance(value, list) and value and all(isinstance(x, (int, float)) for x in value):
+        return np.array(value, dtype=float)
+    return value
+
+def build_creatures(script: dict, frame: Mobject = None) -> dict:
+    """The script's creatures by name, with their level of detail picked for the camera `frame`."""
+    creatures = {}
+    for name, spec in script.get("creatures", {}).items():
+        spec = dict(spec)
+        anchor = np.array(spec.pop("anchor", [0, 0, 0]), dtype=float)
+        idle_seed = spec.pop("idle_seed", None)
+        psi = PsiCreature(initial_anchor_pos=anchor, frame=frame, **{key: _resolve(value, {}) for key, value in spec.items()})
+        if idle_seed is not None:
+            psi.start_idle(seed=idle_seed)
+        creatures[name] = psi
+    return creatures
+
+def _change_state_parts(kwargs: dict) -> list:
+    """The `change_state` options behind each animation of its group, in the order `change_state` adds them."""
+    bend_direction = kwargs.get("bend_direction")
+    parts = [("new_state_name",)] * 3  # body, eyes and mouth
+    if kwargs.get("change_mouth_to"):
+        parts.append(("change_mouth_to",))
+    if kwargs.get("look_straight") or kwargs.get("look_at_target") is not None:
+        parts.append(("look_straight", "look_at_target"))
+    if kwargs.get("reset_squint") or kwargs.get("squint_amount") is not None:
+        parts.append(("reset_squint", "squint_amount"))
+    if kwargs.get("reset_sclera") or (bend_direction is not None and np.linalg.norm(bend_direction) > 0):
+        parts.append(("reset_sclera", "bend_direction", "bend_intensity"))
+    return parts
+
+def build_animation(call: dict, creatures: dict, frame: Mobject = None) -> Animation:
+    """Builds the single animation for a compiled call, at its own run time, seen through the camera `frame`."""
+    psi = creatures[call["creature"]]
+    actions = call["actions"]
+    run_time = call["end"] - call["start"]
+    args = lambda action: {key: _resolve(value, creatures) for key, value in action.items()}
+    name = actions[0]["action"]
+    # Each action's window, as fractions of the call
+    window = lambda action: (
+        ((action["start"] - call["start"]) / run_time, (action["end"] - call["start"]) / run_time) if run_time > 0 else (0.0, 0.0)
+    )
+    rate_func_of = lambda action: getattr(rate_functions, action["rate_func"]) if "rate_func" in action else linear
+
+    if name in CHANGE_STATE_ARGUMENTS and (len(actions) > 1 or name == "change_state"):
+        kwargs, sources = {}, {}
+        for action in actions:
+            for key, value in CHANGE_STATE_ARGUMENTS[action["action"]](args(action)).items():
+                if key in kwargs and not np.array_equal(kwargs[key], value):
+                    raise ValueError(f"Conflicting '{key}' for '{call['creature']}' at t={call['start']:g}s.")
+                kwargs[key], sources[key] = value, action
+        kwargs.setdefault("new_state_name", psi.current_state_name)
+        animation = psi.change_state(**kwargs)
+        if len(actions) > 1:
+            # Every part plays within the window of the action that asked for it
+            parts = []
+            for part, keys in zip(animation.animations, _change_state_parts(kwargs)):
+                source = next((sources[key] for key in keys if key in sources), None)
+                parts.append(part if source is None else Windowed(part, *window(source), rate_func=rate_func_of(source)))
+            animation.animations = parts
+            animation.build_animations_with_timings()
+    elif _action_names(call) in COMPATIBLE_ACTIONS:
+        # move_anchor_to records the new anchor, and the resize ends there at the new size
+        move, resize = sorted(actions, key=lambda action: action["action"])
+        psi.move_anchor_to(args(move)["position"])
+        animation = psi.resize(args(resize)["factor"], frame=frame)
+    else:
+        action = args(actions[0])
+        builders = {
+            "change_mouth": lambda: psi.change_mouth(action["emotion"]),
+            "look_at": lambda: psi.look_at(action["target"]),
+            "look_straight": lambda: psi.look_straight(),
+            "squint": lambda: psi.squint(action["amount"]),
+            "reset_squint": lambda: psi.reset_squint(),
+            "bend_sclera": lambda: psi.bend_sclera(action["direction"], intensity=action.get("intensity", 0.4)),
+            "reset_sclera": lambda: psi.reset_sclera(),
+            "move_anchor_to": lambda: psi.move_anchor_to(action["position"]),
+            "resize": lambda: psi.resize(action["factor"], frame=frame),
+            "blink": lambda: psi.blink(),
+            "fade_in": lambda: FadeIn(psi),
+            "fade_out": lambda: FadeOut(psi),
+        }
+        animation = builders[name]()
+    animation.set_run_time(run_time)
+    if len(actions) == 1 and "rate_func" in actions[0]:
+        animation.rate_func = rate_func_of(actions[0])
+    return animation
+
+class Windowed(Animation):
+    """
+    Plays `animation` between `start` and `end`, fractions of its run time,
+    eased by `rate_func`; it holds its first frame before and its last after,
+    so parts of one group keep overriding each other in order all along.
+    """
+    def __init__(self, animation: Animation, start: float, end: float, rate_func=linear):
+        self.animation = animation
+        self.window = (start, end)
+        super().__init__(animation.mobject, run_time=animation.run_time, rate_func=rate_func, suspend_mobject_updating=False)
+
+    def begin(self) -> None:
+        self.animation.begin()
+
+    def interpolate(self, alpha: float) -> None:
+        start, end = self.window
+        progress = float(np.clip((alpha - start) / (end - start), 0, 1)) if end > start else float(alpha >= start)
+        self.animation.interpolate(self.rate_func(progress))
+
+    def update_mobjects(self, dt: float) -> None:
+        self.animation.update_mobjects(dt)
+
+    def finish(self) -> None:
+        self.animation.finish()
+
+    def clean_up_from_scene(self, scene: Scene) -> None:
+        self.animation.clean_up_from_scene(scene)
+
+class DeferredAnimation(Animation):
+    """
+    Builds its animation only when it starts, so an action late in a segment
+    sees its creature as the earlier actions left it rather than as it was
+    when the segment began.
+    """
+    def __init__(self, mobject: Mobject, build, run_time: float):
+        self.build = build
+        super().__init__(mobject, run_time=run_time)
+
+    def begin(self) -> None:
+        self.animation = self.build()
+        self.animation.begin()
+
+    def interpolate(self, alpha: float) -> None:
+        self.animation.interpolate(alpha)
+
+    def update_mobjects(self, dt: float) -> None:
+        self.animation.update_mobjects(dt)
+
+    def finish(self) -> None:
+        self.animation.finish()
+
+    def clean_up_from_scene(self, scene: Scene) -> None:
+        self.animation.clean_up_from_scene(scene)
+
+def perform(scene: Scene, script: dict, creatures: dict = None) -> int:
+    """
+    Plays `script` in `scene`.
+
+    Args:
+        scene: The scene to play in.
+        script: A loaded script (see `load_script`).
+        creatures (optional): Prebuilt creatures by name (default: built from the script).
+
+    Returns:
+        int: The number of play calls (waits included).
+    """
+    # Levels of detail follow the camera frame, zoom included (a MovingCamera's `frame`)
+    frame = getattr(scene.camera, "frame", None)
+    creatures = creatures or build_creatures(script, frame)
+    faded_in = {action["creature"] for action in script.get("timeline", []) if action["action"] == "fade_in"}
+    scene.add(*(psi for name, psi in creatures.items() if name not in faded_in))
+
+    plays, now = 0, 0.0
+    for segment in compile_script(script):
+        if segment["start"] > now:
+            scene.wait(segment["start"] - now)
+            plays += 1
+        animations = []
+        for call in segment["calls"]:
+            if call["actions"][0]["action"] in ("fade_in", "fade_out"):
+                animation = build_animation(call, creatures, frame)
+            else:
+                build = lambda call=call: build_animation(call, creatures, frame)
+                animation = DeferredAnimation(creatures[call["creature"]], build, call["end"] - call["start"])
+            offset = call["start"] - segment["start"]
+            animations.append(Succession(Wait(run_time=offset), animation) if offset > 0 else animation)
+        scene.play(AnimationGroup(*animations))
+        plays += 1
+        now = segment["end"]
+    duration = script.get("scene", {}).get("duration")
+    if duration is not None and duration > now:
+        scene.wait(duration - now)
+        plays += 1
+    return plays
+
+class PerformanceScene(Scene):
+    """A Scene that performs its `script` class attribute (a loaded script)."""
+    script = None
+
+    def construct(self):
+        background_color = self.script.get("scene", {}).get("background_color")
+        if background_color:
+            self.camera.background_color = background_color
+        perform(self, self.script)
+
+def render_scripts(paths: list, quality: str = "low_quality", preview: bool = False) -> list:
+    """
+    Renders one scene per script file, each to `media/videos/<script name>/`.
+
+    Returns:
+        list: The paths of the rendered movies.
+    """
+    movies = []
+    for path in paths:
+        script = load_script(path)
+        scene_name = script["scene"]["name"]
+        scene_class = type(scene_name, (PerformanceScene,), {"script": script})
+        with tempconfig({"quality": quality, "preview": preview, "input_file": path}):
+            scene = scene_class()
+            scene.render()
+            movies.append(str(scene.renderer.file_writer.movie_file_path))
+    return movies
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render one PsiCreature scene per performance script.")
+    parser.add_argument("scripts", nargs="+", help="JSON or YAML script files.")
+    parser.add_argument("-q", "--quality", default="low_quality",
+                        help="A manim quality name, e.g. low_quality or high_quality.")
+    parser.add_argument("-p", "--preview", action="store_true", help="Open each movie when done.")
+    arguments = parser.parse_args()
+    for movie in render_scripts(arguments.scripts, arguments.quality, arguments.preview):
+        print(f"Rendered {movie}")
@@ -0,0 +1,164 @@
+# Opt-in profiling of the PsiCreature API. From the repository root:
+#   python profiling.py tests.py TestSize          # dry-run a scene, print a summary
+#   python profiling.py tests.py TestSize --trace trace.json
+#
+# or from code:
+#   with Profiler() as profiler:
+#       ...build and play creature animations...
+#   print(profiler.summary())
+#   profiler.save_chrome_trace("trace.json")   # open in chrome://tracing or ui.perfetto.dev
+#
+# Nothing is patched outside the `with` block, so profiling costs nothing
+# when it is not enabled. Inside, every call to a profiled method records its
+# wall time and the change in Python's allocated memory blocks
+# (sys.getallocatedblocks), which counts live allocations, not bytes.
+
+import argparse
+import functools
+import json
+import os
+import sys
+import time
+
+from manim import *
+from psi_creature import PsiCreature, TemplateCache
+
+# (class, method, span name) for everything profiled besides per-frame interpolation
+PROFILED_METHODS = [
+    (PsiCreature, "__init__", "PsiCreature()"),
+    (TemplateCache, "get", "load SVG template"),
+    *((PsiCreature, name, f"PsiCreature.{name}")
+      for name in ("change_state", "resize", "change_mouth", "look_at", "bend_sclera", "squint", "blink")),
+    (Transform, "begin", "Transform.begin (align)"),
+]
+
+def _interpolating_classes() -> list:
+    """Every Animation class that defines its own `interpolate`."""
+    classes, pending = [], [Animation]
+    while pending:
+        cls = pending.pop()
+        if "interpolate" in vars(cls):
+            classes.append(cls)
+        pending.extend(cls.__subclasses__())
+    return classes
+
+class Profiler:
+    """
+    Records a span per call of the profiled methods while active (as a context
+    manager), plus a "<Animation>.interpolate" span per animation frame.
+    Spans nest: a change_state span contains the template loads it caused.
+    """
+    def __init__(self):
+        self.events = []
+        self._patched = []
+        self._interpolating = set()
+        self._origin = 0
+
+    def __enter__(self) -> "Profiler":
+        self._origin = time.perf_counter_ns()
+        for cls, name, label in PROFILED_METHODS:
+            self._patch(cls, name, self._spanned(vars(cls)[name], label))
+        for cls in _interpolating_classes():
+            self._patch(cls, "interpolate", self._spanned_interpolate(vars(cls)["interpolate"]))
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        for cls, name, original in reversed(self._patched):
+            setattr(cls, name, original)
+        self._patched = []
+
+    def _patch(self, cls: type, name: str, wrapper) -> None:
+        self._patched.append((cls, name, vars(cls)[name]))
+        setattr(cls, name, wrapper)
+
+    def _record(self, label: str, func, args, kwargs):
+        blocks = sys.getallocatedblocks()
+        start = time.perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            end = time.perf_counter_ns()
+            self.events.append((label, start - self._origin, end - start, sys.getallocatedblocks() - blocks))
+
+    def _spanned(self, func, label: str):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return self._record(label, func, args, kwargs)
+        return wrapper
+
+    def _spanned_interpolate(self, func):
+        @functools.wraps(func)
+        def wrapper(animation, *args, **kwargs):
+            # A subclass calling super().interpolate is still one frame of one animation
+            if id(animation) in self._interpolating:
+                return func(animation, *args, **kwargs)
+            self._interpolating.add(id(animation))
+            try:
+                return self._record(f"{type(animation).__name__}.interpolate", func, (animation, *args), kwargs)
+            finally:
+                self._interpolating.discard(id(animation))
+        return wrapper
+
+    def totals(self) -> dict:
+        """
+        Returns:
+            dict: Span name -> {"calls", "seconds", "max_seconds", "blocks"}, with
+                `blocks` the net change in allocated memory blocks over all calls.
+        """
+        totals = {}
+        for label, _, duration, blocks in self.events:
+            entry = totals.setdefault(label, {"calls": 0, "seconds": 0.0, "max_seconds": 0.0, "blocks": 0})
+            entry["calls"] += 1
+            entry["seconds"] += duration / 1e9
+            entry["max_seconds"] = max(entry["max_seconds"], duration / 1e9)
+            entry["blocks"] += blocks
+        return totals
+
+    def summary(self) -> str:
+        """A table of the spans, slowest total first. Totals include nested spans."""
+        lines = [f"{'span':<40} {'calls':>7} {'total ms':>10} {'mean ms':>9} {'max ms':>9} {'blocks':>9}"]
+        totals = sorted(self.totals().items(), key=lambda item: -item[1]["seconds"])
+        for label, entry in totals:
+            lines.append(
+                f"{label:<40} {entry['calls']:>7} {entry['seconds'] * 1e3:>10.2f} "
+                f"{entry['seconds'] / entry['calls'] * 1e3:>9.3f} {entry['max_seconds'] * 1e3:>9.3f} {entry['blocks']:>9}"
+            )
+        return "\n".join(lines)
+
+    def chrome_trace(self) -> dict:
+        """The spans in Chrome's trace event format (complete events, microseconds)."""
+        return {
+            "traceEvents": [
+                {"name": label, "ph": "X", "ts": start / 1e3, "dur": duration / 1e3,
+                 "pid": os.getpid(), "tid": 0, "args": {"allocated_blocks": blocks}}
+                for label, start, duration, blocks in self.events
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def save_chrome_trace(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f)
+
+def profile_scene(module_path: str, scene_name: str) -> Profiler:
+    """Dry-runs a scene (all of its logic and frames, without writing video) under a Profiler."""
+    from render_runner import load_module
+
+    module = load_module(module_path)
+    with tempconfig({"quality": "low_quality", "dry_run": True, "verbosity": "WARNING", "progress_bar": "none"}):
+        scene = getattr(module, scene_name)()
+        with Profiler() as profiler:
+            scene.render()
+    return profiler
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Profile the PsiCreature API while dry-running a scene.")
+    parser.add_argument("module", help="The scene module, e.g. tests.py.")
+    parser.add_argument("scene", help="The scene to profile.")
+    parser.add_argument("--trace", help="Also write a Chrome trace JSON to this file.")
+    arguments = parser.parse_args()
+    profiler = profile_scene(arguments.module, arguments.scene)
+    print(profiler.summary())
+    if arguments.trace:
+        profiler.save_chrome_trace(arguments.trace)
+        print(f"Wrote {len(profiler.events)} spans to {arguments.trace}")
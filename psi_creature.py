@@ -1,10 +1,643 @@
 from manim import *
 import numpy as np
 import os
+import json
+import functools
+import copy
+import weakref
+import zlib
+from collections import OrderedDict, deque
+from types import MappingProxyType
+from manim.utils import hashing as manim_hashing
 
 # ====================================================================
-#  Unaltered Helper Classes (Sclera, Eye, Eyes)
-#  (These classes are correct and do not need changes)
+#  SVG Template Cache
+# ====================================================================
+class TemplateCache:
+    """
+    A process-wide cache of parsed, colored and sized SVG templates.
+
+    Parsing an SVG through manim is by far the most expensive step of building
+    a creature, so every `PsiCreature` (and every `resize` target) draws its
+    templates from here and only ever receives copies of the cached geometry.
+
+    Entries are keyed by (absolute path, mtime, color, height, path tolerance;
+    see `simplify_template`). Editing an
+    asset on disk therefore produces a new key on the next lookup; the stale
+    entry is never returned again and ages out through LRU eviction, or can be
+    dropped explicitly with `invalidate`.
+    """
+    def __init__(self, max_entries: int = 64):
+        """
+        Args:
+            max_entries: The maximum number of templates kept alive. The least
+                         recently used entries are evicted beyond this.
+        """
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(svg_path: str, color: ManimColor, height: float, tolerance: float = 0.0) -> tuple:
+        path = os.path.abspath(svg_path)
+        return (path, os.path.getmtime(path), ManimColor(color).to_hex(), float(height), float(tolerance))
+
+    def get(self, svg_path: str, color: ManimColor, height: float, tolerance: float = 0.0) -> SVGMobject:
+        """
+        Returns a copy of the template for `svg_path`, parsing the file only
+        if no up-to-date entry with the same color and height is cached. With
+        a `tolerance`, the copy's paths are simplified (see `simplify_template`).
+        """
+        key = self.make_key(svg_path, color, height, tolerance)
+        template = self._entries.get(key)
+        if template is None and tolerance > 0:
+            template = simplify_template(self.get(svg_path, color, height), tolerance)
+            self._entries[key] = template
+            self.evict()
+        elif template is None:
+            template = load_bundled_template(svg_path)
+            if template is None:
+                # manim keeps its own (mtime-unaware, unbounded) SVG cache; bypass
+                # it so this cache is the single source of truth.
+                template = SVGMobject(svg_path, use_svg_cache=False)
+            template.set_color(color)
+            template.set_height(height)
+            self._entries[key] = template
+            self.evict()
+        else:
+            self._entries.move_to_end(key)
+        return template.copy()
+
+    def invalidate(self, svg_path: str = None) -> int:
+        """
+        Drops every cached entry for `svg_path`, or the whole cache if no path
+        is given. Returns the number of entries removed.
+        """
+        if svg_path is None:
+            removed = len(self._entries)
+            self._entries.clear()
+            return removed
+        path = os.path.abspath(svg_path)
+        stale = [key for key in self._entries if key[0] == path]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def evict(self, max_entries: int = None) -> int:
+        """
+        Evicts least recently used entries until at most `max_entries`
+        (defaults to `self.max_entries`) remain. Returns the number evicted.
+        """
+        limit = self.max_entries if max_entries is None else max_entries
+        evicted = 0
+        while len(self._entries) > max(limit, 0):
+            self._entries.popitem(last=False)
+            evicted += 1
+        return evicted
+
+SVG_TEMPLATE_CACHE = TemplateCache()
+
+# ====================================================================
+#  Precompiled Asset Bundle
+# ====================================================================
+BUNDLE_DIRNAME = "compiled"
+BUNDLE_VERSION = 1
+BUNDLE_REFERENCE_HEIGHT = 2.0
+
+def _source_signature(svg_path: str) -> dict:
+    stat = os.stat(svg_path)
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+def compile_asset_bundle(assets_dir: str = "assets", bundle_dir: str = None) -> str:
+    """
+    Parses every SVG in `assets_dir` once and writes a binary bundle that
+    `TemplateCache` loads instead of going through manim's SVG pipeline.
+
+    The bundle is a directory holding one `<state>.npy` array with the points
+    of all of the state's submobjects, and a `manifest.json` with their point
+    counts and styles and the size and mtime of the source SVG. Everything is
+    stored at a body height of `BUNDLE_REFERENCE_HEIGHT`; layouts are not, as
+    `PsiCreature.layout_for` derives them from the template for any eye height.
+
+    Args:
+        assets_dir: The directory with the state SVGs.
+        bundle_dir (optional): Where to write the bundle (default: `<assets_dir>/compiled`).
+
+    Returns:
+        str: The bundle directory.
+    """
+    bundle_dir = bundle_dir or os.path.join(assets_dir, BUNDLE_DIRNAME)
+    os.makedirs(bundle_dir, exist_ok=True)
+
+    states = {}
+    for filename in sorted(os.listdir(assets_dir)):
+        if not filename.endswith(".svg"):
+            continue
+        state = os.path.splitext(filename)[0]
+        svg_path = os.path.join(assets_dir, filename)
+        template = SVGMobject(svg_path, use_svg_cache=False, height=BUNDLE_REFERENCE_HEIGHT)
+        parts = template.family_members_with_points()
+        np.save(os.path.join(bundle_dir, f"{state}.npy"), np.concatenate([part.points for part in parts]))
+        states[state] = {
+            "source": filename,
+            **_source_signature(svg_path),
+            "point_counts": [len(part.points) for part in parts],
+            "styles": [
+                {
+                    "fill_color": part.get_fill_color().to_hex(),
+                    "fill_opacity": float(part.get_fill_opacity()),
+                    "stroke_color": part.get_stroke_color().to_hex(),
+                    "stroke_opacity": float(part.get_stroke_opacity()),
+                    "stroke_width": float(part.get_stroke_width()),
+                }
+                for part in parts
+            ],
+        }
+
+    manifest = {"version": BUNDLE_VERSION, "reference_height": BUNDLE_REFERENCE_HEIGHT, "states": states}
+    # Write the manifest last and atomically, so readers never see a half-written bundle
+    manifest_path = os.path.join(bundle_dir, "manifest.json")
+    with open(manifest_path + ".tmp", "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(manifest_path + ".tmp", manifest_path)
+    return bundle_dir
+
+class AssetBundle:
+    """
+    A compiled asset bundle (see `compile_asset_bundle`). Point arrays are
+    memory-mapped read-only, so every process rendering from the same bundle
+    shares its pages instead of parsing its own copy of each SVG.
+    """
+    _open_bundles = {}
+
+    def __init__(self, bundle_dir: str):
+        with open(os.path.join(bundle_dir, "manifest.json")) as f:
+            manifest = json.load(f)
+        if manifest.get("version") != BUNDLE_VERSION:
+            raise ValueError(f"Asset bundle '{bundle_dir}' has version {manifest.get('version')}, expected {BUNDLE_VERSION}.")
+        self.bundle_dir = bundle_dir
+        self.reference_height = manifest["reference_height"]
+        self.states = manifest["states"]
+        self._points = {}
+
+    @classmethod
+    def open(cls, bundle_dir: str) -> "AssetBundle | None":
+        """Returns the bundle in `bundle_dir`, reopened only when its manifest changed, or None if there is none."""
+        manifest_path = os.path.join(bundle_dir, "manifest.json")
+        try:
+            manifest_mtime = os.stat(manifest_path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+        cached = cls._open_bundles.get(bundle_dir)
+        if cached is None or cached[0] != manifest_mtime:
+            cached = (manifest_mtime, cls(bundle_dir))
+            cls._open_bundles[bundle_dir] = cached
+        return cached[1]
+
+    def is_fresh(self, state: str, svg_path: str) -> bool:
+        """True if `state` was compiled from `svg_path` as it is on disk now."""
+        entry = self.states.get(state)
+        if entry is None or entry["source"] != os.path.basename(svg_path):
+            return False
+        signature = _source_signature(svg_path)
+        return entry["mtime_ns"] == signature["mtime_ns"] and entry["size"] == signature["size"]
+
+    def get_points(self, state: str) -> np.ndarray:
+        if state not in self._points:
+            self._points[state] = np.load(os.path.join(self.bundle_dir, f"{state}.npy"), mmap_mode="r")
+        return self._points[state]
+
+    def build_template(self, state: str) -> VGroup:
+        """The template of `state` at the reference height, one VMobject per compiled submobject."""
+        entry = self.states[state]
+        points = self.get_points(state)
+        parts, start = [], 0
+        for count, style in zip(entry["point_counts"], entry["styles"]):
+            # set_points copies: `TemplateCache` recolors and rescales the template in place,
+            # which the read-only mapped pages do not allow
+            parts.append(VMobject(**style).set_points(points[start:start + count]))
+            start += count
+        return VGroup(*parts)
+
+def load_bundled_template(svg_path: str) -> VGroup | None:
+    """
+    Builds the template for `svg_path` from the bundle next to it, or returns
+    None if there is no bundle or its entry is missing or stale.
+    """
+    svg_path = os.path.abspath(svg_path)
+    bundle = AssetBundle.open(os.path.join(os.path.dirname(svg_path), BUNDLE_DIRNAME))
+    state = os.path.splitext(os.path.basename(svg_path))[0]
+    if bundle is None or not bundle.is_fresh(state, svg_path):
+        return None
+    return bundle.build_template(state)
+
+# ====================================================================
+#  Sclera Deformation Engine
+# ====================================================================
+def bend_deformation(points: np.ndarray, direction_vector: np.ndarray, height, intensity=0.4) -> np.ndarray:
+    """
+    Bends origin-centered sclera outlines away from `direction_vector`.
+
+    Accepts a single outline of shape (N, 3) or a stack of outlines of shape
+    (..., N, 3), e.g. every sclera in a crowd. `direction_vector` (3,) or
+    (..., 3), `height` and `intensity` broadcast over the leading axes.
+
+    Returns:
+        np.ndarray: The deformed points, same shape as `points`.
+    """
+    points = np.asarray(points, dtype=float)
+    lead_shape = points.shape[:-2]
+    directions = np.broadcast_to(np.asarray(direction_vector, dtype=float), lead_shape + (3,))
+    direction_norms = np.linalg.norm(directions, axis=-1, keepdims=True)
+    unit_directions = np.divide(directions, direction_norms, out=np.zeros(directions.shape), where=direction_norms > 0)
+
+    point_norms = np.linalg.norm(points, axis=-1, keepdims=True)
+    # Points at the origin have no direction and stay where they are
+    unit_points = np.divide(points, point_norms, out=np.zeros(points.shape), where=point_norms >= 1e-6)
+    cos_angle = np.clip(np.einsum("...nk,...k->...n", unit_points, unit_directions), -1.0, 1.0)
+    # Points more than 90 degrees away from the bend direction are untouched
+    cos_angle = np.maximum(cos_angle, 0.0)
+    falloff_weights = ((cos_angle + 1) / 2 * cos_angle) ** 1.5
+
+    magnitudes = np.broadcast_to(np.asarray(height, dtype=float) * np.asarray(intensity, dtype=float), lead_shape)
+    displacements = -unit_directions[..., None, :] * (magnitudes[..., None] * falloff_weights)[..., None]
+    return points + displacements
+
+def squint_deformation(points: np.ndarray, theta, height) -> np.ndarray:
+    """
+    Squints origin-centered sclera outlines by pulling them towards y=0.
+
+    Accepts a single outline of shape (N, 3) or a stack of shape (..., N, 3);
+    `theta` (clipped to [0, PI/2]) and `height` broadcast over the leading axes.
+
+    Returns:
+        np.ndarray: The deformed points, same shape as `points`.
+    """
+    points = np.asarray(points, dtype=float)
+    lead_shape = points.shape[:-2]
+    squint_factors = np.broadcast_to(np.sin(np.clip(theta, 0, PI / 2)), lead_shape)[..., None]
+    max_y = np.broadcast_to(np.asarray(height, dtype=float) / 2, lead_shape)[..., None]
+    y = points[..., 1]
+    norm_y = np.abs(y) / np.where(max_y == 0, 1.0, max_y)
+    displacement_y = np.where(max_y == 0, 0.0, -y * norm_y ** 2 * squint_factors)
+    target_points = points.copy()
+    target_points[..., 1] += displacement_y
+    return target_points
+
+def _batched_sclera_points(scleras: list, deformation, per_sclera_args: list) -> list:
+    """
+    Runs `deformation` once per group of equally sized scleras, passing the
+    stacked `original_points` followed by the stacked per-sclera arguments.
+    """
+    results = [None] * len(scleras)
+    groups = {}
+    for i, sclera in enumerate(scleras):
+        groups.setdefault(sclera.original_points.shape, []).append(i)
+    for indices in groups.values():
+        stacked_points = np.stack([scleras[i].original_points for i in indices])
+        stacked_args = [np.stack([np.asarray(args[i], dtype=float) for i in indices]) for args in per_sclera_args]
+        for i, points in zip(indices, deformation(stacked_points, *stacked_args)):
+            results[i] = points
+    return results
+
+class DeformationCache:
+    """
+    A process-wide LRU cache of deformed sclera outlines.
+
+    Scenes keep asking for the same few bends and squints, on every eye of
+    every creature of the same size. Entries are keyed by the sclera geometry
+    (its rest outline and height) and the deformation parameters, quantized to
+    `quantum` (unit bend direction, intensity, squint angle). The outline is
+    always computed from the quantized parameters, so a result never depends
+    on which nearby request happened to fill the entry first.
+
+    `hits` and `misses` count lookups since creation (or `reset_stats`), for
+    tuning `max_entries` and `quantum`.
+    """
+    def __init__(self, max_entries: int = 256, quantum: float = 1e-4):
+        """
+        Args:
+            max_entries: The maximum number of outlines kept. The least
+                         recently used entries are evicted beyond this.
+            quantum: The step parameters are rounded to before lookup.
+        """
+        self.max_entries = max_entries
+        self.quantum = quantum
+        self._entries = OrderedDict()
+        self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def geometry_key(sclera: 'Sclera') -> tuple:
+        points = sclera.original_points
+        return (points.shape, float(sclera.height), zlib.crc32(np.round(points, 9).tobytes()))
+
+    def quantize(self, values) -> np.ndarray:
+        # + 0.0 folds -0.0 into 0.0, so both give the same key
+        return np.round(np.asarray(values, dtype=float) / self.quantum) * self.quantum + 0.0
+
+    def get_bend_points(self, scleras: list, direction_vectors: list, intensities: list) -> list:
+        """`bend_deformation` of each sclera's `original_points`, as read-only arrays."""
+        params = [
+            (self.quantize(normalize(np.asarray(direction, dtype=float))), self.quantize(intensity))
+            for direction, intensity in zip(direction_vectors, intensities)
+        ]
+        return self._lookup("bend", bend_deformation, scleras, params)
+
+    def get_squint_points(self, scleras: list, thetas: list) -> list:
+        """`squint_deformation` of each sclera's `original_points`, as read-only arrays."""
+        params = [(self.quantize(np.clip(theta, 0, PI / 2)),) for theta in thetas]
+        return self._lookup("squint", squint_deformation, scleras, params)
+
+    def _lookup(self, kind: str, deformation, scleras: list, params: list) -> list:
+        results, missing = [], {}
+        for sclera, args in zip(scleras, params):
+            key = (kind, self.geometry_key(sclera), *(arg.tobytes() for arg in args))
+            points = self._entries.get(key)
+            if points is None and key not in missing:
+                missing[key] = (sclera, args)
+            elif points is None:
+                # A repeat within one request (both eyes of a creature) is computed once
+                self.hits += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            results.append((key, points))
+        computed = {}
+        if missing:
+            self.misses += len(missing)
+            found = list(missing.values())
+            heights = [sclera.height for sclera, _ in found]
+            per_sclera_args = [[args[i] for _, args in found] for i in range(len(found[0][1]))]
+            if kind == "bend":
+                per_sclera_args.insert(1, heights)
+            else:
+                per_sclera_args.append(heights)
+            for key, points in zip(missing, _batched_sclera_points([sclera for sclera, _ in found], deformation, per_sclera_args)):
+                points.flags.writeable = False
+                self._entries[key] = computed[key] = points
+            # A batch with more misses than `max_entries` evicts some of its own results
+            self.evict()
+        return [computed[key] if points is None else points for key, points in results]
+
+    def reset_stats(self) -> None:
+        self.hits = self.misses = 0
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.reset_stats()
+
+    def evict(self, max_entries: int = None) -> int:
+        """
+        Evicts least recently used entries until at most `max_entries`
+        (defaults to `self.max_entries`) remain. Returns the number evicted.
+        """
+        limit = self.max_entries if max_entries is None else max_entries
+        evicted = 0
+        while len(self._entries) > max(limit, 0):
+            self._entries.popitem(last=False)
+            evicted += 1
+        return evicted
+
+SCLERA_DEFORMATION_CACHE = DeformationCache()
+
+# ====================================================================
+#  Blendshape Helpers
+# ====================================================================
+# Named bend directions that get a precomputed blendshape basis on every sclera
+SCLERA_BEND_DIRECTIONS = {
+    "up": UP, "down": DOWN, "left": LEFT, "right": RIGHT,
+    "up_left": UP + LEFT, "up_right": UP + RIGHT,
+    "down_left": DOWN + LEFT, "down_right": DOWN + RIGHT,
+}
+# Bases a sclera keeps for other directions; past this, the oldest one not in use is dropped
+MAX_EXTRA_BEND_DIRECTIONS = 8
+
+def _anchor_center(points: np.ndarray) -> np.ndarray:
+    """The bounding box center of the anchors of a cubic bezier point array (what `get_center` reports)."""
+    anchors = np.concatenate([points[0::4], points[3::4]])
+    return (anchors.min(axis=0) + anchors.max(axis=0)) / 2
+
+def _write_points(vmobject: VMobject, points: np.ndarray, center: np.ndarray) -> None:
+    """Writes `points`, re-centered on `center`, straight into the existing point buffer of `vmobject`."""
+    points = points + (center - _anchor_center(points))
+    if vmobject.points.shape == points.shape:
+        vmobject.points[...] = points
+    else:
+        vmobject.set_points(points)
+
+# ====================================================================
+#  Level of Detail
+# ====================================================================
+# Geometry only needs to be as fine as the creature's size on screen. Levels
+# are picked by the body's height in pixels at the current resolution, seen
+# through the camera frame (a MovingCamera's zoom counts), most detailed
+# first, as (minimum body height in pixels, cubic arcs per eye
+# circle, body path tolerance in pixels). The first level is the full,
+# unsimplified geometry.
+DETAIL_LEVELS = (
+    (200, 8, 0.0),
+    (60, 6, 0.25),
+    (0, 4, 0.5),
+)
+
+def get_pixels_per_unit(frame: Mobject = None) -> float:
+    """Pixels per scene unit through `frame` (a MovingCamera's `frame`, say) or the configured frame."""
+    return config.pixel_height / (config.frame_height if frame is None else frame.height)
+
+def detail_level_for(body_height: float, frame: Mobject = None) -> int:
+    """The `DETAIL_LEVELS` index for a body `body_height` units tall, at the current resolution and `frame`."""
+    pixels = body_height * get_pixels_per_unit(frame)
+    for level, (min_pixels, _, _) in enumerate(DETAIL_LEVELS):
+        if pixels >= min_pixels:
+            return level
+    return len(DETAIL_LEVELS) - 1
+
+def get_path_tolerance(level: int, frame: Mobject = None) -> float:
+    """The body path tolerance of `level`, in scene units at the current resolution and `frame`."""
+    return DETAIL_LEVELS[level][2] / get_pixels_per_unit(frame)
+
+def circle_points(radius: float, num_arcs: int) -> np.ndarray:
+    """
+    The points of an origin-centered circle made of `num_arcs` cubic arcs, as
+    `Circle` builds it, scaled so they span exactly 2 * `radius` in x and y.
+    With arcs that do not start at a quadrant (6, say) the handles poke out
+    of the circle, and every measure taken from the live size (gaze range,
+    bend strength, deformation cache keys) would depend on the detail level.
+    """
+    points = Circle(radius=radius, num_components=num_arcs + 1).get_points()
+    points[:, :2] *= 2 * radius / np.ptp(points[:, :2], axis=0)
+    return points
+
+def _sample_curves(curves: np.ndarray, samples: int) -> np.ndarray:
+    """(k, 4, 3) cubic curves -> (k * samples, 3) points along them, endpoints included."""
+    t = np.linspace(0, 1, samples)[:, None]
+    weights = np.hstack([(1 - t) ** 3, 3 * (1 - t) ** 2 * t, 3 * (1 - t) * t ** 2, t ** 3])
+    return np.einsum("sc,kcd->ksd", weights, curves).reshape(-1, 3)
+
+def _fit_cubic(curves: np.ndarray, tolerance: float, samples: int = 8) -> np.ndarray | None:
+    """
+    One cubic through the ends of a run of curves, with their end tangents and
+    least-squares handle lengths, or None if it strays more than `tolerance`.
+    """
+    start, end = curves[0, 0], curves[-1, 3]
+    start_tangent, end_tangent = curves[0, 1] - start, end - curves[-1, 2]
+    if np.linalg.norm(start_tangent) < 1e-9 or np.linalg.norm(end_tangent) < 1e-9:
+        return None
+    start_tangent, end_tangent = normalize(start_tangent), normalize(end_tangent)
+    points = _sample_curves(curves, samples)
+    # Chord-length parameters along the run
+    lengths = np.concatenate([[0], np.cumsum(np.linalg.norm(np.diff(points, axis=0), axis=1))])
+    if lengths[-1] == 0:
+        return None
+    u = (lengths / lengths[-1])[:, None]
+    b0, b1, b2, b3 = (1 - u) ** 3, 3 * (1 - u) ** 2 * u, 3 * (1 - u) * u ** 2, u ** 3
+    residual = points - (b0 + b1) * start - (b2 + b3) * end
+    basis = np.stack([(b1 * start_tangent).ravel(), (-b2 * end_tangent).ravel()], axis=1)
+    (start_length, end_length), *_ = np.linalg.lstsq(basis, residual.ravel(), rcond=None)
+    if start_length <= 0 or end_length <= 0:
+        return None
+    fitted = np.array([start, start + start_length * start_tangent, end - end_length * end_tangent, end])
+    # Distances at matching parameters overestimate the true deviation, so the test is conservative
+    error = np.linalg.norm(points - (b0 * fitted[0] + b1 * fitted[1] + b2 * fitted[2] + b3 * fitted[3]), axis=1)
+    return fitted if error.max() <= tolerance else None
+
+def simplify_bezier_points(points: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    Reduces a cubic bezier point array (as in `VMobject.points`) by greedily
+    merging runs of consecutive curves into single cubics that stay within
+    `tolerance` of the original path. Subpath ends and corners are kept, and
+    so are the extreme anchors, so the bounding box (and `get_center`) of the
+    result is exactly the original's.
+
+    Returns:
+        np.ndarray: The simplified points; `points` itself if nothing merged.
+    """
+    if tolerance <= 0 or len(points) < 8:
+        return points
+    curves = points.reshape(-1, 4, 3)
+    breaks = np.flatnonzero(np.linalg.norm(curves[1:, 0] - curves[:-1, 3], axis=1) > 1e-9) + 1
+    starts = curves[:, 0, :2]
+    extremes = np.concatenate([np.flatnonzero((starts == starts.min(axis=0)).any(axis=1)),
+                               np.flatnonzero((starts == starts.max(axis=0)).any(axis=1))])
+    breaks = np.union1d(breaks, extremes[extremes > 0])
+    simplified = []
+    for subpath in np.split(curves, breaks):
+        i = 0
+        while i < len(subpath):
+            merged, j = subpath[i], i
+            while j + 1 < len(subpath):
+                fitted = _fit_cubic(subpath[i:j + 2], tolerance)
+                if fitted is None:
+                    break
+                merged, j = fitted, j + 1
+            simplified.append(merged)
+            i = j + 1
+    if len(simplified) == len(curves):
+        return points
+    return np.concatenate(simplified)
+
+def simplify_template(template: Mobject, tolerance: float) -> Mobject:
+    """Simplifies every path of `template` in place (see `simplify_bezier_points`)."""
+    if tolerance > 0:
+        for member in template.family_members_with_points():
+            member.set_points(simplify_bezier_points(member.points, tolerance))
+    return template
+
+# ====================================================================
+#  Play-Call Fingerprints
+# ====================================================================
+# Manim hashes every play() call by serializing the animations and the scene's
+# mobjects to JSON, attribute by attribute. For a creature that means every
+# loaded template, `body.target` and any leftover Become target, with point
+# arrays turned into (truncated) reprs: slow, and the hash changes whenever
+# something invisible does. Creature classes instead register with
+# `hashed_by_fingerprint` and provide `get_fingerprint`, their logical state plus a crc32 digest of the points and style of their
+# family, which is exactly what their frames depend on.
+
+def get_family_digest(mobject: Mobject) -> int:
+    """A crc32 digest of the points and style of every member of `mobject`'s family."""
+    digest = 0
+    for member in mobject.get_family():
+        digest = zlib.crc32(type(member).__name__.encode(), digest)
+        digest = zlib.crc32(np.ascontiguousarray(member.points), digest)
+        if isinstance(member, VMobject):
+            for rgbas in (member.fill_rgbas, member.stroke_rgbas, member.background_stroke_rgbas):
+                digest = zlib.crc32(np.ascontiguousarray(rgbas, dtype=float), digest)
+            style = [member.stroke_width, member.background_stroke_width, member.sheen_factor, *member.sheen_direction]
+            digest = zlib.crc32(np.array(style, dtype=float), digest)
+            digest = zlib.crc32(f"{member.joint_type}{member.cap_style}{member.shade_in_3d}".encode(), digest)
+        digest = zlib.crc32(np.array([member.z_index], dtype=float), digest)
+    return digest
+
+def get_mobject_fingerprint(mobject: Mobject, **logical_state) -> dict:
+    """
+    The fingerprint hashed in place of `mobject`'s attributes.
+
+    Args:
+        mobject: The mobject to fingerprint.
+        **logical_state: JSON-friendly values describing it (state name, emotion, ...).
+
+    Returns:
+        dict: The class, the logical state, the family digest and the family's updaters.
+    """
+    return {
+        "class": type(mobject).__name__,
+        **logical_state,
+        "digest": get_family_digest(mobject),
+        # Other updaters go through manim's usual serialization (source code and closure)
+        "updaters": mobject.get_family_updaters(),
+    }
+
+def _color_key(color) -> str:
+    return ManimColor(color).to_hex(with_alpha=True)
+
+def _weights_key(weights: dict) -> list:
+    return sorted((name, float(weight)) for name, weight in weights.items())
+
+_FINGERPRINTED_TYPES = ()
+
+def hashed_by_fingerprint(cls: type) -> type:
+    """Class decorator: play() calls hash instances of `cls` by their `get_fingerprint()`."""
+    global _FINGERPRINTED_TYPES
+    _FINGERPRINTED_TYPES += (cls,)
+    return cls
+
+def _hash_by_fingerprint(encoder, obj):
+    """Manim's `_CustomEncoder.default`, serializing fingerprinted objects by their fingerprint."""
+    if isinstance(obj, _FINGERPRINTED_TYPES):
+        return obj.get_fingerprint()
+    if isinstance(obj, Mobject) and vars(obj).get("fingerprint_by_digest", False):
+        return get_mobject_fingerprint(obj)
+    return _hash_by_fingerprint.manim_default(encoder, obj)
+
+def _install_fingerprint_hashing() -> bool:
+    """
+    Routes manim's play-call serialization through `_hash_by_fingerprint`.
+    Every other object is still serialized by manim itself. Manim versions
+    without a `_CustomEncoder.default` to wrap are left alone and hash
+    creatures attribute by attribute, as they would without this module.
+
+    Returns:
+        bool: Whether play() calls hash creatures by their fingerprint.
+    """
+    encoder = getattr(manim_hashing, "_CustomEncoder", None)
+    default = getattr(encoder, "default", None)
+    if not callable(default):
+        return False
+    if not hasattr(default, "manim_default"):
+        _hash_by_fingerprint.manim_default = default
+        encoder.default = _hash_by_fingerprint
+    return True
+
+FINGERPRINT_HASHING = _install_fingerprint_hashing()
+
+# ====================================================================
+#  Helper Classes (Become, Sclera, Eye, Eyes)
 # ====================================================================
 class Become(Transform):
     """
@@ -15,96 +648,395 @@ class Become(Transform):
     indistinguishable from the target mobject. This allows for complex state
     changes (like re-initializing with new parameters) without needing to
     manually reassign the variable in your scene's `construct` method.
+
+    The target is consumed: it is aligned with the mobject directly and its
+    state is handed over at the end, so it must not be reused elsewhere. What
+    is handed over is the target as it was built, without the submobjects and
+    points the alignment padded it with, so repeated `Become`s do not grow it.
     """
     def __init__(self, mobject, target_mobject, **kwargs):
         """
         Args:
             mobject: The Mobject to be transformed.
-            target_mobject: The Mobject to become. Its state will be copied
+            target_mobject: The Mobject to become. Its state will be moved
                             into `mobject` at the end of the animation.
         """
-        self.target_copy = target_mobject.copy()
         super().__init__(mobject, target_mobject, **kwargs)
 
+    def begin(self) -> None:
+        # Same as Transform.begin, except that the target is aligned in place
+        # instead of through a protective deep copy; nobody else holds it.
+        self.target_mobject = self.create_target()
+        self.target_copy = self.target_mobject
+        # Alignment reassigns the padded attributes, so a shallow copy of each member keeps the originals
+        self.target_members = [(member, dict(vars(member))) for member in self.target_mobject.get_family()]
+        if config.renderer == RendererType.OPENGL:
+            self.mobject.align_data_and_family(self.target_copy)
+        else:
+            self.mobject.align_data(self.target_copy)
+        Animation.begin(self)
+
     def finish(self) -> None:
         """Called when the animation is finished."""
         super().finish()
+        for member, attributes in self.target_members:
+            vars(member).clear()
+            vars(member).update(attributes)
         # The magic happens here:
         # We replace the dictionary of the original mobject with the
-        # dictionary of the target mobject's copy. This effectively
-        # makes the original mobject "become" the target.
+        # dictionary of the target. This effectively makes the original
+        # mobject "become" the target.
         self.mobject.__dict__.update(self.target_copy.__dict__)
 
+class AlignedTransform(Transform):
+    """
+    A `Transform` between a mobject and a target that already have the same
+    structure and point counts (see `CreatureAssets.get_body_pair`): `begin`
+    skips the alignment and, like `Become`, the protective copy of the target,
+    which must not be reused elsewhere.
+
+    Given a `final_mobject` (the unpadded counterpart of the target), the
+    mobject takes over its state at the end, the way `Become` does.
+    """
+    def __init__(self, mobject, target_mobject, final_mobject: Mobject = None, **kwargs):
+        self.final_mobject = final_mobject
+        super().__init__(mobject, target_mobject, **kwargs)
+
+    def begin(self) -> None:
+        self.target_mobject = self.create_target()
+        self.target_copy = self.target_mobject
+        Animation.begin(self)
+
+    def finish(self) -> None:
+        super().finish()
+        if self.final_mobject is not None and self.rate_func(1) == 1:
+            self.mobject.__dict__.update(self.final_mobject.__dict__)
+
+class AnchoredResize(Animation):
+    """
+    Scales a `PsiCreature` about its anchor by interpolating its existing point
+    buffers towards analytically computed targets; no target creature, or copy
+    of one, is ever built. The mouth stroke width scales along with the body.
+
+    Like `Become`, the animation ends at the creature's `anchor_pos` as of when
+    it was built, so it can be combined with `move_anchor_to`.
+    """
+    def __init__(self, creature, scale_factor: float, anchor_vector: np.ndarray, detail_level: int = None, frame: Mobject = None, **kwargs):
+        """
+        Args:
+            creature: The PsiCreature to resize.
+            scale_factor: The relative scale to reach.
+            anchor_vector: The anchor vector of the creature's state before the
+                           resize, used to locate its anchor when the animation begins.
+            detail_level (optional): A level of `DETAIL_LEVELS` to redraw the
+                creature at once it reaches the new size.
+            frame (optional): The camera frame the level was picked for.
+        """
+        self.scale_factor = scale_factor
+        self.anchor_vector = anchor_vector
+        self.detail_level, self.frame = detail_level, frame
+        self.target_anchor = np.array(creature.anchor_pos, dtype=float)
+        super().__init__(creature, **kwargs)
+
+    def create_starting_mobject(self) -> Mobject:
+        # The start is kept as bare point arrays in `begin`
+        return self.mobject
+
+    def begin(self) -> None:
+        creature = self.mobject
+        start_anchor = creature.body.get_center() + self.anchor_vector
+        self.members = creature.family_members_with_points()
+        self.start_points = [member.points.copy() for member in self.members]
+        self.end_points = [self.target_anchor + self.scale_factor * (points - start_anchor) for points in self.start_points]
+        self.mouth_curve = creature.mouth.submobjects[0]
+        self.start_stroke_width = self.mouth_curve.get_stroke_width()
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        alpha = self.rate_func(alpha)
+        for member, start, end in zip(self.members, self.start_points, self.end_points):
+            member.points = start + (end - start) * alpha
+        self.mouth_curve.set_stroke(width=self.start_stroke_width * interpolate(1, self.scale_factor, alpha))
+
+    def finish(self) -> None:
+        super().finish()
+        if self.detail_level is not None:
+            self.mobject.set_detail_level(self.detail_level, self.frame)
+
+class CreatureTransform(Animation):
+    """
+    The fused counterpart of `PsiCreature.change_state`'s animation group.
+    At `begin`, the start and end points of every creature part are gathered
+    into one contiguous buffer, and each part's `points` becomes a view into
+    it; every frame is then a single vectorized interpolation of that buffer.
+
+    Like the group, it is built by `change_state(..., fused=True)` after the
+    creature's logical state (state name, emotion, sclera blend weights) is
+    recorded; those are captured here, so animations built in between do not
+    change where it ends. The end pose is the one `apply_state` puts the
+    creature in, reached at `begin` about the anchor the creature had when the
+    animation was built. Styles are left alone (no state changes them).
+    """
+    def __init__(
+        self,
+        creature,
+        from_state_name: str,
+        new_state_name: str,
+        look_at_target: Mobject | np.ndarray = None,
+        look_straight: bool = False,
+        change_mouth_to: str = None,
+        **kwargs
+    ):
+        """
+        Args:
+            creature: The PsiCreature to animate, with its new logical state recorded.
+            from_state_name: The body shape it starts from.
+            new_state_name: The target body shape.
+            look_at_target (optional): A point or Mobject to look at (where it is now).
+            look_straight (optional): If True, ends looking straight ahead.
+            change_mouth_to (optional): The emotion to end with.
+            **kwargs: Arguments for `Animation` (run_time, rate_func, ...).
+        """
+        self.from_state_name, self.new_state_name = from_state_name, new_state_name
+        if isinstance(look_at_target, Mobject):
+            look_at_target = look_at_target.get_center()
+        self.look_at_target, self.look_straight = look_at_target, look_straight
+        self.mouth_weights = {change_mouth_to: 1.0} if change_mouth_to else None
+        self.sclera_weights = [dict(eye.sclera.blend_weights) for eye in (creature.eyes.left_eye, creature.eyes.right_eye)]
+        self.target_anchor = np.array(creature.anchor_pos, dtype=float)
+        super().__init__(creature, **kwargs)
+
+    def create_starting_mobject(self) -> Mobject:
+        # The start is kept in the point buffer built in `begin`
+        return self.mobject
+
+    def begin(self) -> None:
+        creature = self.mobject
+        # Take the body's aligned target from the cached state pair, or align it the way Transform does
+        target_body = creature._get_aligned_bodies(self.from_state_name, self.new_state_name, self.target_anchor)
+        if target_body is None:
+            target_body = creature._create_body_at_anchor(self.new_state_name, self.target_anchor)
+            creature.body.align_data(target_body)
+        # Then pose the rest in place
+        self.members = creature.family_members_with_points()
+        start = np.concatenate([member.points for member in self.members])
+        # The logical state was recorded at build time; keep whatever was recorded since
+        scleras = (creature.eyes.left_eye.sclera, creature.eyes.right_eye.sclera)
+        recorded = [sclera.blend_weights for sclera in scleras]
+        creature._pose_features(
+            self.new_state_name, self.target_anchor, self.look_at_target, self.look_straight, self.mouth_weights, self.sclera_weights
+        )
+        for sclera, weights in zip(scleras, recorded):
+            sclera.blend_weights = weights
+        body_ends = {
+            id(member): target.points
+            for member, target in zip(creature.body.family_members_with_points(), target_body.family_members_with_points())
+        }
+        end = np.concatenate([body_ends.get(id(member), member.points) for member in self.members])
+        self.start, self.delta = start, end - start
+        self.buffer = start.copy()
+        offsets = np.cumsum([0] + [len(member.points) for member in self.members])
+        for member, first, last in zip(self.members, offsets[:-1], offsets[1:]):
+            member.points = self.buffer[first:last]
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        np.multiply(self.delta, self.rate_func(alpha), out=self.buffer)
+        self.buffer += self.start
+
+    def finish(self) -> None:
+        super().finish()
+        # Hand every part its own point array again
+        for member in self.members:
+            member.points = member.points.copy()
+        if self.rate_func(1) == 1:
+            self.mobject._settle_body(self.new_state_name, self.target_anchor)
+
+class BlendWeights(Animation):
+    """
+    Animates the blendshape weights of a `Sclera`, `Eyes` or `Mouth` towards
+    `target_weights`.
+
+    Every frame writes a linear combination of the precomputed displacement
+    bases straight into the existing point buffers, so no target or starting
+    mobject is ever copied. Weights missing from either side count as zero.
+    """
+    def __init__(self, mobject, target_weights: dict, **kwargs):
+        """
+        Args:
+            mobject: Anything exposing `blend_weights` and `set_blend_weights`.
+            target_weights: The blendshape weights to end at.
+        """
+        self.target_weights = dict(target_weights)
+        super().__init__(mobject, **kwargs)
+
+    def create_starting_mobject(self) -> Mobject:
+        # The start is fully described by the starting weights
+        return self.mobject
+
+    def begin(self) -> None:
+        self.start_weights = dict(self.mobject.blend_weights)
+        self.weight_names = list(dict.fromkeys([*self.start_weights, *self.target_weights]))
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        alpha = self.rate_func(alpha)
+        self.mobject.set_blend_weights({
+            name: interpolate(self.start_weights.get(name, 0.0), self.target_weights.get(name, 0.0), alpha)
+            for name in self.weight_names
+        })
+
+@hashed_by_fingerprint
 class Sclera(VMobject):
-    def __init__(self, width: float = 1.0, height: float = 1.0, **kwargs):
+    def __init__(self, width: float = 1.0, height: float = 1.0, num_arcs: int = 8, **kwargs):
         super().__init__(**kwargs)
         self.width = width
         self.height = height
-        ellipse_template = Circle(radius=1.0).scale(np.array([width / 2, height / 2, 1]))
-        self.set_points(ellipse_template.get_points())
+        self.set_points(circle_points(1.0, num_arcs) * np.array([width / 2, height / 2, 1]))
         self.original_points = self.get_points().copy()
         self.set_fill(WHITE, opacity=1)
         self.set_stroke(BLACK, width=2)
+        # Blendshape state: the current weights and the (lazily built) bases
+        self.blend_weights = {}
+        self.bend_directions = {"bend_" + name: normalize(direction) for name, direction in SCLERA_BEND_DIRECTIONS.items()}
+        self._blend_names = None
+        self._blend_bases = None
 
-    def _get_bend_target(self, direction_vector: np.ndarray, intensity: float) -> 'Sclera':
-        target_points = self.original_points.copy()
-        main_displacement_vector = normalize(-direction_vector)
-        displacement_magnitude = self.height * intensity
-        for i, point in enumerate(self.original_points):
-            if np.linalg.norm(point) < 1e-6: continue
-            point_direction = normalize(point)
-            dot_p = np.clip(np.dot(normalize(direction_vector), point_direction), -1.0, 1.0)
-            angle_diff = np.arccos(dot_p)
-            if angle_diff > PI / 2: falloff_weight = 0.0
-            else:
-                falloff_weight = (np.cos(angle_diff) + 1) / 2 * np.cos(angle_diff)
-                falloff_weight = falloff_weight ** 1.5
-            displacement_for_point = main_displacement_vector * displacement_magnitude * falloff_weight
-            target_points[i] += displacement_for_point
+    def _get_deformed_target(self, target_points: np.ndarray) -> 'Sclera':
         target_sclera = self.copy()
         target_sclera.set_points(target_points)
         target_sclera.move_to(self)
         return target_sclera
 
+    def _get_bend_target(self, direction_vector: np.ndarray, intensity: float) -> 'Sclera':
+        return self.get_bend_targets([self], [direction_vector], intensity)[0]
+
     def get_bend_animation(self, direction_vector: np.ndarray, intensity: float = 0.4) -> Animation:
+        self._record_bend(direction_vector, intensity)
         return Transform(self, self._get_bend_target(direction_vector, intensity))
 
     def _get_squint_target(self, theta: float) -> 'Sclera':
-        target_points = self.original_points.copy()
-        theta = np.clip(theta, 0, PI / 2)
-        max_y = self.height / 2
-        squint_factor = np.sin(theta)
-        for i, point in enumerate(self.original_points):
-            if max_y == 0: continue
-            norm_y = np.abs(point[1]) / max_y
-            falloff_weight = norm_y ** 2
-            displacement_y = -point[1] * falloff_weight * squint_factor
-            target_points[i, 1] += displacement_y
-        target_sclera = self.copy()
-        target_sclera.set_points(target_points)
-        target_sclera.move_to(self)
-        return target_sclera
+        return self.get_squint_targets([self], theta)[0]
 
     def get_squint_animation(self, theta: float) -> Animation:
+        self._record_squint(theta)
         return Transform(self, self._get_squint_target(theta))
 
+    @staticmethod
+    def get_bend_targets(scleras: list, direction_vectors: list, intensity: float = 0.4) -> list:
+        """Bend targets for many scleras, from `SCLERA_DEFORMATION_CACHE` or one batched deformation per sclera size."""
+        points = SCLERA_DEFORMATION_CACHE.get_bend_points(scleras, direction_vectors, [intensity] * len(scleras))
+        return [sclera._get_deformed_target(p) for sclera, p in zip(scleras, points)]
+
+    @staticmethod
+    def get_squint_targets(scleras: list, theta: float) -> list:
+        """Squint targets for many scleras, from `SCLERA_DEFORMATION_CACHE` or one batched deformation per sclera size."""
+        points = SCLERA_DEFORMATION_CACHE.get_squint_points(scleras, [theta] * len(scleras))
+        return [sclera._get_deformed_target(p) for sclera, p in zip(scleras, points)]
+
     def get_reset_animation(self) -> Animation:
+        self.blend_weights = {}
         target_mobject = self.copy()
         target_mobject.set_points(self.original_points)
         target_mobject.move_to(self)
         return Transform(self, target_mobject)
 
+    # --- Blendshapes ---
+    # The bend and squint deformations are linear in their intensity (and in
+    # sin(theta) for the squint), so each one is stored as a per-point
+    # displacement basis and any mix of them is a single weighted sum.
+    def _record_bend(self, direction_vector: np.ndarray, intensity: float) -> None:
+        # The Transform based animations reset from `original_points`, so the
+        # equivalent blend state replaces whatever was there before.
+        self.blend_weights = {self.get_bend_basis_name(direction_vector): intensity}
+
+    def _record_squint(self, theta: float) -> None:
+        self.blend_weights = {"squint": float(np.sin(np.clip(theta, 0, PI / 2)))}
+
+    def get_bend_basis_name(self, direction_vector: np.ndarray) -> str:
+        """
+        Returns the blendshape name for bending towards `direction_vector`,
+        registering a new basis if it is not one of `SCLERA_BEND_DIRECTIONS`.
+        At most `MAX_EXTRA_BEND_DIRECTIONS` such bases are kept: registering
+        another drops the oldest one the current blend weights do not use.
+        """
+        unit_direction = normalize(direction_vector)
+        for name, direction in self.bend_directions.items():
+            if np.allclose(direction, unit_direction):
+                return name
+        extra = list(self.bend_directions)[len(SCLERA_BEND_DIRECTIONS):]
+        unused = [name for name in extra if name not in self.blend_weights]
+        for name in unused[:max(0, len(extra) + 1 - MAX_EXTRA_BEND_DIRECTIONS)]:
+            del self.bend_directions[name]
+        name = "bend_{:+.4f}_{:+.4f}".format(unit_direction[0], unit_direction[1])
+        self.bend_directions[name] = unit_direction
+        return name
+
+    def get_blend_bases(self) -> tuple:
+        """
+        Returns:
+            tuple: (names, bases) where `bases[i]` is the displacement of every
+                   point of `original_points` for a unit weight of `names[i]`.
+        """
+        names = ["squint", *self.bend_directions]
+        if self._blend_names != names or self._blend_bases.shape[1] != len(self.original_points):
+            # Measured on the undeformed outline, so bases stay valid mid-squint
+            rest_height = np.ptp(self.original_points[:, 1])
+            directions = np.array(list(self.bend_directions.values()))
+            bends = bend_deformation(np.broadcast_to(self.original_points, directions.shape[:1] + self.original_points.shape), directions, rest_height, 1.0)
+            squint = squint_deformation(self.original_points, PI / 2, rest_height)
+            self._blend_bases = np.concatenate([squint[None], bends]) - self.original_points
+            self._blend_names = names
+        return self._blend_names, self._blend_bases
+
+    def get_expression_weights(self, squint_amount: float = None, bend_direction: np.ndarray = None, bend_intensity: float = 0.4) -> dict:
+        """Translates `change_state` style squint and bend arguments into blendshape weights."""
+        weights = {}
+        if squint_amount is not None:
+            weights["squint"] = float(np.sin(np.clip(squint_amount, 0, PI / 2)))
+        if bend_direction is not None and np.linalg.norm(bend_direction) > 0:
+            weights[self.get_bend_basis_name(bend_direction)] = bend_intensity
+        return weights
+
+    def set_blend_weights(self, weights: dict) -> 'Sclera':
+        """
+        Sets the outline to `original_points` plus the weighted sum of the
+        blendshape bases, in place and keeping the current center.
+        """
+        names, bases = self.get_blend_bases()
+        coefficients = np.zeros(len(names))
+        for name, weight in weights.items():
+            if name not in names:
+                raise ValueError(f"Unknown sclera blendshape '{name}'.")
+            coefficients[names.index(name)] = weight
+        _write_points(self, self.original_points + np.tensordot(coefficients, bases, axes=1), self.get_center())
+        self.blend_weights = {name: weight for name, weight in weights.items() if weight != 0}
+        return self
+
+    def set_num_arcs(self, num_arcs: int) -> 'Sclera':
+        """Rebuilds the rest outline from `num_arcs` cubic arcs, keeping its size, center and blendshape weights."""
+        size = np.ptp(self.original_points, axis=0)
+        self.original_points = circle_points(1.0, num_arcs) * np.array([size[0] / 2, size[1] / 2, 1])
+        self._blend_names = None
+        return self.set_blend_weights(self.blend_weights)
+
+    def get_fingerprint(self) -> dict:
+        return get_mobject_fingerprint(self, width=self.width, height=self.height, blend_weights=_weights_key(self.blend_weights))
+
+@hashed_by_fingerprint
 class Eye(VGroup):
-    def __init__(self, width: float = 1.0, height: float = 1.0, iris_color: ManimColor = BLUE_C, iris_radius_ratio: float = 0.5, pupil_radius_ratio: float = 0.4, **kwargs):
+    def __init__(self, width: float = 1.0, height: float = 1.0, iris_color: ManimColor = BLUE_C, iris_radius_ratio: float = 0.5, pupil_radius_ratio: float = 0.4, num_arcs: int = 8, **kwargs):
         super().__init__(**kwargs)
         self.eye_width, self.eye_height = width, height
-        self.sclera = Sclera(width=self.eye_width, height=self.eye_height)
+        self.num_arcs = num_arcs
+        self.sclera = Sclera(width=self.eye_width, height=self.eye_height, num_arcs=num_arcs)
+        circle_kwargs = dict(fill_opacity=1, stroke_width=0, num_components=num_arcs + 1)
         iris_radius = (self.eye_height / 2) * iris_radius_ratio
-        self.iris = Circle(radius=iris_radius, color=iris_color, fill_opacity=1, stroke_width=0)
+        self.iris = Circle(radius=iris_radius, color=iris_color, **circle_kwargs)
         pupil_radius = iris_radius * pupil_radius_ratio
-        self.pupil = Circle(radius=pupil_radius, color=BLACK, fill_opacity=1, stroke_width=0)
+        self.pupil = Circle(radius=pupil_radius, color=BLACK, **circle_kwargs)
         highlight_radius = pupil_radius * 0.5
-        self.highlight = Circle(radius=highlight_radius, color=WHITE, fill_opacity=1, stroke_width=0)
+        self.highlight = Circle(radius=highlight_radius, color=WHITE, **circle_kwargs)
         self.highlight.move_to(self.iris.get_center() + (UP + LEFT) * iris_radius * 0.4)
         self.iris_pupil_group = VGroup(self.iris, self.pupil, self.highlight)
         self.sclera.set_z_index(0)
@@ -112,20 +1044,33 @@ class Eye(VGroup):
         self.add(self.sclera, self.iris_pupil_group)
 
     def blink(self, **kwargs) -> Animation: return self.animate(**kwargs, rate_func=there_and_back).scale((1, 0.1, 1))
-    def look_at(self, point_or_mobject, **kwargs) -> Animation:
+    def look_at(self, point_or_mobject, **kwargs) -> Animation: return self.iris_pupil_group.animate(**kwargs).move_to(self.get_gaze_position(point_or_mobject))
+    def set_gaze(self, point_or_mobject) -> 'Eye':
+        self.iris_pupil_group.move_to(self.get_gaze_position(point_or_mobject))
+        return self
+    def get_gaze_position(self, point_or_mobject) -> np.ndarray:
+        """Where the iris sits when looking at `point_or_mobject`: at the edge of the sclera, or centered if the target is the eye itself."""
         target_point = point_or_mobject.get_center() if isinstance(point_or_mobject, Mobject) else point_or_mobject
         direction = target_point - self.sclera.get_center()
-        if np.linalg.norm(direction) == 0: return self.iris_pupil_group.animate.move_to(self.sclera.get_center())
+        if np.linalg.norm(direction) == 0: return self.sclera.get_center()
         unit_direction = normalize(direction)
         max_offset = (self.sclera.height / 2) - self.iris.radius
-        new_position = self.sclera.get_center() + unit_direction * max_offset
-        return self.iris_pupil_group.animate(**kwargs).move_to(new_position)
+        return self.sclera.get_center() + unit_direction * max_offset
 
     def bend_sclera(self, direction_vector: np.ndarray, intensity: float = 0.4) -> Animation: return self.sclera.get_bend_animation(direction_vector, intensity)
     def reset_sclera(self) -> Animation: return self.sclera.get_reset_animation()
     def squint(self, theta: float, **kwargs) -> Animation: return self.sclera.get_squint_animation(theta)
     def reset_squint(self, **kwargs) -> Animation: return self.sclera.get_reset_animation()
+    def set_num_arcs(self, num_arcs: int) -> 'Eye':
+        """Rebuilds the sclera and the iris circles from `num_arcs` cubic arcs, in place and keeping their pose."""
+        self.num_arcs = num_arcs
+        self.sclera.set_num_arcs(num_arcs)
+        for circle in (self.iris, self.pupil, self.highlight):
+            circle.set_points(circle_points(circle.radius, num_arcs) + circle.get_center())
+        return self
+    def get_fingerprint(self) -> dict: return get_mobject_fingerprint(self, width=self.eye_width, height=self.eye_height, iris_radius=self.iris.radius)
 
+@hashed_by_fingerprint
 class Eyes(VGroup):
     def __init__(self, separation: float=1.5, eye_width: float=1.0, eye_height: float=1.0, **eye_kwargs):
         super().__init__()
@@ -134,73 +1079,508 @@ class Eyes(VGroup):
         self.left_eye.move_to(LEFT * separation / 2)
         self.right_eye.move_to(RIGHT * separation / 2)
         self.add(self.left_eye, self.right_eye)
+        self.gaze_tracker = None
     
     def blink(self, **kwargs) -> AnimationGroup: return AnimationGroup(self.left_eye.blink(**kwargs), self.right_eye.blink(**kwargs))
     def look_at(self, target, **kwargs) -> AnimationGroup: return AnimationGroup(self.left_eye.look_at(target, **kwargs), self.right_eye.look_at(target, **kwargs))
     def look_straight(self, **kwargs) -> AnimationGroup: return AnimationGroup(self.left_eye.look_at(self.left_eye.get_center(), **kwargs), self.right_eye.look_at(self.right_eye.get_center(), **kwargs))
     def bend_sclera(self, direction_vector: np.ndarray, intensity: float = 0.4) -> AnimationGroup:
         mirrored_direction = direction_vector * np.array([-1, 1, 1])
-        return AnimationGroup(self.left_eye.bend_sclera(direction_vector, intensity=intensity), self.right_eye.bend_sclera(mirrored_direction, intensity=intensity))
+        scleras = [self.left_eye.sclera, self.right_eye.sclera]
+        targets = Sclera.get_bend_targets(scleras, [direction_vector, mirrored_direction], intensity=intensity)
+        for sclera, direction in zip(scleras, [direction_vector, mirrored_direction]):
+            sclera._record_bend(direction, intensity)
+        return AnimationGroup(*(Transform(sclera, target) for sclera, target in zip(scleras, targets)))
     def reset_sclera(self) -> AnimationGroup: return AnimationGroup(self.left_eye.reset_sclera(), self.right_eye.reset_sclera())
-    def squint(self, theta: float, **kwargs) -> AnimationGroup: return AnimationGroup(self.left_eye.squint(theta, **kwargs), self.right_eye.squint(theta, **kwargs))
+    def squint(self, theta: float, **kwargs) -> AnimationGroup:
+        scleras = [self.left_eye.sclera, self.right_eye.sclera]
+        targets = Sclera.get_squint_targets(scleras, theta)
+        for sclera in scleras:
+            sclera._record_squint(theta)
+        return AnimationGroup(*(Transform(sclera, target) for sclera, target in zip(scleras, targets)))
     def reset_squint(self, **kwargs) -> AnimationGroup: return AnimationGroup(self.left_eye.reset_squint(**kwargs), self.right_eye.reset_squint(**kwargs))
+    def track(self, target, smoothing: float = 0.0, lag: float = 0.0) -> 'Eyes':
+        """Keeps looking at `target` every frame; see `GazeTracker`. Returns self."""
+        self.stop_tracking()
+        self.gaze_tracker = GazeTracker(target, smoothing, lag)
+        self.add_updater(self.gaze_tracker)
+        return self
+    def stop_tracking(self) -> 'Eyes':
+        if self.gaze_tracker is not None:
+            self.remove_updater(self.gaze_tracker)
+            self.gaze_tracker = None
+        return self
+
+    # --- Blendshapes (weights are expressed for the left eye; the right eye mirrors them) ---
+    @property
+    def blend_weights(self) -> dict: return self.left_eye.sclera.blend_weights
+    def _mirror_blend_name(self, name: str) -> str:
+        if name not in self.left_eye.sclera.bend_directions: return name
+        mirrored_direction = self.left_eye.sclera.bend_directions[name] * np.array([-1, 1, 1])
+        return self.right_eye.sclera.get_bend_basis_name(mirrored_direction)
+    def get_expression_weights(self, squint_amount: float = None, bend_direction: np.ndarray = None, bend_intensity: float = 0.4) -> dict:
+        return self.left_eye.sclera.get_expression_weights(squint_amount, bend_direction, bend_intensity)
+    def set_blend_weights(self, weights: dict) -> 'Eyes':
+        self.left_eye.sclera.set_blend_weights(weights)
+        self.right_eye.sclera.set_blend_weights({self._mirror_blend_name(name): weight for name, weight in weights.items()})
+        return self
+    def blend_to(self, weights: dict, **kwargs) -> BlendWeights: return BlendWeights(self, weights, **kwargs)
+    def get_fingerprint(self) -> dict: return get_mobject_fingerprint(self, blend_weights=_weights_key(self.blend_weights))
+
+# ====================================================================
+#  Mouth Class
+# ====================================================================
+@hashed_by_fingerprint
+class Mouth(VGroup):
+    # The neutral curve's (start, handle1, handle2, end) points, in units of `width`
+    NEUTRAL_CONTROL_POINTS = np.array([[-1 / 2, 0, 0], [-1 / 4, 0, 0], [1 / 4, 0, 0], [1 / 2, 0, 0]])
+    # Offsets of each emotion's control points from the neutral curve, in units
+    # of `emotion_intensity`. Row i of EMOTION_OFFSETS belongs to EMOTION_NAMES[i].
+    EMOTION_NAMES = ["neutral", "happy", "sad", "unsure", "happy_smirk", "sad_smirk"]
+    EMOTION_OFFSETS = np.array([
+        [[0, 0, 0], [0, 0, 0], [0, 0, 0], [0, 0, 0]],          # neutral
+        [[0, 0, 0], [0, -1, 0], [0, -1, 0], [0, 0, 0]],        # happy
+        [[0, 0, 0], [0, 1, 0], [0, 1, 0], [0, 0, 0]],          # sad
+        [[0, 0, 0], [0, 0.4, 0], [0, -0.7, 0], [0, 0, 0]],     # unsure
+        [[0, 0.8, 0], [-0.4, 0, 0], [0, -0.7, 0], [0, -0.8, 0]],  # happy_smirk
+        [[0, -0.8, 0], [-0.4, 0, 0], [0, 0.5, 0], [0, 0.4, 0]],   # sad_smirk
+    ], dtype=float)
+
+    def __init__(
+        self,
+        emotion: str = "neutral",
+        width: float = 0.01,
+        emotion_intensity: float = 0.1,
+        **kwargs
+    ):
+        super().__init__()
+        self.emotion = emotion
+        self.width = width
+        self.curve_width = width
+        self.emotion_intensity = emotion_intensity
+        self.bezier_kwargs = kwargs.copy()
+        if "color" not in kwargs:
+            kwargs["color"] = BLACK
+        if "stroke_width" not in kwargs:
+            kwargs["stroke_width"] = 2
+        self.blend_weights = {emotion: 1.0}
+        mouth_curve = CubicBezier(*self.get_control_points(self.blend_weights), **kwargs)
+        self.add(mouth_curve)
+
+    @classmethod
+    def register_emotion(cls, name: str, offsets: np.ndarray) -> None:
+        """
+        Adds a new emotion, or replaces an existing one, for every mouth.
+
+        Args:
+            name: The emotion name, usable wherever built-in emotions are.
+            offsets: (4, 3) offsets of the (start, handle1, handle2, end) points
+                     from the neutral curve, in units of `emotion_intensity`.
+        """
+        offsets = np.asarray(offsets, dtype=float).reshape(1, 4, 3)
+        if name in cls.EMOTION_NAMES:
+            table = cls.EMOTION_OFFSETS.copy()
+            table[cls.EMOTION_NAMES.index(name)] = offsets[0]
+            cls.EMOTION_OFFSETS = table
+        else:
+            cls.EMOTION_NAMES = [*cls.EMOTION_NAMES, name]
+            cls.EMOTION_OFFSETS = np.concatenate([cls.EMOTION_OFFSETS, offsets])
+
+    @classmethod
+    def get_emotion_vector(cls, weights: dict) -> np.ndarray:
+        """Turns {emotion: weight} into a weight per row of EMOTION_OFFSETS. Unknown emotions count as neutral."""
+        vector = np.zeros(len(cls.EMOTION_NAMES))
+        for emotion, weight in weights.items():
+            if emotion in cls.EMOTION_NAMES:
+                vector[cls.EMOTION_NAMES.index(emotion)] += weight
+        return vector
+
+    def get_control_points(self, weights: dict) -> np.ndarray:
+        """The origin-centered (start, handle1, handle2, end) points for a weighted mix of emotions."""
+        offsets = np.tensordot(self.get_emotion_vector(weights), self.EMOTION_OFFSETS, axes=1)
+        return self.NEUTRAL_CONTROL_POINTS * self.curve_width + offsets * self.emotion_intensity
+
+    def set_blend_weights(self, weights: dict) -> 'Mouth':
+        """Reshapes the existing mouth curve in place to a weighted mix of emotions, keeping its center."""
+        _write_points(self.submobjects[0], self.get_control_points(weights), self.get_center())
+        self.blend_weights = {emotion: weight for emotion, weight in weights.items() if weight != 0}
+        return self
+
+    def set_control_offsets(self, offsets: np.ndarray) -> 'Mouth':
+        """
+        Reshapes the curve in place to the current blend of emotions plus
+        `offsets`, keeping its center. `blend_weights` is left alone, so the
+        next call (or `set_blend_weights`) starts from the same expression.
+
+        Args:
+            offsets: (4, 3) offsets of the (start, handle1, handle2, end) points, in units of `emotion_intensity`.
+        """
+        points = self.get_control_points(self.blend_weights) + np.asarray(offsets) * self.emotion_intensity
+        _write_points(self.submobjects[0], points, self.get_center())
+        return self
+
+    def set_emotion(self, emotion: str) -> 'Mouth':
+        self.emotion = emotion
+        return self.set_blend_weights({emotion: 1.0})
+
+    def blend_to(self, weights: dict, **kwargs) -> BlendWeights: return BlendWeights(self, weights, **kwargs)
+
+    def get_fingerprint(self) -> dict:
+        return get_mobject_fingerprint(
+            self,
+            blend_weights=_weights_key(self.blend_weights),
+            width=self.curve_width,
+            emotion_intensity=self.emotion_intensity,
+        )
+
+# ====================================================================
+#  Idle Behaviour
+# ====================================================================
+class IdleSchedule:
+    """
+    A seeded, precomputed timeline of blinks, eye saccades and breathing for
+    one or more creatures. `evaluate` turns a scene time into a pose with a
+    few vectorized lookups, so a whole crowd is posed at once.
+    """
+    def __init__(
+        self,
+        count: int = 1,
+        seed: int = None,
+        duration: float = 60.0,
+        blink_interval: tuple = (2.0, 6.0),
+        blink_duration: float = 0.2,
+        saccade_interval: tuple = (0.5, 2.5),
+        saccade_duration: float = 0.06,
+        saccade_amplitude: float = 0.3,
+        breath_period: float = 4.0,
+        breath_amplitude: float = 0.01,
+    ):
+        """
+        Args:
+            count (int, optional): The number of creatures to schedule.
+            seed (int, optional): Seeds the schedule, so renders are reproducible.
+            duration (float, optional): Seconds of blinks and saccades to precompute; the schedule then repeats seamlessly.
+            blink_interval (tuple, optional): (min, max) seconds between blinks.
+            blink_duration (float, optional): Seconds a blink takes.
+            saccade_interval (tuple, optional): (min, max) seconds between saccades.
+            saccade_duration (float, optional): Seconds a saccade takes.
+            saccade_amplitude (float, optional): The largest saccade, as a fraction of the gaze range.
+            breath_period (float, optional): Seconds per breath.
+            breath_amplitude (float, optional): Relative size change at the peak of a breath.
+        """
+        rng = np.random.default_rng(seed)
+        self.count, self.duration = count, duration
+        self.blink_duration, self.saccade_duration = blink_duration, saccade_duration
+        self.breath_period, self.breath_amplitude = breath_period, breath_amplitude
+        self.blink_starts = self._event_times(rng, blink_interval)
+        self.saccade_starts = self._event_times(rng, saccade_interval)
+        # Gaze offsets per saccade, uniform over a disc; column 0 is the resting gaze
+        angles = rng.uniform(0, TAU, self.saccade_starts.shape)
+        radii = saccade_amplitude * np.sqrt(rng.uniform(0, 1, self.saccade_starts.shape))
+        self.saccade_targets = np.zeros((count, self.saccade_starts.shape[1] + 1, 3))
+        self.saccade_targets[:, 1:, 0] = radii * np.cos(angles)
+        self.saccade_targets[:, 1:, 1] = radii * np.sin(angles)
+        # No event runs past `duration`, and the last saccade returns to the resting
+        # gaze, so the schedule wraps around without a jump
+        self.blink_starts[self.blink_starts > duration - blink_duration] = np.inf
+        self.saccade_starts[self.saccade_starts > duration - saccade_duration] = np.inf
+        self.saccade_targets[np.arange(count), np.isfinite(self.saccade_starts).sum(axis=1)] = 0
+        self.breath_phases = rng.uniform(0, TAU, count)
+
+    def _event_times(self, rng, interval: tuple) -> np.ndarray:
+        """(count, K) sorted event times covering `duration` seconds."""
+        events = int(np.ceil(self.duration / interval[0])) + 1
+        return np.cumsum(rng.uniform(*interval, (self.count, events)), axis=1)
+
+    def evaluate(self, t: float) -> tuple:
+        """
+        Returns:
+            tuple: (breath (count,) body scale factors, blink (count,) vertical eye
+                scale factors, saccade (count, 3) gaze offsets as fractions of the gaze range)
+        """
+        rows = np.arange(self.count)
+        breath = 1 + self.breath_amplitude * np.sin(TAU * t / self.breath_period + self.breath_phases)
+        t = t % self.duration
+
+        last_blink = np.sum(self.blink_starts <= t, axis=1) - 1
+        since_blink = t - np.where(last_blink >= 0, self.blink_starts[rows, np.maximum(last_blink, 0)], -np.inf)
+        closed = np.sin(PI * np.clip(since_blink / self.blink_duration, 0, 1)) ** 2
+        blink = 1 - 0.9 * closed
+
+        last_saccade = np.sum(self.saccade_starts <= t, axis=1) - 1
+        since_saccade = t - np.where(last_saccade >= 0, self.saccade_starts[rows, np.maximum(last_saccade, 0)], -np.inf)
+        progress = np.clip(since_saccade / self.saccade_duration, 0, 1)[:, None]
+        previous = self.saccade_targets[rows, np.maximum(last_saccade, 0)]
+        current = self.saccade_targets[rows, last_saccade + 1]
+        saccade = previous + (current - previous) * progress ** 2 * (3 - 2 * progress)
+        return breath, blink, saccade
+
+@hashed_by_fingerprint
+class IdleBehaviour:
+    """
+    The single updater behind `start_idle`: advances its own clock by the
+    scene's dt and hands the scheduled pose to `mobject.apply_idle_pose`.
+    """
+    def __init__(self, schedule: IdleSchedule):
+        self.schedule = schedule
+        self.time = 0.0
+
+    def __call__(self, mobject: Mobject, dt: float) -> None:
+        self.time += dt
+        mobject.apply_idle_pose(*self.schedule.evaluate(self.time))
+
+    def get_fingerprint(self) -> dict:
+        """The idle clock and a digest of the schedule, which together fix every idle frame to come."""
+        schedule = self.schedule
+        digest = 0
+        for array in (schedule.blink_starts, schedule.saccade_starts, schedule.saccade_targets, schedule.breath_phases):
+            digest = zlib.crc32(np.ascontiguousarray(array), digest)
+        timing = [schedule.duration, schedule.blink_duration, schedule.saccade_duration, schedule.breath_period, schedule.breath_amplitude]
+        return {"class": type(self).__name__, "time": self.time, "timing": timing, "digest": digest}
+
+def _settles_idle(method):
+    """Makes a creature animation builder restore the idle rest pose first, so no animation starts from an idle frame."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._settle_idle()
+        return method(self, *args, **kwargs)
+    return wrapper
+
+# ====================================================================
+#  Gaze Tracking
+# ====================================================================
+def _resolve_gaze_target(target) -> np.ndarray:
+    """A point (or points) from a Mobject, a list of Mobjects, a function returning either, or points."""
+    if isinstance(target, Mobject):
+        return target.get_center()
+    if callable(target):
+        return _resolve_gaze_target(target())
+    if isinstance(target, (list, tuple)) and len(target) and isinstance(target[0], Mobject):
+        return np.array([mobject.get_center() for mobject in target])
+    return np.asarray(target, dtype=float)
+
+class GazeTracker:
+    """
+    The single updater behind `track`: keeps the irises of a pair of `Eyes`
+    pointed at a moving target, at a few vector operations per eye and frame.
+    Attach it to the creature rather than its eyes (as `PsiCreature.track`
+    does) so it keeps running while the eyes themselves are animated.
+    """
+    def __init__(self, target, smoothing: float = 0.0, lag: float = 0.0):
+        """
+        Args:
+            target: A Mobject, a point, or a function returning either (called every frame).
+            smoothing (float, optional): Time constant, in seconds, of the eyes
+                easing towards the target (0 snaps to it every frame).
+            lag (float, optional): Seconds before the eyes react to the target's movement.
+        """
+        self.target, self.smoothing, self.lag = target, smoothing, lag
+        self.time = 0.0
+        self.history = deque()
+        # Current iris offsets from the sclera centers, set on the first frame
+        self.offsets = None
+
+    def __deepcopy__(self, memo: dict) -> "GazeTracker":
+        # Copies of a creature track the same target, not a copy of it
+        clone = copy.copy(self)
+        clone.history = deque(self.history)
+        clone.offsets = None if self.offsets is None else self.offsets.copy()
+        return clone
+
+    def observe(self, dt: float) -> np.ndarray:
+        """Advances the clock and returns where the target was `lag` seconds ago."""
+        self.time += dt
+        point = _resolve_gaze_target(self.target)
+        if self.lag <= 0:
+            return point
+        self.history.append((self.time, point))
+        while len(self.history) > 1 and self.history[1][0] <= self.time - self.lag:
+            self.history.popleft()
+        return self.history[0][1]
+
+    def follow(self, desired: np.ndarray, dt: float) -> np.ndarray:
+        """Moves `offsets` towards `desired`, smoothed, and returns them."""
+        if self.offsets is None or self.smoothing <= 0:
+            self.offsets = np.array(desired, dtype=float)
+        else:
+            self.offsets += (desired - self.offsets) * (1 - np.exp(-dt / self.smoothing))
+        return self.offsets
+
+    def __call__(self, mobject: Mobject, dt: float) -> None:
+        eyes = getattr(mobject, "eyes", mobject)
+        pair = (eyes.left_eye, eyes.right_eye)
+        centers = np.array([_anchor_center(eye.sclera.points) for eye in pair])
+        irises = np.array([_anchor_center(eye.iris.points) for eye in pair])
+        if self.offsets is None:
+            self.offsets = irises - centers
+        # The gaze range of the unsquinted eye, as in `apply_idle_pose`
+        max_offsets = np.array([[eye.eye_height / 2 - eye.iris.radius] for eye in pair])
+        directions = self.observe(dt) - centers
+        norms = np.linalg.norm(directions, axis=1, keepdims=True)
+        desired = np.divide(directions, norms, out=np.zeros_like(directions), where=norms > 0) * max_offsets
+        offsets = self.follow(desired, dt)
+        for eye, shift in zip(pair, centers + offsets - irises):
+            eye.iris_pupil_group.shift(shift)
+
+class CrowdGazeTracker(GazeTracker):
+    """`GazeTracker` for a `CreatureCrowd`: every selected creature's gaze in one vectorized step."""
+    def __init__(self, target, indices=None, smoothing: float = 0.0, lag: float = 0.0):
+        """
+        Args:
+            target: As for `CreatureCrowd.look_at`, or a function returning such a target.
+            indices (optional): The creatures that track (default: all).
+            smoothing, lag (float, optional): As for `GazeTracker`.
+        """
+        super().__init__(target, smoothing, lag)
+        self.indices = indices
+
+    def __call__(self, crowd: "CreatureCrowd", dt: float) -> None:
+        selection = crowd._select(self.indices)
+        if self.offsets is None:
+            self.offsets = crowd.iris_offsets[selection].copy()
+        crowd.iris_offsets[selection] = self.follow(crowd._get_gaze_offsets(self.observe(dt))[selection], dt)
+        crowd._compose(dict(crowd._display_arrays, iris_offsets=crowd.iris_offsets.copy()))
+
+# ====================================================================
+#  Shared Creature Assets
+# ====================================================================
+class CreatureAssets:
+    """
+    The read-only reference data of every creature drawn from the same assets
+    at the same color and size: a body template per state and its layout
+    (anchor vector, eyes and mouth offsets).
+
+    One instance is shared by all such creatures, and copying returns the
+    same instance, so `copy()`, `.animate`, `Transform` and `Become` targets
+    only duplicate a creature's visible parts. States load on first use.
+    Templates have read-only points; bodies are built from copies of them,
+    simplified to `path_tolerance` (see `DETAIL_LEVELS`).
+    """
+    # Live instances, keyed by `make_key`; an entry goes away with its last creature
+    _instances = weakref.WeakValueDictionary()
+
+    def __init__(self, assets_dir: str, body_color: ManimColor, body_scale: float, eye_height: float, path_tolerance: float = 0.0):
+        """
+        Args:
+            assets_dir: The directory holding the state SVGs.
+            body_color: The body color of the templates.
+            body_scale: The template height, as `PsiCreature.body_scale`.
+            eye_height: The *unscaled* eye height, as for `PsiCreature`.
+            path_tolerance (optional): How far, in scene units, simplified
+                template paths may stray from the SVG's (0 keeps them exact).
+        """
+        self.assets_dir = assets_dir
+        self.body_color, self.body_scale, self.eye_height = body_color, body_scale, eye_height
+        self.path_tolerance = path_tolerance
+        self.state_paths = MappingProxyType({
+            os.path.splitext(filename)[0]: os.path.join(assets_dir, filename)
+            for filename in sorted(os.listdir(assets_dir))
+            if filename.endswith(".svg")
+        })
+        self._templates, self._anchor_vectors, self._eyes_offsets, self._mouth_offsets = {}, {}, {}, {}
+        # Read-only views of the loaded states
+        self.templates = MappingProxyType(self._templates)
+        self.anchor_vectors = MappingProxyType(self._anchor_vectors)
+        self.eyes_offsets = MappingProxyType(self._eyes_offsets)
+        self.mouth_offsets = MappingProxyType(self._mouth_offsets)
+        # (start, end, start_shift, end_shift) per ordered pair of states; see `get_body_pair`
+        self._body_pairs = {}
+
+    @staticmethod
+    def make_key(assets_dir: str, body_color: ManimColor, body_scale: float, eye_height: float, path_tolerance: float = 0.0) -> tuple:
+        # Like `TemplateCache`, editing, adding or removing an SVG makes a new key
+        sources = tuple(
+            (entry.name, entry.stat().st_mtime_ns)
+            for entry in os.scandir(assets_dir) if entry.name.endswith(".svg")
+        )
+        return (
+            os.path.abspath(assets_dir), sources, ManimColor(body_color).to_hex(),
+            float(body_scale), float(eye_height), float(path_tolerance),
+        )
+
+    @classmethod
+    def get(cls, assets_dir: str, body_color: ManimColor, body_scale: float, eye_height: float, path_tolerance: float = 0.0) -> "CreatureAssets":
+        """Returns the shared instance for these parameters, creating it if no live creature uses one."""
+        key = cls.make_key(assets_dir, body_color, body_scale, eye_height, path_tolerance)
+        assets = cls._instances.get(key)
+        if assets is None:
+            assets = cls(assets_dir, body_color, body_scale, eye_height, path_tolerance)
+            cls._instances[key] = assets
+        return assets
+
+    def load(self, state: str) -> None:
+        """Fetches the template and the layout of `state`, once."""
+        if state in self._templates:
+            return
+        template = SVG_TEMPLATE_CACHE.get(self.state_paths[state], self.body_color, self.body_scale, self.path_tolerance)
+        layout = PsiCreature.layout_for(state, self.body_scale, self.eye_height, self.assets_dir, self.body_color)
+        self._add_state(state, template, layout["anchor_vector"], layout["eyes_offset"], layout["mouth_offset"])
+
+    def _add_state(self, state: str, template: Mobject, anchor_vector, eyes_offset, mouth_offset) -> None:
+        for member in template.get_family():
+            # Parsed SVG paths are only needed to build a template; dropping them keeps body copies cheap
+            vars(member).pop("path_obj", None)
+            member.points.setflags(write=False)
+        self._templates[state] = template
+        for table, offset in ((self._anchor_vectors, anchor_vector), (self._eyes_offsets, eyes_offset), (self._mouth_offsets, mouth_offset)):
+            offset = np.array(offset, dtype=float)
+            offset.setflags(write=False)
+            table[state] = offset
 
-# ====================================================================
-#  Mouth Class
-# ====================================================================
-class Mouth(VGroup):
-    def __init__(
-        self,
-        emotion: str = "neutral",
-        width: float = 0.01,
-        emotion_intensity: float = 0.1,
-        **kwargs
-    ):
-        super().__init__()
-        self.emotion = emotion
-        self.width = width
-        self.emotion_intensity = emotion_intensity
-        self.bezier_kwargs = kwargs.copy()
-        if "color" not in kwargs:
-            kwargs["color"] = BLACK
-        if "stroke_width" not in kwargs:
-            kwargs["stroke_width"] = 2
-        start_point = LEFT * width / 2
-        end_point = RIGHT * width / 2
-        handle_base_1 = LEFT * width / 4
-        handle_base_2 = RIGHT * width / 4
-        if emotion == "happy":
-            handle1 = handle_base_1 + DOWN * emotion_intensity
-            handle2 = handle_base_2 + DOWN * emotion_intensity
-        elif emotion == "sad":
-            handle1 = handle_base_1 + UP * emotion_intensity
-            handle2 = handle_base_2 + UP * emotion_intensity
-        elif emotion == "unsure":
-            handle1 = handle_base_1 + UP * emotion_intensity * 0.4
-            handle2 = handle_base_2 + DOWN * emotion_intensity * 0.7
-        elif emotion == "neutral":
-            handle1 = handle_base_1
-            handle2 = handle_base_2
-        elif emotion == "happy_smirk":
-            handle1 = handle_base_1 + LEFT * emotion_intensity * 0.4
-            handle2 = handle_base_2 + DOWN * emotion_intensity * 0.7
-            start_point += 0.08*UP
-            end_point += 0.08*DOWN
-        elif emotion == "sad_smirk":
-            handle1 = handle_base_1 - RIGHT * emotion_intensity * 0.4
-            handle2 = handle_base_2 - DOWN * emotion_intensity * 0.5
-            start_point += 0.08*DOWN
-            end_point += 0.04*UP
-        else: # Default to neutral
-            handle1 = handle_base_1
-            handle2 = handle_base_2
-        mouth_curve = CubicBezier(start_point, handle1, handle2, end_point, **kwargs)
-        self.add(mouth_curve)
+    def get_body_pair(self, from_state: str, to_state: str) -> tuple:
+        """
+        The templates of `from_state` and `to_state` aligned with each other
+        (same submobjects, same point counts), aligned once per ordered pair.
+        Their points are read-only, and like the templates they carry no parsed
+        SVG paths, so copying them is cheap.
+
+        Returns:
+            tuple: (start, end, start_shift, end_shift); adding an anchor
+                position to a shift gives the translation that puts the body
+                where `PsiCreature` places that state's body for the anchor.
+        """
+        pair = self._body_pairs.get((from_state, to_state))
+        if pair is None:
+            self.load(from_state)
+            self.load(to_state)
+            start, end = self._templates[from_state].copy(), self._templates[to_state].copy()
+            start.align_data(end)
+            for member in [*start.get_family(), *end.get_family()]:
+                member.points.setflags(write=False)
+            shifts = [-self._anchor_vectors[state] - self._templates[state].get_center() for state in (from_state, to_state)]
+            pair = self._body_pairs[(from_state, to_state)] = (start, end, *shifts)
+        return pair
+
+    def scaled(self, scale_factor: float, path_tolerance: float = None) -> "CreatureAssets":
+        """
+        The shared instance at `scale_factor` times the size. Unless a live one
+        already exists, its loaded states are this instance's, scaled, or,
+        given a new `path_tolerance`, load again on first use.
+        """
+        body_scale = self.body_scale * scale_factor
+        rescaled = path_tolerance is None
+        if rescaled:
+            path_tolerance = self.path_tolerance * scale_factor
+        key = self.make_key(self.assets_dir, self.body_color, body_scale, self.eye_height, path_tolerance)
+        assets = self._instances.get(key)
+        if assets is None:
+            assets = CreatureAssets(self.assets_dir, self.body_color, body_scale, self.eye_height, path_tolerance)
+            for state, template in (self._templates.items() if rescaled else ()):
+                assets._add_state(
+                    state, template.copy().scale(scale_factor), self._anchor_vectors[state] * scale_factor,
+                    self._eyes_offsets[state] * scale_factor, self._mouth_offsets[state] * scale_factor,
+                )
+            self._instances[key] = assets
+        return assets
+
+    def __copy__(self) -> "CreatureAssets": return self
+    def __deepcopy__(self, memo: dict) -> "CreatureAssets": return self
 
 # ====================================================================
 #  PsiCreature CLASS - FULLY CORRECTED AND IMPROVED
 # ====================================================================
 
+@hashed_by_fingerprint
 class PsiCreature(VGroup):
     def __init__(
         self,
@@ -216,38 +1596,31 @@ class PsiCreature(VGroup):
         mouth_width: float = 0.25,
         mouth_emotion_intensity: float = 0.1,
         mouth_kwargs: dict = None,
+        detail_level: int = None,
+        frame: Mobject = None,
         **kwargs
     ):
         super().__init__(**kwargs)
+        # Geometry detail follows the on-screen size (and resizes) unless a level is given;
+        # `frame` is the camera frame the creature is seen through (default: the configured one)
+        if detail_level is not None and not 0 <= detail_level < len(DETAIL_LEVELS):
+            raise ValueError(f"detail_level must be between 0 and {len(DETAIL_LEVELS) - 1}.")
+        self.auto_detail = detail_level is None
+        self.detail_level = detail_level_for(body_scale, frame) if detail_level is None else detail_level
+
         # Store key *unscaled* creation parameters for resizing
         self.body_scale = body_scale
         self.eye_color = eye_color
+        self.eye_height = eye_height
         self.mouth_width = mouth_width
         self.mouth_emotion_intensity = mouth_emotion_intensity
         self.mouth_kwargs = mouth_kwargs or {}
 
-        # assets directory:
-        self.templates = {}
-        assets_dir = "assets"
-        for filename in os.listdir(assets_dir):
-            # Check if the file is an SVG file
-            if filename.endswith(".svg"):
-                # Construct the full path to the SVG file
-                svg_path = os.path.join(assets_dir, filename)
-
-                # Get the template name by removing the extension
-                template_name = os.path.splitext(filename)[0]
-
-                # Create the SVGMobject and add it to the dictionary
-                self.templates[template_name] = SVGMobject(svg_path).set_color(body_color)
-
-        for template in self.templates.values():
-            template.set_height(self.body_scale)
-
-        self.anchor_vectors = {
-            state: template.submobjects[-1].get_center()
-            for state, template in self.templates.items()
-        }
+        # Templates, anchors and offsets live in assets shared with every
+        # creature of this color and size, and load on first use
+        self.body_color = body_color
+        self.assets_dir = "assets"
+        self.assets = CreatureAssets.get(self.assets_dir, body_color, body_scale, eye_height, get_path_tolerance(self.detail_level, frame))
 
         # --- THIS IS THE CENTRAL SCALING LOGIC ---
         default_body_scale = 2.0
@@ -270,7 +1643,8 @@ class PsiCreature(VGroup):
             separation=scaled_eyes_separation,
             eye_width=scaled_eye_width,
             eye_height=scaled_eye_height,
-            iris_color=self.eye_color
+            iris_color=self.eye_color,
+            num_arcs=DETAIL_LEVELS[self.detail_level][1],
         )
         self.mouth = Mouth(
             emotion=initial_emotion,
@@ -279,34 +1653,157 @@ class PsiCreature(VGroup):
             **final_mouth_kwargs
         )
         
-        self.eyes_offsets = {}
-        self.mouth_offsets = {}
-        for state, template in self.templates.items():
-            stable_x = self.anchor_vectors[state][0]
-            target_y_eyes = template.get_top()[1] - (self.eyes.get_height() * 0.9)
-            eyes_center_in_template = np.array([stable_x, target_y_eyes, 0])
-            self.eyes_offsets[state] = eyes_center_in_template - self.anchor_vectors[state]
-            target_y_mouth = self.anchor_vectors[state][1] + (self.body_scale * 0.2)
-            mouth_center_in_template = np.array([stable_x, target_y_mouth, 0])
-            self.mouth_offsets[state] = mouth_center_in_template - self.anchor_vectors[state]
-
-        if initial_state not in self.templates:
+        if initial_state not in self.state_paths:
             raise ValueError(f"Initial state '{initial_state}' is not valid.")
         self.current_state_name = initial_state
         self.anchor_pos = initial_anchor_pos
 
+        # Idle behaviour (see `start_idle`): part id -> [part, rest points, last written points]
+        self.idle = None
+        self._idle_parts = {}
+        self.gaze_tracker = None
+
         self.body = self._create_body_at_anchor(self.current_state_name, self.anchor_pos)
         self.eyes.move_to(self.anchor_pos + self.eyes_offsets[self.current_state_name])
         self.mouth.move_to(self.anchor_pos + self.mouth_offsets[self.current_state_name])
         self.add(self.body, self.eyes, self.mouth)
 
+    # Layouts shared by every creature, keyed by (svg path, mtime, body_scale, eye_height)
+    _layouts = {}
+
+    @classmethod
+    def layout_for(cls, state: str, body_scale: float = 2.0, eye_height: float = 0.3, assets_dir: str = "assets", body_color: ManimColor = BLUE_E) -> dict:
+        """
+        Returns where the parts of a creature in `state` sit relative to its
+        anchor, without building a creature. Layouts are computed once per
+        set of parameters and shared by all creatures, so treat the returned
+        arrays as read-only.
+
+        Args:
+            state (str): The body state (e.g., "pondering").
+            body_scale (float, optional): As for `PsiCreature`.
+            eye_height (float, optional): The *unscaled* eye height, as for `PsiCreature`.
+            assets_dir (str, optional): The directory holding the state SVGs.
+            body_color (ManimColor, optional): The color of the caller's creature. The
+                layout does not depend on it, but a template of that color is likely
+                cached already, so none is parsed just to measure it.
+
+        Returns:
+            dict: "anchor_vector" (anchor relative to the body's center), "eyes_offset"
+                and "mouth_offset" (centers relative to the anchor) and "top_offset"
+                (the top of the body relative to the anchor).
+        """
+        svg_path = os.path.join(assets_dir, f"{state}.svg")
+        if not os.path.isfile(svg_path):
+            raise ValueError(f"'{state}' is not a valid state.")
+        key = (os.path.abspath(svg_path), os.path.getmtime(svg_path), float(body_scale), float(eye_height))
+        layout = cls._layouts.get(key)
+        if layout is None:
+            template = SVG_TEMPLATE_CACHE.get(svg_path, body_color, body_scale)
+            anchor_vector = template.submobjects[-1].get_center()
+            stable_x = anchor_vector[0]
+            eyes_height = eye_height * body_scale / 2.0
+            target_y_eyes = template.get_top()[1] - (eyes_height * 0.9)
+            eyes_center_in_template = np.array([stable_x, target_y_eyes, 0])
+            target_y_mouth = anchor_vector[1] + (body_scale * 0.2)
+            mouth_center_in_template = np.array([stable_x, target_y_mouth, 0])
+            layout = {
+                "anchor_vector": anchor_vector,
+                "eyes_offset": eyes_center_in_template - anchor_vector,
+                "mouth_offset": mouth_center_in_template - anchor_vector,
+                "top_offset": np.array([0, template.get_top()[1] - anchor_vector[1], 0]),
+            }
+            for array in layout.values():
+                array.setflags(write=False)
+            cls._layouts[key] = layout
+        return layout
+
+    # Read-only views of the shared assets
+    @property
+    def state_paths(self) -> MappingProxyType: return self.assets.state_paths
+    @property
+    def templates(self) -> MappingProxyType: return self.assets.templates
+    @property
+    def anchor_vectors(self) -> MappingProxyType: return self.assets.anchor_vectors
+    @property
+    def eyes_offsets(self) -> MappingProxyType: return self.assets.eyes_offsets
+    @property
+    def mouth_offsets(self) -> MappingProxyType: return self.assets.mouth_offsets
+
+    def _ensure_state(self, state_name: str) -> None: self.assets.load(state_name)
+
     def _create_body_at_anchor(self, state_name, anchor_target_pos):
+        self._ensure_state(state_name)
         template = self.templates[state_name]
         anchor_vector = self.anchor_vectors[state_name]
         mobj = template.copy()
         mobj.move_to(anchor_target_pos - anchor_vector)
+        # Hash play() calls by the body's points and style (see `get_mobject_fingerprint`)
+        mobj.fingerprint_by_digest = True
         return mobj
 
+    def _settle_body(self, state_name: str, anchor_pos: np.ndarray) -> None:
+        """
+        Gives the body, as a transition to `state_name` leaves it, the exact
+        points of that state's template at `anchor_pos` in place of the
+        alignment padding. Its members and style are kept unless the padding
+        added members, in which case it becomes a copy of the template.
+        """
+        template = self.templates[state_name]
+        members, template_members = self.body.family_members_with_points(), template.family_members_with_points()
+        if len(members) == len(template_members):
+            shift = anchor_pos - self.anchor_vectors[state_name] - template.get_center()
+            for member, template_member in zip(members, template_members):
+                member.points = template_member.points + shift
+        else:
+            self.body.__dict__.update(self._create_body_at_anchor(state_name, anchor_pos).__dict__)
+
+    def _matches_body_form(self, form: Mobject, shift: np.ndarray) -> bool:
+        """Whether the body has the structure and style of `form`, and its points translated by `shift`."""
+        members, form_members = self.body.family_members_with_points(), form.family_members_with_points()
+        return len(members) == len(form_members) and all(
+            member.points.shape == form_member.points.shape
+            and np.allclose(member.points, form_member.points + shift, rtol=0, atol=1e-9)
+            and member.stroke_width == form_member.stroke_width
+            and all(
+                np.shape(getattr(member, name)) == np.shape(getattr(form_member, name))
+                and np.allclose(getattr(member, name), getattr(form_member, name), rtol=0, atol=1e-9)
+                for name in ("fill_rgbas", "stroke_rgbas")
+            )
+            for member, form_member in zip(members, form_members)
+        )
+
+    def _get_aligned_bodies(self, from_state: str, to_state: str, anchor_pos: np.ndarray) -> Mobject | None:
+        """
+        Readies a body transition from the aligned pair `CreatureAssets`
+        caches for (`from_state`, `to_state`): the current body is redrawn in
+        the pair's start form (the same shape) and the end body is returned at
+        `anchor_pos`, ready for an `AlignedTransform`.
+
+        Returns None, and leaves the body alone, unless it is an untouched
+        pose of `from_state` at `anchor_pos` (a template copy, which is also
+        how every body transition leaves it), style included.
+        """
+        start, end, start_shift, end_shift = self.assets.get_body_pair(from_state, to_state)
+        template = self.templates[from_state]
+        if not self._matches_body_form(template, anchor_pos - self.anchor_vectors[from_state] - template.get_center()):
+            return None
+        start_shift = anchor_pos + start_shift
+        members, start_members = self.body.family_members_with_points(), start.family_members_with_points()
+        if len(members) == len(start_members) and all(a.points.shape == b.points.shape for a, b in zip(members, start_members)):
+            for member, start_member in zip(members, start_members):
+                member.points[...] = start_member.points + start_shift
+        else:
+            # Same shape and style, with the pair's structure
+            new_body = start.copy().shift(start_shift)
+            new_body.fingerprint_by_digest = True
+            self.submobjects[self.submobjects.index(self.body)] = new_body
+            self.body = new_body
+        target_body = end.copy().shift(anchor_pos + end_shift)
+        target_body.fingerprint_by_digest = True
+        return target_body
+
+    @_settles_idle
     def change_state(
         self,
         new_state_name: str,
@@ -318,8 +1815,9 @@ class PsiCreature(VGroup):
         bend_direction: np.ndarray = None,
         bend_intensity: float = 0.4,
         reset_sclera: bool = False,
+        fused: bool = False,
         **kwargs
-    ) -> AnimationGroup:
+    ) -> AnimationGroup | CreatureTransform:
         """
         Creates a unified animation for changing the creature's state, expression,
         and gaze, avoiding animation conflicts.
@@ -334,19 +1832,35 @@ class PsiCreature(VGroup):
             bend_direction (np.ndarray, optional): Vector direction for bending the sclera.
             bend_intensity (float, optional): Intensity of the sclera bend.
             reset_sclera (bool, optional): If True, removes any sclera bend.
+            fused (bool, optional): If True, returns one `CreatureTransform`
+                interpolating a single point buffer instead of the group.
             **kwargs: Additional arguments for the AnimationGroup (e.g., run_time).
 
         Returns:
             AnimationGroup: A single, non-conflicting animation performing all actions.
         """
-        if new_state_name not in self.templates:
+        if new_state_name not in self.state_paths:
             raise ValueError(f"Cannot change to '{new_state_name}'; not a valid state.")
 
+        if fused:
+            # Record the new logical state now, as the group below does
+            from_state_name, self.current_state_name = self.current_state_name, new_state_name
+            self._record_features(change_mouth_to, squint_amount, reset_squint, bend_direction, bend_intensity, reset_sclera)
+            return CreatureTransform(
+                self, from_state_name, new_state_name, look_at_target=look_at_target,
+                look_straight=look_straight, change_mouth_to=change_mouth_to, **kwargs
+            )
+
         anims = []
 
         # --- 1. Core State Change (Body, Eyes, Mouth position) ---
-        target_body = self._create_body_at_anchor(new_state_name, self.anchor_pos)
-        anims.append(Transform(self.body, target_body))
+        target_body = self._get_aligned_bodies(self.current_state_name, new_state_name, self.anchor_pos)
+        if target_body is not None:
+            final_body = self._create_body_at_anchor(new_state_name, self.anchor_pos)
+            anims.append(AlignedTransform(self.body, target_body, final_body))
+        else:
+            target_body = self._create_body_at_anchor(new_state_name, self.anchor_pos)
+            anims.append(Become(self.body, target_body))
 
         eyes_new_pos = self.anchor_pos + self.eyes_offsets[new_state_name]
         anims.append(self.eyes.animate.move_to(eyes_new_pos))
@@ -382,6 +1896,104 @@ class PsiCreature(VGroup):
 
         return AnimationGroup(*anims, **kwargs)
 
+    @_settles_idle
+    def apply_state(
+        self,
+        new_state_name: str,
+        look_at_target: Mobject | np.ndarray = None,
+        look_straight: bool = False,
+        change_mouth_to: str = None,
+        squint_amount: float = None,
+        reset_squint: bool = False,
+        bend_direction: np.ndarray = None,
+        bend_intensity: float = 0.4,
+        reset_sclera: bool = False,
+    ) -> "PsiCreature":
+        """
+        Puts the creature straight into the pose `change_state` with the same
+        arguments animates to, without building targets or animations. Meant
+        for setting up scenes, thumbnails, tests and restoring snapshots.
+
+        The body is replaced by a fresh copy of the new state's template;
+        everything else is modified in place.
+
+        Returns:
+            PsiCreature: self, for chaining (e.g. `self.add(PsiCreature().apply_state("pondering"))`).
+        """
+        if new_state_name not in self.state_paths:
+            raise ValueError(f"Cannot change to '{new_state_name}'; not a valid state.")
+
+        # --- Body; then eyes, mouth, gaze and eye shape ---
+        new_body = self._create_body_at_anchor(new_state_name, self.anchor_pos)
+        self.submobjects[self.submobjects.index(self.body)] = new_body
+        self.body = new_body
+        self.current_state_name = new_state_name
+        self._record_features(change_mouth_to, squint_amount, reset_squint, bend_direction, bend_intensity, reset_sclera)
+        mouth_weights = {change_mouth_to: 1.0} if change_mouth_to else None
+        return self._pose_features(new_state_name, self.anchor_pos, look_at_target, look_straight, mouth_weights)
+
+    def _record_features(
+        self,
+        change_mouth_to: str = None,
+        squint_amount: float = None,
+        reset_squint: bool = False,
+        bend_direction: np.ndarray = None,
+        bend_intensity: float = 0.4,
+        reset_sclera: bool = False,
+    ) -> None:
+        """Records the emotion and the sclera blend weights a state change ends with, as `change_state` does when it builds."""
+        if change_mouth_to:
+            self.mouth.emotion = change_mouth_to
+        # As in change_state, a bend replaces a squint
+        scleras = (self.eyes.left_eye.sclera, self.eyes.right_eye.sclera)
+        mirrors = (np.array([1, 1, 1]), np.array([-1, 1, 1]))
+        for sclera, mirror in zip(scleras, mirrors):
+            if reset_squint:
+                sclera.blend_weights = {}
+            elif squint_amount is not None:
+                sclera._record_squint(squint_amount)
+            if reset_sclera:
+                sclera.blend_weights = {}
+            elif bend_direction is not None and np.linalg.norm(bend_direction) > 0:
+                sclera._record_bend(bend_direction * mirror, bend_intensity)
+
+    def _pose_features(
+        self,
+        state_name: str,
+        anchor_pos: np.ndarray,
+        look_at_target: Mobject | np.ndarray = None,
+        look_straight: bool = False,
+        mouth_weights: dict = None,
+        sclera_weights: list = None,
+    ) -> "PsiCreature":
+        """
+        Moves the eyes and mouth to `state_name`'s place about `anchor_pos` and
+        poses them in place, as `apply_state` does: the mouth to `mouth_weights`
+        (if given) and the scleras to `sclera_weights` (default: their recorded
+        blend weights).
+        """
+        # --- 1. Eyes and mouth position ---
+        self.eyes.move_to(anchor_pos + self.eyes_offsets[state_name])
+        self.mouth.move_to(anchor_pos + self.mouth_offsets[state_name])
+
+        # --- 2. Mouth expression ---
+        if mouth_weights is not None:
+            self.mouth.set_blend_weights(mouth_weights)
+
+        # --- 3. Eye gaze (measured on the current sclera, as change_state does) ---
+        for eye in (self.eyes.left_eye, self.eyes.right_eye):
+            if look_straight:
+                eye.set_gaze(eye.get_center())
+            elif look_at_target is not None:
+                eye.set_gaze(look_at_target)
+
+        # --- 4. Eye shape ---
+        scleras = (self.eyes.left_eye.sclera, self.eyes.right_eye.sclera)
+        for sclera, weights in zip(scleras, sclera_weights or [sclera.blend_weights for sclera in scleras]):
+            sclera.set_blend_weights(weights)
+        return self
+
+    @_settles_idle
     def move_anchor_to(self, new_anchor_pos: np.ndarray) -> AnimationGroup:
         current_anchor_vector = self.anchor_vectors[self.current_state_name]
         body_move = self.body.animate.move_to(new_anchor_pos - current_anchor_vector)
@@ -392,38 +2004,688 @@ class PsiCreature(VGroup):
         self.anchor_pos = new_anchor_pos
         return AnimationGroup(body_move, eyes_move, mouth_move)
 
-    def resize(self, scale_factor: float, **kwargs) -> Become:
-        new_body_scale = self.body_scale * scale_factor
-        target_creature = PsiCreature(
-            initial_anchor_pos=self.anchor_pos,
-            initial_state=self.current_state_name,
-            initial_emotion=self.mouth.emotion,
-            body_color=self.templates[self.current_state_name].get_color(),
-            eye_color=self.eye_color,
-            body_scale=new_body_scale,
-            mouth_width=self.mouth_width, # Pass unscaled value
-            mouth_emotion_intensity=self.mouth_emotion_intensity, # Pass unscaled value
-            mouth_kwargs=self.mouth_kwargs # Pass original kwargs
+    @_settles_idle
+    def resize(self, scale_factor: float, rebuild: bool = False, frame: Mobject = None, **kwargs) -> Animation:
+        """
+        Scales the creature about its anchor.
+
+        Every scaling rule of the creature is linear in `body_scale`, so by
+        default the target geometry, templates and layout offsets are computed
+        in place by scaling about the anchor. This keeps gaze, squint and bend
+        and never builds a second creature. A creature with automatic detail
+        also changes its level of detail when it crosses one (`DETAIL_LEVELS`).
+
+        Args:
+            scale_factor (float): The relative change of `body_scale`.
+            rebuild (bool, optional): If True, builds a fresh `PsiCreature` at the
+                new scale and `Become`s it instead (resetting gaze and eye shape).
+            frame (Mobject, optional): The camera frame the creature is seen
+                through (a MovingCamera's `frame`, say), for picking the level of
+                detail (default: the configured frame).
+            **kwargs: Additional arguments for the animation (e.g., run_time).
+
+        Returns:
+            Animation: An `AnchoredResize`, or a `Become` when rebuilding.
+        """
+        if rebuild:
+            new_body_scale = self.body_scale * scale_factor
+            target_creature = PsiCreature(
+                initial_anchor_pos=self.anchor_pos,
+                initial_state=self.current_state_name,
+                initial_emotion=self.mouth.emotion,
+                body_color=self.templates[self.current_state_name].get_color(),
+                eye_color=self.eye_color,
+                body_scale=new_body_scale,
+                mouth_width=self.mouth_width, # Pass unscaled value
+                mouth_emotion_intensity=self.mouth_emotion_intensity, # Pass unscaled value
+                mouth_kwargs=self.mouth_kwargs, # Pass original kwargs
+                frame=frame
+            )
+            return Become(self, target_creature, **kwargs)
+
+        current_anchor_vector = self.anchor_vectors[self.current_state_name].copy()
+        # Crossing a detail level, the geometry switches while the creature is
+        # at its smaller size, where the two levels agree best: before growing
+        # and once shrunk
+        previous_level = self.detail_level
+        if self.auto_detail and scale_factor > 1 and detail_level_for(self.body_scale * scale_factor, frame) != previous_level:
+            self.set_detail_level(detail_level_for(self.body_scale * scale_factor, frame), frame)
+            previous_level = self.detail_level
+        # Update internal state immediately so other animations are built correctly
+        self._scale_layout(scale_factor, frame)
+        detail_level = self.detail_level if self.detail_level != previous_level else None
+        return AnchoredResize(self, scale_factor, current_anchor_vector, detail_level=detail_level, frame=frame, **kwargs)
+
+    def _scale_layout(self, scale_factor: float, frame: Mobject = None) -> None:
+        """Scales every size-dependent parameter (but not the visible geometry) by `scale_factor`."""
+        self.body_scale *= scale_factor
+        previous_level = self.detail_level
+        if self.auto_detail:
+            self.detail_level = detail_level_for(self.body_scale, frame)
+        self.assets = self.assets.scaled(
+            scale_factor, None if self.detail_level == previous_level else get_path_tolerance(self.detail_level, frame)
         )
-        return Become(self, target_creature, **kwargs)
-
-    def change_mouth(self, new_emotion: str, **kwargs) -> Become:
-        # Create the new mouth using the CURRENTLY scaled parameters
-        # from the existing mouth to ensure consistency.
-        target_mouth = Mouth(
-            emotion=new_emotion,
-            width=self.mouth.width,
-            emotion_intensity=self.mouth.emotion_intensity,
-            **self.mouth.bezier_kwargs
+        for eye in (self.eyes.left_eye, self.eyes.right_eye):
+            eye.eye_width *= scale_factor
+            eye.eye_height *= scale_factor
+            for circle in (eye.iris, eye.pupil, eye.highlight):
+                circle.radius *= scale_factor
+            eye.sclera.original_points = eye.sclera.original_points * scale_factor
+            eye.sclera._blend_names = None
+        self.mouth.curve_width *= scale_factor
+        self.mouth.emotion_intensity *= scale_factor
+        if "stroke_width" in self.mouth.bezier_kwargs:
+            self.mouth.bezier_kwargs["stroke_width"] *= scale_factor
+
+    @_settles_idle
+    def set_detail_level(self, level: int, frame: Mobject = None) -> "PsiCreature":
+        """
+        Redraws the eye circles in place and the body from the templates at
+        `level` of `DETAIL_LEVELS`: gaze, eye shape, state and anchor are kept,
+        so at the size the level was chosen for, the switch is invisible. `resize` does this
+        itself when a creature with automatic detail crosses a level. The body
+        path tolerance is that of `level` through `frame` (default: the configured frame).
+
+        Returns:
+            PsiCreature: self, for chaining.
+        """
+        if not 0 <= level < len(DETAIL_LEVELS):
+            raise ValueError(f"detail_level must be between 0 and {len(DETAIL_LEVELS) - 1}.")
+        path_tolerance = get_path_tolerance(level, frame)
+        if level != self.detail_level or self.assets.path_tolerance != path_tolerance:
+            self.detail_level = level
+            self.assets = CreatureAssets.get(self.assets_dir, self.body_color, self.body_scale, self.eye_height, path_tolerance)
+        for eye in (self.eyes.left_eye, self.eyes.right_eye):
+            if eye.num_arcs != DETAIL_LEVELS[level][1]:
+                eye.set_num_arcs(DETAIL_LEVELS[level][1])
+        new_body = self._create_body_at_anchor(self.current_state_name, self.anchor_pos)
+        self.submobjects[self.submobjects.index(self.body)] = new_body
+        self.body = new_body
+        return self
+
+    @_settles_idle
+    def change_mouth(self, new_emotion: str, **kwargs) -> BlendWeights:
+        """
+        Animates the mouth to `new_emotion` by reshaping the existing curve in
+        place; see `Mouth.register_emotion` for adding emotions.
+        """
+        # Update internal state immediately so other animations are built correctly
+        self.mouth.emotion = new_emotion
+        return self.mouth.blend_to({new_emotion: 1.0}, **kwargs)
+
+    @_settles_idle
+    def blend_expression(
+        self,
+        squint_amount: float = None,
+        bend_direction: np.ndarray = None,
+        bend_intensity: float = 0.4,
+        mouth_weights: dict = None,
+        **kwargs
+    ) -> AnimationGroup:
+        """
+        Animates the eyes (and optionally the mouth) to a blend of expressions
+        by writing straight into their existing point buffers; no target
+        mobjects are built. Unlike `change_state`, a squint and a bend given
+        together are combined instead of overwriting each other.
+
+        Args:
+            squint_amount (float, optional): The squint angle (0 to PI/2). Omitted means no squint.
+            bend_direction (np.ndarray, optional): Vector direction for bending the sclera.
+            bend_intensity (float, optional): Intensity of the sclera bend.
+            mouth_weights (dict, optional): Emotion weights for the mouth, e.g. {"happy": 0.5, "unsure": 0.5}.
+            **kwargs: Additional arguments for the animations (e.g., run_time).
+
+        Returns:
+            AnimationGroup: The blendshape animations.
+        """
+        eye_weights = self.eyes.get_expression_weights(squint_amount, bend_direction, bend_intensity)
+        anims = [self.eyes.blend_to(eye_weights, **kwargs)]
+        if mouth_weights is not None:
+            anims.append(self.mouth.blend_to(mouth_weights, **kwargs))
+        return AnimationGroup(*anims)
+
+    def start_idle(self, seed: int = None, **schedule_kwargs) -> "PsiCreature":
+        """
+        Brings the creature to life with seeded random blinks, breathing and
+        small eye saccades, driven by a single updater, so `self.wait()`
+        stretches animate without extra play calls. Other animations keep
+        working; idle motion simply continues on top of their result.
+
+        Args:
+            seed (int, optional): Seeds the schedule, so renders are reproducible.
+            **schedule_kwargs: Timing and amplitude options of `IdleSchedule`.
+
+        Returns:
+            PsiCreature: self, for chaining (e.g. `self.add(psi.start_idle(seed=1))`).
+        """
+        self.stop_idle()
+        self.idle = IdleBehaviour(IdleSchedule(seed=seed, **schedule_kwargs))
+        self.add_updater(self.idle)
+        return self
+
+    def stop_idle(self) -> "PsiCreature":
+        """Removes the idle updater and restores the rest pose."""
+        if self.idle is not None:
+            self._settle_idle()
+            self.remove_updater(self.idle)
+            self.idle = None
+            self._idle_parts = {}
+        return self
+
+    def track(self, target, smoothing: float = 0.0, lag: float = 0.0) -> "PsiCreature":
+        """
+        Keeps the creature looking at `target` every frame, through a single
+        updater, so following a moving mobject needs no `look_at` per play.
+        Gaze tracking keeps going during other animations of the creature.
+
+        Args:
+            target: A Mobject, a point, or a function returning either (called every frame).
+            smoothing (float, optional): Seconds for the eyes to ease towards the target (0 snaps).
+            lag (float, optional): Seconds before the eyes react to the target's movement.
+
+        Returns:
+            PsiCreature: self, for chaining.
+        """
+        self.stop_tracking()
+        self.gaze_tracker = GazeTracker(target, smoothing, lag)
+        self.add_updater(self.gaze_tracker)
+        return self
+
+    def stop_tracking(self) -> "PsiCreature":
+        """Removes the gaze tracker; the eyes keep their current gaze."""
+        if self.gaze_tracker is not None:
+            self.remove_updater(self.gaze_tracker)
+            self.gaze_tracker = None
+        return self
+
+    def _settle_idle(self) -> None:
+        """Writes the rest pose back into every part still showing an idle pose."""
+        for entry in self._idle_parts.values():
+            part, rest, written = entry
+            if written is not rest and np.array_equal(part.points, written):
+                _write_buffer(part, rest)
+                entry[2] = rest
+
+    def apply_idle_pose(self, breath: np.ndarray, blink: np.ndarray, saccade: np.ndarray) -> None:
+        """
+        Poses the creature for one idle frame by rewriting its point buffers
+        from their rest pose. A part that anything else rewrote since the last
+        idle frame (a Transform, a blendshape animation, ...) is taken as its
+        new rest pose; one reshaped about its idle-posed center keeps its rest
+        center. Arguments are one row of `IdleSchedule.evaluate`.
+        """
+        breath, blink, saccade = float(breath[0]), float(blink[0]), saccade[0]
+        parts = {}
+
+        def rest_of(part: VMobject) -> np.ndarray:
+            entry = self._idle_parts.get(id(part))
+            if entry is None or not np.array_equal(part.points, entry[2]):
+                rest = part.points.copy()
+                if entry is not None and entry[2] is not None:
+                    # Reshaped in place about the idle-posed center (blendshapes, lip-sync):
+                    # keep the rest center, or breathing would compound frame after frame
+                    posed_center = _anchor_center(entry[2])
+                    if np.allclose(_anchor_center(rest), posed_center, rtol=0, atol=1e-9):
+                        rest += _anchor_center(entry[1]) - posed_center
+                entry = [part, rest, None]
+            parts[id(part)] = entry
+            return entry[1]
+
+        def write(part: VMobject, points: np.ndarray) -> None:
+            _write_buffer(part, points)
+            parts[id(part)][2] = points
+
+        body_parts = self.body.family_members_with_points()
+        body_rests = [rest_of(part) for part in body_parts]
+        # Breathing scales everything about the anchor of the resting body
+        anchor = _anchor_center(np.concatenate(body_rests)) + self.anchor_vectors[self.current_state_name]
+        breathe = lambda points: anchor + breath * (points - anchor)
+        for part, rest in zip(body_parts, body_rests):
+            write(part, breathe(rest))
+        for part in self.mouth.family_members_with_points():
+            write(part, breathe(rest_of(part)))
+
+        squash = np.array([1.0, blink, 1.0])
+        for eye in (self.eyes.left_eye, self.eyes.right_eye):
+            sclera_rest = rest_of(eye.sclera)
+            center = _anchor_center(sclera_rest)
+            write(eye.sclera, breathe(center + (sclera_rest - center) * squash))
+            # Saccades move the iris about its current gaze, within the sclera
+            iris_parts = (eye.iris, eye.pupil, eye.highlight)
+            iris_rests = [rest_of(part) for part in iris_parts]
+            max_offset = eye.eye_height / 2 - eye.iris.radius
+            gaze = _anchor_center(iris_rests[0]) - center
+            new_gaze = gaze + saccade * max_offset
+            norm = np.linalg.norm(new_gaze)
+            if norm > max_offset:
+                new_gaze *= max_offset / norm
+            shift = new_gaze - gaze
+            for part, rest in zip(iris_parts, iris_rests):
+                write(part, breathe(center + (rest + shift - center) * squash))
+        self._idle_parts = parts
+
+    def get_fingerprint(self) -> dict:
+        """What manim hashes for this creature in play() calls; see `get_mobject_fingerprint`."""
+        return get_mobject_fingerprint(
+            self,
+            state=self.current_state_name,
+            anchor=np.asarray(self.anchor_pos, dtype=float).tolist(),
+            body_scale=self.body_scale,
+            body_color=_color_key(self.body_color),
+            eye_color=_color_key(self.eye_color),
+            mouth_weights=_weights_key(self.mouth.blend_weights),
+            eye_weights=[_weights_key(eye.sclera.blend_weights) for eye in (self.eyes.left_eye, self.eyes.right_eye)],
         )
-        target_mouth.move_to(self.mouth)
-        return Become(self.mouth, target_mouth, **kwargs)
 
     # Delegate eye and mouth methods
+    @_settles_idle
     def blink(self, **kwargs) -> AnimationGroup: return self.eyes.blink(**kwargs)
+    @_settles_idle
     def look_at(self, target, **kwargs) -> AnimationGroup: return self.eyes.look_at(target, **kwargs)
+    @_settles_idle
     def look_straight(self, **kwargs) -> AnimationGroup: return self.eyes.look_straight(**kwargs)
+    @_settles_idle
     def bend_sclera(self, direction: np.ndarray, intensity: float=0.4) -> AnimationGroup: return self.eyes.bend_sclera(direction, intensity=intensity)
+    @_settles_idle
     def reset_sclera(self) -> AnimationGroup: return self.eyes.reset_sclera()
+    @_settles_idle
     def squint(self, theta: float, **kwargs) -> AnimationGroup: return self.eyes.squint(theta, **kwargs)
+    @_settles_idle
     def reset_squint(self, **kwargs) -> AnimationGroup: return self.eyes.reset_squint(**kwargs)
+
+# ====================================================================
+#  CreatureCrowd CLASS
+# ====================================================================
+def _write_buffer(vmobject: VMobject, points: np.ndarray) -> None:
+    """Writes `points` (any shape ending in 3) into the point buffer of `vmobject`, in place when the size allows."""
+    points = points.reshape(-1, 3)
+    if vmobject.points.shape == points.shape:
+        vmobject.points[...] = points
+    else:
+        vmobject.set_points(points)
+
+class CrowdAnimation(Animation):
+    """
+    Interpolates the state arrays of a `CreatureCrowd` from `start` to `end`
+    and recomposes the geometry of every creature from them, one vectorized
+    pass per frame. No mobject is copied.
+    """
+    def __init__(self, crowd, start: dict, end: dict, start_states: np.ndarray, end_states: np.ndarray, **kwargs):
+        """
+        Args:
+            crowd: The CreatureCrowd to animate.
+            start, end: State arrays as returned by `CreatureCrowd.get_state_arrays`.
+            start_states, end_states: Body state indices per creature.
+        """
+        self.start, self.end = start, end
+        self.start_states, self.end_states = start_states, end_states
+        super().__init__(crowd, **kwargs)
+
+    def create_starting_mobject(self) -> Mobject:
+        # The start is fully described by the start arrays
+        return self.mobject
+
+    def begin(self) -> None:
+        self.deltas = {
+            name: self.end[name] - self.start[name]
+            for name in self.end
+            if not np.array_equal(self.start[name], self.end[name])
+        }
+        self.moves_body = "anchors" in self.deltas or not np.array_equal(self.start_states, self.end_states)
+        if self.moves_body:
+            body_start, body_end, self.body_owners = self.mobject._get_body_buffers(
+                self.start_states, self.start["anchors"], self.end_states, self.end["anchors"]
+            )
+            self.body_start, self.body_delta = body_start, body_end - body_start
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        alpha = self.rate_func(alpha)
+        arrays = {
+            name: self.start[name] + self.deltas[name] * alpha if name in self.deltas else self.end[name]
+            for name in self.end
+        }
+        if self.moves_body:
+            self.mobject._set_body_points(self.body_start + self.body_delta * alpha, self.body_owners, arrays["anchors"])
+        self.mobject._compose(arrays)
+
+    def finish(self) -> None:
+        super().finish()
+        if self.moves_body and self.rate_func(1) == 1:
+            # Drop the extra points the state alignment introduced
+            self.mobject._write_body(self.end_states, self.end["anchors"])
+
+class CreatureCrowd(VGroup):
+    """
+    Many creatures stored as a struct of arrays instead of one `PsiCreature`
+    tree each.
+
+    Anchors, body states, gaze, squint, emotions and blink are NumPy arrays
+    with one row per creature, and each visible part (bodies, scleras, irises,
+    pupils, highlights, mouths) of the whole crowd is a single VMobject whose
+    points are recomposed from those arrays. `look_at`, `blink`,
+    `change_state`, `change_mouth` and `move_anchor_to` therefore act on every
+    creature at once and cost one vectorized pass per frame.
+
+    All creatures share one body scale and color scheme, and since each part
+    is drawn for the whole crowd at once, overlapping creatures show their
+    eyes above every body.
+    """
+    def __init__(
+        self,
+        anchors: np.ndarray,
+        initial_state: str = "default",
+        initial_emotion: str = "neutral",
+        body_color: ManimColor = BLUE_E,
+        eye_color: ManimColor = BLUE_C,
+        body_scale: float = 2.0,
+        **creature_kwargs
+    ):
+        """
+        Args:
+            anchors: (N, 3) anchor positions, one per creature.
+            initial_state, initial_emotion, body_color, eye_color, body_scale:
+                As for `PsiCreature`, shared by every creature.
+            **creature_kwargs: Further `PsiCreature` sizing arguments (eye_width, mouth_kwargs, ...).
+        """
+        super().__init__()
+        # A single prototype creature supplies templates, layout and part geometry
+        prototype = PsiCreature(
+            initial_state=initial_state, initial_emotion=initial_emotion, body_color=body_color,
+            eye_color=eye_color, body_scale=body_scale, **creature_kwargs
+        )
+        self.body_scale = body_scale
+        self.state_names = list(prototype.state_paths)
+        for state in self.state_names:
+            prototype._ensure_state(state)
+        self.body_templates = [
+            np.concatenate([m.points for m in prototype.templates[state].family_members_with_points()])
+            for state in self.state_names
+        ]
+        self.body_translations = np.array([
+            -prototype.anchor_vectors[state] - _anchor_center(template)
+            for state, template in zip(self.state_names, self.body_templates)
+        ])
+        self.eyes_offsets_table = np.array([prototype.eyes_offsets[state] for state in self.state_names])
+        self.mouth_offsets_table = np.array([prototype.mouth_offsets[state] for state in self.state_names])
+        self._aligned_bodies = {}
+
+        eyes, left_eye = prototype.eyes, prototype.eyes.left_eye
+        self.eye_positions = np.array([eye.get_center() - eyes.get_center() for eye in (eyes.left_eye, eyes.right_eye)])
+        self.sclera_outline = left_eye.sclera.original_points.copy()
+        names, bases = left_eye.sclera.get_blend_bases()
+        self.squint_basis = bases[names.index("squint")].copy()
+        iris_parts = (left_eye.iris, left_eye.pupil, left_eye.highlight)
+        self.iris_outlines = [part.points - left_eye.get_center() for part in iris_parts]
+        self.max_gaze_offset = left_eye.sclera.height / 2 - left_eye.iris.radius
+        self.mouth_width = prototype.mouth.curve_width
+        self.mouth_intensity = prototype.mouth.emotion_intensity
+
+        # --- Per-creature state arrays ---
+        self.anchors = np.array(anchors, dtype=float).reshape(-1, 3)
+        n = len(self.anchors)
+        self.states = np.full(n, self.state_names.index(initial_state))
+        self.iris_offsets = np.zeros((n, 2, 3))
+        self.squint = np.zeros(n)
+        self.emotions = np.tile(Mouth.get_emotion_vector({initial_emotion: 1.0}), (n, 1))
+        self.eye_scale = np.ones(n)
+        # (breath, blink, saccade) arrays of the current idle frame, see `start_idle`
+        self.idle = None
+        self.idle_pose = None
+        self.gaze_tracker = None
+
+        # --- One VMobject per part for the whole crowd ---
+        self.bodies = VMobject().match_style(prototype.body.family_members_with_points()[0])
+        self.scleras = VMobject().match_style(left_eye.sclera)
+        self.irises, self.pupils, self.highlights = (VMobject().match_style(part) for part in iris_parts)
+        self.mouths = VMobject().match_style(prototype.mouth.submobjects[0])
+        self.add(self.bodies, self.scleras, self.irises, self.pupils, self.highlights, self.mouths)
+        self._write_body(self.states, self.anchors)
+        self._compose(self.get_state_arrays())
+
+    def __len__(self) -> int:
+        return len(self.anchors)
+
+    # --- Geometry ---
+    def get_state_arrays(self) -> dict:
+        """A snapshot of every interpolatable per-creature array."""
+        return {
+            "anchors": self.anchors.copy(),
+            "eyes_offsets": self.eyes_offsets_table[self.states],
+            "mouth_offsets": self.mouth_offsets_table[self.states],
+            "iris_offsets": self.iris_offsets.copy(),
+            "squint": self.squint.copy(),
+            "emotions": self.emotions.copy(),
+            "eye_scale": self.eye_scale.copy(),
+        }
+
+    def _compose(self, arrays: dict) -> None:
+        """Writes the eyes and mouths of every creature for the given state arrays."""
+        self._display_arrays = arrays
+        anchors = arrays["anchors"]
+        n = len(anchors)
+        vertical_scale, iris_offsets = arrays["eye_scale"], arrays["iris_offsets"]
+        breathe = lambda points: points
+        if self.idle_pose is not None:
+            breath, blink, saccade = self.idle_pose
+            vertical_scale = vertical_scale * blink
+            iris_offsets = self._clamp_gaze(iris_offsets + saccade[:, None, :] * self.max_gaze_offset)
+            def breathe(points):
+                shape = (n,) + (1,) * (points.ndim - 2)
+                origins = anchors.reshape(shape + (3,))
+                return origins + breath.reshape(shape + (1,)) * (points - origins)
+
+        eye_centers = (anchors + arrays["eyes_offsets"])[:, None, None, :] + self.eye_positions[None, :, None, :]
+        # Blinking squashes each eye vertically about its center
+        eye_scale = np.ones((n, 1, 1, 3))
+        eye_scale[..., 1] = vertical_scale[:, None, None]
+        scleras = self.sclera_outline + arrays["squint"][:, None, None, None] * self.squint_basis
+        _write_buffer(self.scleras, breathe(eye_centers + scleras * eye_scale))
+        iris_shifts = iris_offsets[:, :, None, :]
+        for part, outline in zip((self.irises, self.pupils, self.highlights), self.iris_outlines):
+            _write_buffer(part, breathe(eye_centers + (outline + iris_shifts) * eye_scale))
+
+        emotion_offsets = Mouth.EMOTION_OFFSETS[:arrays["emotions"].shape[1]].reshape(-1, 12)
+        controls = Mouth.NEUTRAL_CONTROL_POINTS * self.mouth_width + (arrays["emotions"] @ emotion_offsets).reshape(n, 4, 3) * self.mouth_intensity
+        ends = controls[:, [0, 3]]
+        centers = (ends.min(axis=1) + ends.max(axis=1)) / 2
+        _write_buffer(self.mouths, breathe(controls + (anchors + arrays["mouth_offsets"] - centers)[:, None, :]))
+
+    def _clamp_gaze(self, iris_offsets: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(iris_offsets, axis=-1, keepdims=True)
+        return iris_offsets * np.minimum(1, self.max_gaze_offset / np.maximum(norms, 1e-12))
+
+    def _set_body_points(self, points: np.ndarray, owners: np.ndarray, anchors: np.ndarray) -> None:
+        """Writes body points, given the creature each point belongs to, breathing them about their anchors while idle."""
+        self._display_body = (points, owners, anchors)
+        if self.idle_pose is not None:
+            origins = anchors[owners]
+            points = origins + self.idle_pose[0][owners, None] * (points - origins)
+        _write_buffer(self.bodies, points)
+
+    def _write_body(self, states: np.ndarray, anchors: np.ndarray) -> None:
+        chunks, owners = [], []
+        for state in np.unique(states):
+            in_state = np.flatnonzero(states == state)
+            translations = anchors[in_state] + self.body_translations[state]
+            chunks.append((self.body_templates[state][None] + translations[:, None, :]).reshape(-1, 3))
+            owners.append(np.repeat(in_state, len(self.body_templates[state])))
+        self._set_body_points(np.concatenate(chunks), np.concatenate(owners), anchors)
+
+    def _get_aligned_bodies(self, from_state: int, to_state: int) -> tuple:
+        """Body templates of two states with their subpaths and points aligned, computed once per pair."""
+        key = (from_state, to_state)
+        if key not in self._aligned_bodies:
+            start = VMobject().set_points(self.body_templates[from_state])
+            end = VMobject().set_points(self.body_templates[to_state])
+            start.align_points(end)
+            self._aligned_bodies[key] = (start.points, end.points)
+        return self._aligned_bodies[key]
+
+    def _get_body_buffers(self, from_states, from_anchors, to_states, to_anchors) -> tuple:
+        """Aligned (start, end) body buffers for a transition, grouped by state pair, and the owner of each point."""
+        starts, ends, owners = [], [], []
+        for from_state, to_state in set(zip(from_states.tolist(), to_states.tolist())):
+            in_pair = np.flatnonzero((from_states == from_state) & (to_states == to_state))
+            aligned_start, aligned_end = self._get_aligned_bodies(from_state, to_state)
+            starts.append((aligned_start[None] + (from_anchors[in_pair] + self.body_translations[from_state])[:, None, :]).reshape(-1, 3))
+            ends.append((aligned_end[None] + (to_anchors[in_pair] + self.body_translations[to_state])[:, None, :]).reshape(-1, 3))
+            owners.append(np.repeat(in_pair, len(aligned_start)))
+        return np.concatenate(starts), np.concatenate(ends), np.concatenate(owners)
+
+    # --- Idle behaviour ---
+    def start_idle(self, seed: int = None, **schedule_kwargs) -> "CreatureCrowd":
+        """
+        The crowd counterpart of `PsiCreature.start_idle`: every creature gets
+        its own blinks, breathing and saccades from one shared schedule, posed
+        by a single updater in one vectorized pass.
+        """
+        self.stop_idle()
+        self.idle = IdleBehaviour(IdleSchedule(count=len(self), seed=seed, **schedule_kwargs))
+        self.add_updater(self.idle)
+        return self
+
+    def stop_idle(self) -> "CreatureCrowd":
+        if self.idle is not None:
+            self.remove_updater(self.idle)
+            self.idle = None
+            self.apply_idle_pose(None)
+        return self
+
+    def apply_idle_pose(self, *pose) -> None:
+        """Re-poses whatever is currently displayed (the rest pose, or the current frame of a CrowdAnimation)."""
+        self.idle_pose = pose if pose[0] is not None else None
+        self._compose(self._display_arrays)
+        self._set_body_points(*self._display_body)
+
+    # --- State changes ---
+    def _select(self, indices) -> slice | np.ndarray:
+        return slice(None) if indices is None else indices
+
+    def _sync_emotion_columns(self) -> None:
+        # Emotions registered after the crowd was built get a zero column
+        missing = len(Mouth.EMOTION_NAMES) - self.emotions.shape[1]
+        if missing > 0:
+            self.emotions = np.pad(self.emotions, ((0, 0), (0, missing)))
+
+    def _begin_change(self) -> tuple:
+        self._sync_emotion_columns()
+        return self.get_state_arrays(), self.states.copy()
+
+    def _animate(self, start: tuple, **kwargs) -> CrowdAnimation:
+        start_arrays, start_states = start
+        return CrowdAnimation(self, start_arrays, self.get_state_arrays(), start_states, self.states.copy(), **kwargs)
+
+    def _get_gaze_offsets(self, target) -> np.ndarray:
+        """(N, 2, 3) iris offsets of every creature looking at `target` (anything `look_at` accepts)."""
+        targets = np.broadcast_to(_resolve_gaze_target(target), self.anchors.shape)
+        eye_centers = (self.anchors + self.eyes_offsets_table[self.states])[:, None, :] + self.eye_positions
+        directions = targets[:, None, :] - eye_centers
+        norms = np.linalg.norm(directions, axis=-1, keepdims=True)
+        return np.divide(directions, norms, out=np.zeros(directions.shape), where=norms > 0) * self.max_gaze_offset
+
+    def _set_gaze(self, target, indices) -> None:
+        selection = self._select(indices)
+        self.iris_offsets[selection] = self._get_gaze_offsets(target)[selection]
+
+    def track(self, target, indices=None, smoothing: float = 0.0, lag: float = 0.0) -> "CreatureCrowd":
+        """
+        The crowd counterpart of `PsiCreature.track`: one updater re-aims every
+        selected creature each frame in a single vectorized step. Like idle
+        behaviour, it pauses while a crowd animation plays.
+
+        Args:
+            target: Anything `look_at` accepts, or a function returning it (called every frame).
+            indices (optional): The creatures that track (default: all).
+            smoothing, lag (float, optional): As for `PsiCreature.track`.
+        """
+        self.stop_tracking()
+        self.gaze_tracker = CrowdGazeTracker(target, indices, smoothing, lag)
+        self.add_updater(self.gaze_tracker)
+        return self
+
+    def stop_tracking(self) -> "CreatureCrowd":
+        if self.gaze_tracker is not None:
+            self.remove_updater(self.gaze_tracker)
+            self.gaze_tracker = None
+        return self
+
+    def look_at(self, target, indices=None, **kwargs) -> CrowdAnimation:
+        """
+        Args:
+            target: A point, an (N, 3) array of points, a Mobject or a list of N Mobjects.
+            indices (optional): The creatures to affect (default: all).
+        """
+        start = self._begin_change()
+        self._set_gaze(target, indices)
+        return self._animate(start, **kwargs)
+
+    def look_straight(self, indices=None, **kwargs) -> CrowdAnimation:
+        start = self._begin_change()
+        self.iris_offsets[self._select(indices)] = 0
+        return self._animate(start, **kwargs)
+
+    def blink(self, indices=None, **kwargs) -> CrowdAnimation:
+        start_arrays, start_states = self._begin_change()
+        end_arrays = dict(start_arrays, eye_scale=start_arrays["eye_scale"].copy())
+        end_arrays["eye_scale"][self._select(indices)] *= 0.1
+        return CrowdAnimation(self, start_arrays, end_arrays, start_states, start_states, rate_func=there_and_back, **kwargs)
+
+    def change_mouth(self, new_emotion: str, indices=None, **kwargs) -> CrowdAnimation:
+        start = self._begin_change()
+        self.emotions[self._select(indices)] = Mouth.get_emotion_vector({new_emotion: 1.0})
+        return self._animate(start, **kwargs)
+
+    def move_anchor_to(self, new_anchors: np.ndarray, indices=None, **kwargs) -> CrowdAnimation:
+        """
+        Args:
+            new_anchors: A single point or one point per selected creature.
+            indices (optional): The creatures to affect (default: all).
+        """
+        start = self._begin_change()
+        self.anchors[self._select(indices)] = new_anchors
+        return self._animate(start, **kwargs)
+
+    def change_state(
+        self,
+        new_state_name: str | list,
+        look_at_target=None,
+        look_straight: bool = False,
+        change_mouth_to: str = None,
+        squint_amount: float = None,
+        reset_squint: bool = False,
+        indices=None,
+        **kwargs
+    ) -> CrowdAnimation:
+        """
+        The crowd counterpart of `PsiCreature.change_state`, as one animation.
+
+        Args:
+            new_state_name (str | list): One body state for all selected creatures, or one per creature.
+            look_at_target (optional): Anything `look_at` accepts.
+            look_straight (bool, optional): If True, the creatures look straight ahead.
+            change_mouth_to (str, optional): The new emotion for the mouths.
+            squint_amount (float, optional): The intensity of the squint (0 to PI/2).
+            reset_squint (bool, optional): If True, removes any existing squint.
+            indices (optional): The creatures to affect (default: all).
+            **kwargs: Additional arguments for the animation (e.g., run_time).
+        """
+        names = [new_state_name] if isinstance(new_state_name, str) else list(new_state_name)
+        for name in names:
+            if name not in self.state_names:
+                raise ValueError(f"Cannot change to '{name}'; not a valid state.")
+        start = self._begin_change()
+        selection = self._select(indices)
+        new_states = np.array([self.state_names.index(name) for name in names])
+        self.states[selection] = new_states if len(new_states) > 1 else new_states[0]
+        if change_mouth_to:
+            self.emotions[selection] = Mouth.get_emotion_vector({change_mouth_to: 1.0})
+        if look_straight:
+            self.iris_offsets[selection] = 0
+        elif look_at_target is not None:
+            self._set_gaze(look_at_target, indices)
+        if reset_squint:
+            self.squint[selection] = 0
+        elif squint_amount is not None:
+            self.squint[selection] = np.sin(np.clip(squint_amount, 0, PI / 2))
+        return self._animate(start, **kwargs)
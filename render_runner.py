@@ -0,0 +1,170 @@
+# Renders the scenes of a module across a process pool. From the repository root:
+#   python render_runner.py tests.py                          # every scene, 480p15
+#   python render_runner.py youtube_showcase.py -q high_quality -j 32
+#   python render_runner.py tests.py TestSize TestSimplerResize
+#
+# Long scenes are split into chunks at their sections (`self.next_section()`),
+# or into even runs of play calls when they have none. Each chunk replays the
+# scene logic up to its first play without rendering (manim's
+# from_animation_number), which reproduces the creatures' state exactly, and
+# renders only its own plays into manim's partial movie cache. A final pass
+# per scene then finds every play cached and just combines them into the usual
+# media/videos/<module>/<quality>/<Scene>.mp4.
+
+import argparse
+import importlib.util
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from manim import *
+
+def load_module(module_path: str):
+    """Imports a scene module from its path, with its directory importable (for psi_creature)."""
+    module_dir = os.path.dirname(os.path.abspath(module_path))
+    if module_dir not in sys.path:
+        sys.path.insert(0, module_dir)
+    name = os.path.splitext(os.path.basename(module_path))[0]
+    spec = importlib.util.spec_from_file_location(name, module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def find_scenes(module) -> list:
+    """Names of the Scene classes defined (not just imported) in `module`, in definition order."""
+    return [
+        name for name, obj in vars(module).items()
+        if isinstance(obj, type) and issubclass(obj, Scene) and obj.__module__ == module.__name__
+    ]
+
+def _render_config(module_path: str, quality: str, **overrides) -> dict:
+    return dict(
+        {
+            "input_file": module_path,
+            "quality": quality,
+            "disable_caching": False,
+            # Chunks share the partial movie cache; manim must not prune it
+            "max_files_cached": 1_000_000,
+            "progress_bar": "none",
+            "verbosity": "WARNING",
+        },
+        **overrides,
+    )
+
+# ====================================================================
+#  Jobs (run in worker processes)
+# ====================================================================
+def count_plays(module_path: str, scene_name: str, quality: str) -> tuple:
+    """
+    Dry-runs a scene without rendering anything.
+
+    Returns:
+        tuple: (number of play calls, indices of the plays that start a new section)
+    """
+    module = load_module(module_path)
+    with tempconfig(_render_config(module_path, quality, dry_run=True)):
+        scene = getattr(module, scene_name)()
+        section_starts = []
+        next_section = scene.next_section
+
+        def record_section(*args, **kwargs):
+            section_starts.append(scene.renderer.num_plays)
+            return next_section(*args, **kwargs)
+
+        scene.next_section = record_section
+        scene.render()
+        return scene.renderer.num_plays, section_starts
+
+def render_chunk(module_path: str, scene_name: str, quality: str, first_play: int, last_play: int) -> list:
+    """
+    Renders plays `first_play` to `last_play` (inclusive) of a scene into the partial movie cache.
+
+    Returns:
+        list: The partial movie hashes of those plays, which name their cached files.
+    """
+    module = load_module(module_path)
+    overrides = {"from_animation_number": first_play, "upto_animation_number": last_play}
+    with tempconfig(_render_config(module_path, quality, **overrides)):
+        scene = getattr(module, scene_name)()
+        # Chunks of one scene share its partial movie directory; only the
+        # final pass may combine (and clean) it
+        scene.renderer.file_writer.finish = lambda: None
+        scene.render()
+        return scene.renderer.animations_hashes[first_play:last_play + 1]
+
+def render_scene(module_path: str, scene_name: str, quality: str) -> str:
+    """Renders a whole scene (from the cache where chunks filled it) and returns the movie path."""
+    module = load_module(module_path)
+    with tempconfig(_render_config(module_path, quality)):
+        scene = getattr(module, scene_name)()
+        scene.render()
+        return str(scene.renderer.file_writer.movie_file_path)
+
+# ====================================================================
+#  Planning and running
+# ====================================================================
+def plan_chunks(num_plays: int, section_starts: list, target_chunks: int) -> list:
+    """
+    Splits plays 0..num_plays-1 into chunks at section starts, or into
+    `target_chunks` even runs if the scene has no sections.
+
+    Returns:
+        list: (first_play, last_play) pairs, inclusive.
+    """
+    boundaries = sorted({start for start in section_starts if 0 < start < num_plays})
+    if not boundaries and target_chunks > 1:
+        size = math.ceil(num_plays / target_chunks)
+        boundaries = list(range(size, num_plays, size))
+    starts = [0] + boundaries
+    ends = boundaries + [num_plays]
+    return [(start, end - 1) for start, end in zip(starts, ends) if end > start]
+
+def run(module_path: str, scene_names: list = None, quality: str = "low_quality", workers: int = None) -> dict:
+    """
+    Renders scenes of `module_path` in parallel.
+
+    Args:
+        module_path: The scene module, e.g. "tests.py".
+        scene_names (optional): The scenes to render (default: every scene in the module).
+        quality (optional): A manim quality name.
+        workers (optional): The number of worker processes (default: one per core).
+
+    Returns:
+        dict: Scene name -> rendered movie path.
+    """
+    workers = workers or os.cpu_count()
+    scene_names = scene_names or find_scenes(load_module(module_path))
+    n = len(scene_names)
+    with ProcessPoolExecutor(workers) as pool:
+        counts = dict(zip(scene_names, pool.map(count_plays, [module_path] * n, scene_names, [quality] * n)))
+        total_plays = sum(plays for plays, _ in counts.values()) or 1
+
+        # Chunk scenes in proportion to their length, so every worker stays busy
+        finals, chunk_jobs, chunked = {}, [], []
+        for name, (plays, section_starts) in counts.items():
+            chunks = plan_chunks(plays, section_starts, round(workers * plays / total_plays))
+            if len(chunks) <= 1:
+                finals[name] = pool.submit(render_scene, module_path, name, quality)
+            else:
+                chunked.append(name)
+                chunk_jobs += [pool.submit(render_chunk, module_path, name, quality, *chunk) for chunk in chunks]
+        for job in chunk_jobs:
+            job.result()
+        for name in chunked:
+            finals[name] = pool.submit(render_scene, module_path, name, quality)
+        return {name: finals[name].result() for name in scene_names}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render the scenes of a module across a process pool.")
+    parser.add_argument("module", help="The scene module, e.g. tests.py.")
+    parser.add_argument("scenes", nargs="*", help="Scenes to render (default: all).")
+    parser.add_argument("-q", "--quality", default="low_quality",
+                        help="A manim quality name, e.g. low_quality or high_quality.")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="Worker processes (default: one per core).")
+    arguments = parser.parse_args()
+    start = time.perf_counter()
+    for scene_name, movie in run(arguments.module, arguments.scenes, arguments.quality, arguments.workers).items():
+        print(f"{scene_name}: {movie}")
+    print(f"Rendered in {time.perf_counter() - start:.1f}s")
@@ -1,5 +1,5 @@
 from manim import *
-from psi_creature import PsiCreature
+from psi_creature import PsiCreature, CreatureCrowd
 # ====================================================================
 #  UPDATED: Test Scene demonstrating all features
 # ====================================================================
@@ -250,4 +250,879 @@ class TestMouthExpressions(Scene):
         # 5. Prove the resized mouth can still change expressions correctly.
         self.play(psi.change_mouth("happy"))
         self.play(psi.blink())
-        self.wait(2)
\ No newline at end of file
+        self.wait(2)
+
+class TestIdleBehaviour(Scene):
+    def construct(self):
+        title = Text("Testing Idle Behaviour").to_edge(UP)
+        self.add(title)
+
+        # 1. Idle creatures blink, breathe and glance around during plain waits
+        psi = PsiCreature(initial_anchor_pos=LEFT * 3).start_idle(seed=1)
+        friend = PsiCreature(initial_anchor_pos=RIGHT * 3, eye_color=TEAL).start_idle(seed=2)
+        self.play(FadeIn(psi), FadeIn(friend))
+        self.wait(4)
+
+        # 2. Regular animations still work while idle
+        self.play(psi.change_state("pondering", look_at_target=friend, change_mouth_to="happy"))
+        self.wait(3)
+
+        # 3. A whole crowd idles from a single updater
+        self.play(FadeOut(psi), FadeOut(friend))
+        crowd = CreatureCrowd([[x, y, 0] for x in np.linspace(-5, 5, 8) for y in (-1.5, 1.5)], body_scale=0.8)
+        self.play(FadeIn(crowd.start_idle(seed=3)))
+        self.wait(4)
+
+# ====================================================================
+#  Numerical checks (run with `python -m pytest tests.py`)
+# ====================================================================
+import json
+import os
+import shutil
+from psi_creature import Sclera, Eyes, Mouth, bend_deformation, squint_deformation
+from psi_creature import compile_asset_bundle, load_bundled_template
+
+def _reference_bend_points(sclera, direction_vector, intensity):
+    # The original per-point implementation of Sclera._get_bend_target
+    target_points = sclera.original_points.copy()
+    main_displacement_vector = normalize(-direction_vector)
+    displacement_magnitude = sclera.height * intensity
+    for i, point in enumerate(sclera.original_points):
+        if np.linalg.norm(point) < 1e-6: continue
+        point_direction = normalize(point)
+        dot_p = np.clip(np.dot(normalize(direction_vector), point_direction), -1.0, 1.0)
+        angle_diff = np.arccos(dot_p)
+        if angle_diff > PI / 2: falloff_weight = 0.0
+        else:
+            falloff_weight = (np.cos(angle_diff) + 1) / 2 * np.cos(angle_diff)
+            falloff_weight = falloff_weight ** 1.5
+        target_points[i] += main_displacement_vector * displacement_magnitude * falloff_weight
+    return target_points
+
+def _reference_squint_points(sclera, theta):
+    # The original per-point implementation of Sclera._get_squint_target
+    target_points = sclera.original_points.copy()
+    theta = np.clip(theta, 0, PI / 2)
+    max_y = sclera.height / 2
+    squint_factor = np.sin(theta)
+    for i, point in enumerate(sclera.original_points):
+        if max_y == 0: continue
+        norm_y = np.abs(point[1]) / max_y
+        target_points[i, 1] += -point[1] * norm_y ** 2 * squint_factor
+    return target_points
+
+def test_sclera_deformation_parity():
+    scleras = [Sclera(width=0.3, height=0.3), Sclera(width=0.6, height=0.45), Sclera(width=1.0, height=0.0)]
+    directions = [UP, UP + RIGHT, UP + LEFT, DOWN + 0.3 * LEFT, RIGHT, ORIGIN]
+    for sclera in scleras:
+        for direction in directions:
+            for intensity in (0.0, 0.4, 0.75):
+                expected = _reference_bend_points(sclera, direction, intensity)
+                actual = bend_deformation(sclera.original_points, direction, sclera.height, intensity)
+                assert np.allclose(actual, expected, atol=1e-12)
+        for theta in (-0.2, 0.0, PI / 5, 0.7, PI / 2, 2.0):
+            expected = _reference_squint_points(sclera, theta)
+            actual = squint_deformation(sclera.original_points, theta, sclera.height)
+            assert np.allclose(actual, expected, atol=1e-12)
+
+    # A whole stack of scleras in a single call
+    stack = np.stack([sclera.original_points for sclera in scleras])
+    heights = [sclera.height for sclera in scleras]
+    bend_dirs = [UP + RIGHT, DOWN, LEFT]
+    bent = bend_deformation(stack, bend_dirs, heights, 0.5)
+    squinted = squint_deformation(stack, [0.3, 0.9, PI / 4], heights)
+    for i, sclera in enumerate(scleras):
+        assert np.allclose(bent[i], _reference_bend_points(sclera, bend_dirs[i], 0.5), atol=1e-12)
+        assert np.allclose(squinted[i], _reference_squint_points(sclera, [0.3, 0.9, PI / 4][i]), atol=1e-12)
+
+    # Targets built through the batched Sclera API match the per-eye path
+    left, right = Sclera(width=0.3, height=0.3), Sclera(width=0.3, height=0.3)
+    right.shift(RIGHT)
+    targets = Sclera.get_bend_targets([left, right], [UP + RIGHT, UP + LEFT], intensity=0.4)
+    for sclera, direction, target in zip([left, right], [UP + RIGHT, UP + LEFT], targets):
+        assert np.allclose(target.get_points(), sclera._get_bend_target(direction, 0.4).get_points())
+
+def test_deformation_cache_is_shared_bounded_and_quantized():
+    from psi_creature import DeformationCache
+
+    cache = DeformationCache(max_entries=2, quantum=1e-3)
+    first, second = PsiCreature().eyes, PsiCreature(initial_anchor_pos=RIGHT * 3).eyes
+    scleras = [first.left_eye.sclera, second.left_eye.sclera]
+    bent = cache.get_bend_points(scleras, [UP + RIGHT, (UP + RIGHT) * 2.0001], [0.4, 0.4002])
+    # Same size, same (quantized) bend: one deformation, one shared array
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1) and bent[0] is bent[1]
+    assert not bent[0].flags.writeable
+    sclera = scleras[0]
+    np.testing.assert_allclose(bent[0], bend_deformation(sclera.original_points, UP + RIGHT, sclera.height, 0.4), atol=1e-12)
+
+    squinted = cache.get_squint_points([sclera], [PI / 4])[0]
+    np.testing.assert_allclose(squinted, squint_deformation(sclera.original_points, 0.785, sclera.height), atol=1e-12)
+    # A different size is a different entry; the least recently used one goes
+    cache.get_squint_points([Sclera(width=0.5, height=0.5)], [PI / 4])
+    assert len(cache) == 2 and cache.misses == 3
+    cache.get_bend_points([sclera], [UP + RIGHT], [0.4])
+    assert cache.misses == 4
+    # A batch with more misses than fit still returns all of them
+    scleras = [Sclera(width=0.2 + 0.1 * i, height=0.3) for i in range(5)]
+    squinted = cache.get_squint_points(scleras + scleras[:1], [PI / 4] * 6)
+    assert len(cache) == 2 and squinted[5] is squinted[0]
+    for sclera, points in zip(scleras, squinted):
+        np.testing.assert_allclose(points, squint_deformation(sclera.original_points, 0.785, sclera.height), atol=1e-12)
+    cache.clear()
+    assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
+
+def test_blendshapes_match_deformation_targets():
+    from pytest import approx
+
+    eyes = Eyes(separation=0.24, eye_width=0.15, eye_height=0.15).shift(2 * LEFT)
+    left, right = eyes.left_eye.sclera, eyes.right_eye.sclera
+    expected_left = left._get_squint_target(0.6).get_points()
+    eyes.set_blend_weights(eyes.get_expression_weights(squint_amount=0.6))
+    assert np.allclose(left.get_points(), expected_left)
+
+    eyes.set_blend_weights({})
+    expected_right = right._get_bend_target(UP + LEFT, 0.5).get_points()
+    eyes.set_blend_weights(eyes.get_expression_weights(bend_direction=UP + RIGHT, bend_intensity=0.5))
+    assert np.allclose(right.get_points(), expected_right)
+
+    # Arbitrary bend directions get bases of their own, up to a bound; those in use are kept
+    from psi_creature import MAX_EXTRA_BEND_DIRECTIONS, SCLERA_BEND_DIRECTIONS
+    eyes.set_blend_weights({})
+    expected_bend = left._get_bend_target(np.array([0.3, 1, 0]), 0.4).get_points()
+    in_use = left.get_bend_basis_name(np.array([0.3, 1, 0]))
+    left.set_blend_weights({in_use: 0.4})
+    for angle in np.linspace(0.1, 3, 40):
+        left.get_bend_basis_name(np.array([np.cos(angle), np.sin(angle) - 0.5, 0]))
+    assert len(left.bend_directions) == len(SCLERA_BEND_DIRECTIONS) + MAX_EXTRA_BEND_DIRECTIONS
+    assert in_use in left.bend_directions
+    left.set_blend_weights({in_use: 0.4})
+    np.testing.assert_allclose(left.get_points(), expected_bend, atol=1e-5)
+
+    # Blends ease with their rate_func, smooth by default
+    for rate_func in (smooth, linear):
+        eyes.set_blend_weights({})
+        blend = eyes.blend_to({"squint": 0.8}, **({} if rate_func is smooth else {"rate_func": rate_func}))
+        blend.begin()
+        blend.interpolate(0.25)
+        assert left.blend_weights["squint"] == approx(0.8 * rate_func(0.25))
+
+    mouth = Mouth(width=0.25, emotion_intensity=0.1).shift(UP)
+    expected = Mouth("sad_smirk", width=0.25, emotion_intensity=0.1).move_to(mouth)
+    mouth.set_blend_weights({"sad_smirk": 1.0})
+    assert np.allclose(mouth.submobjects[0].get_points(), expected.submobjects[0].get_points())
+
+def test_crowd_matches_individual_creatures():
+    anchors = np.array([[-3.0, 0.5, 0.0], [2.0, -1.0, 0.0]])
+    crowd = CreatureCrowd(anchors)
+    psi = PsiCreature(initial_anchor_pos=anchors[0])
+    for creatures in (crowd, psi):
+        animation = creatures.change_state("pondering", look_at_target=ORIGIN, change_mouth_to="happy", squint_amount=0.5)
+        animation.begin()
+        animation.finish()
+
+    body_points = np.concatenate([m.points for m in psi.body.family_members_with_points()])
+    np.testing.assert_allclose(crowd.bodies.points[:len(body_points)], body_points, atol=1e-12)
+    eyes = (psi.eyes.left_eye, psi.eyes.right_eye)
+    for part, name in ((crowd.scleras, "sclera"), (crowd.irises, "iris"), (crowd.pupils, "pupil")):
+        expected = np.concatenate([getattr(eye, name).points for eye in eyes])
+        np.testing.assert_allclose(part.points[:len(expected)], expected, atol=1e-12)
+    np.testing.assert_allclose(crowd.mouths.points[:4], psi.mouth.submobjects[0].points, atol=1e-12)
+
+    # A blink closes the eyes half way through and ends with them back open
+    rest_height = np.ptp(crowd.scleras.points[:, 1])
+    blink = crowd.blink()
+    blink.begin()
+    blink.interpolate(0.5)
+    assert np.ptp(crowd.scleras.points[:, 1]) < rest_height
+    blink.finish()
+    np.testing.assert_allclose(np.ptp(crowd.scleras.points[:, 1]), rest_height, atol=1e-12)
+
+def test_states_load_on_first_use():
+    # A size no other test uses, so the shared assets start out empty
+    psi = PsiCreature(body_scale=2.2)
+    assert list(psi.templates) == ["default"]
+    assert {"default", "pondering", "hand_up"} <= set(psi.state_paths)
+
+    # A state first used after a squint and a resize still gets rest-pose offsets at the new scale
+    psi.squint(PI / 3).begin()
+    psi.resize(1.5).begin()
+    psi.change_state("pondering")
+    reference = PsiCreature(initial_state="pondering", body_scale=3.3)
+    for table in ("anchor_vectors", "eyes_offsets", "mouth_offsets"):
+        np.testing.assert_allclose(getattr(psi, table)["pondering"], getattr(reference, table)["pondering"], atol=1e-12)
+
+def test_copies_share_assets_and_own_their_parts():
+    psi = PsiCreature()
+    psi.change_state("pondering")
+    copy = psi.copy()
+    assert copy.assets is psi.assets is PsiCreature().assets
+    body_points = [part.points for part in psi.body.family_members_with_points()]
+    copied_points = [part.points for part in copy.body.family_members_with_points()]
+    assert not any(np.shares_memory(a, b) for a, b in zip(body_points, copied_points))
+    assert not psi.templates["default"].family_members_with_points()[0].points.flags.writeable
+
+    # Resizing moves a creature to the assets of its new size, leaving the others alone
+    psi.resize(1.5).begin()
+    assert psi.assets is not copy.assets and psi.assets.body_scale == 3.0
+    np.testing.assert_allclose(psi.eyes_offsets["pondering"], copy.eyes_offsets["pondering"] * 1.5, atol=1e-12)
+
+def test_template_cache_hits_returns_copies_and_follows_mtime(tmp_path):
+    from psi_creature import SVG_TEMPLATE_CACHE, TemplateCache
+
+    shutil.copy("assets/pondering.svg", tmp_path)
+    svg_path = str(tmp_path / "pondering.svg")
+    cache = TemplateCache(max_entries=2)
+    first = cache.get(svg_path, BLUE_E, 2.0)
+    cached = cache._entries[cache.make_key(svg_path, BLUE_E, 2.0)]
+    # A hit parses nothing and hands out a fresh copy every time
+    first.shift(RIGHT).set_color(RED)
+    second = cache.get(svg_path, BLUE_E, 2.0)
+    assert len(cache) == 1 and cache._entries[cache.make_key(svg_path, BLUE_E, 2.0)] is cached
+    assert first is not second and second is not cached
+    for expected, actual in zip(cached.family_members_with_points(), second.family_members_with_points()):
+        np.testing.assert_array_equal(actual.points, expected.points)
+    assert second.get_color() == ManimColor(BLUE_E)
+
+    # Touching the file is a new key; the stale entry is never returned again
+    mtime = os.path.getmtime(svg_path)
+    os.utime(svg_path, (mtime + 10, mtime + 10))
+    refreshed = cache.get(svg_path, BLUE_E, 2.0)
+    assert len(cache) == 2 and cache._entries[cache.make_key(svg_path, BLUE_E, 2.0)] is not cached
+    np.testing.assert_allclose(refreshed.get_center(), second.get_center(), atol=1e-12)
+    cache.get(svg_path, RED, 2.0)
+    assert len(cache) == 2 and cached not in cache._entries.values()
+    assert cache.invalidate(svg_path) == 2 and len(cache) == 0
+
+    # Creatures draw their templates from the shared cache
+    psi = PsiCreature(body_scale=2.6)
+    assets = psi.assets
+    assert cache.make_key(assets.state_paths["default"], assets.body_color, 2.6, assets.path_tolerance) in SVG_TEMPLATE_CACHE._entries
+
+def test_change_mouth_eases_with_its_rate_func():
+    from pytest import approx
+
+    for kwargs, rate_func in (({}, smooth), ({"rate_func": there_and_back}, there_and_back)):
+        psi = PsiCreature()
+        animation = psi.change_mouth("happy", **kwargs)
+        animation.begin()
+        animation.interpolate(0.25)
+        assert psi.mouth.blend_weights["happy"] == approx(rate_func(0.25))
+        animation.finish()
+        assert psi.mouth.blend_weights.get("happy", 0.0) == approx(rate_func(1))
+
+def test_resize_eases_with_its_rate_func():
+    import pytest
+
+    psi = PsiCreature()
+    rest_height = psi.body.height
+    resize = psi.resize(2)
+    resize.begin()
+    resize.interpolate(0.25)
+    assert psi.body.height == pytest.approx(rest_height * interpolate(1, 2, smooth(0.25)))
+    resize.finish()
+    assert psi.body.height == pytest.approx(2 * rest_height)
+
+    # Going there and back ends where it started
+    resize = psi.resize(1.5, rate_func=there_and_back)
+    resize.begin()
+    resize.interpolate(0.5)
+    assert psi.body.height == pytest.approx(3 * rest_height)
+    resize.finish()
+    assert psi.body.height == pytest.approx(2 * rest_height)
+
+def test_compiled_bundle_matches_svg_and_detects_stale_sources(tmp_path):
+    shutil.copy("assets/pondering.svg", tmp_path)
+    bundle_dir = compile_asset_bundle(str(tmp_path))
+    svg_path = str(tmp_path / "pondering.svg")
+
+    parsed = SVGMobject(svg_path, use_svg_cache=False)
+    bundled = load_bundled_template(svg_path)
+    for expected, actual in zip(parsed.family_members_with_points(), bundled.family_members_with_points()):
+        np.testing.assert_array_equal(actual.points, expected.points)
+
+    # The manifest describes the point arrays only; layouts come from `PsiCreature.layout_for`
+    with open(os.path.join(bundle_dir, "manifest.json")) as f:
+        entry = json.load(f)["states"]["pondering"]
+    assert set(entry) == {"source", "mtime_ns", "size", "point_counts", "styles"}
+    assert sum(entry["point_counts"]) == len(np.load(os.path.join(bundle_dir, "pondering.npy")))
+
+    with open(svg_path, "a") as f:
+        f.write("\n")
+    assert load_bundled_template(svg_path) is None
+
+def test_layout_for_is_shared_and_matches_creatures():
+    import pytest
+
+    layout = PsiCreature.layout_for("hand_up", body_scale=1.3, eye_height=0.4)
+    assert PsiCreature.layout_for("hand_up", body_scale=1.3, eye_height=0.4) is layout
+    psi = PsiCreature(initial_state="hand_up", body_scale=1.3, eye_height=0.4)
+    np.testing.assert_array_equal(psi.eyes_offsets["hand_up"], layout["eyes_offset"])
+    np.testing.assert_array_equal(psi.mouth_offsets["hand_up"], layout["mouth_offset"])
+    np.testing.assert_allclose(psi.eyes.get_center(), psi.anchor_pos + layout["eyes_offset"], atol=1e-12)
+    with pytest.raises(ValueError):
+        PsiCreature.layout_for("no_such_state")
+
+    # A creature of any color parses its SVGs once, at its own color
+    from psi_creature import SVG_TEMPLATE_CACHE
+    PsiCreature(initial_state="hand_up", body_scale=1.7, body_color=RED)
+    keys = [key for key in SVG_TEMPLATE_CACHE._entries if key[0].endswith("hand_up.svg") and key[3] == 1.7]
+    assert keys and {key[2] for key in keys} == {ManimColor(RED).to_hex()}
+
+def test_idle_pose_is_seeded_and_leaves_rest_pose_intact():
+    psi, twin, reference = PsiCreature().start_idle(seed=3), PsiCreature().start_idle(seed=3), PsiCreature()
+    for _ in range(240):
+        psi.update(1 / 60)
+        twin.update(1 / 60)
+    for part, twin_part in zip(psi.family_members_with_points(), twin.family_members_with_points()):
+        np.testing.assert_array_equal(part.points, twin_part.points)
+
+    # Animations built while idle start from the rest pose, and idle rebases onto their result
+    for creature in (psi, reference):
+        animation = creature.change_state("pondering", look_at_target=UP * 3, change_mouth_to="happy")
+        animation.begin()
+        for alpha in np.linspace(0, 1, 20):
+            animation.interpolate(alpha)
+            if creature is psi:
+                psi.update(1 / 60)
+        animation.finish()
+    psi.update(1 / 60)
+    psi.stop_idle()
+    for part, reference_part in zip(psi.family_members_with_points(), reference.family_members_with_points()):
+        np.testing.assert_allclose(part.points, reference_part.points, atol=1e-12)
+
+    # The schedule wraps around without snapping an eye back to rest
+    from psi_creature import IdleSchedule
+    schedule = IdleSchedule(count=50, seed=0, duration=10.0)
+    before, after = schedule.evaluate(10.0 - 1e-6), schedule.evaluate(10.0 + 1e-6)
+    for pose_before, pose_after in zip(before[1:], after[1:]):
+        np.testing.assert_allclose(pose_before, pose_after, atol=1e-4)
+
+def test_blendshape_animations_on_an_idle_creature_do_not_drift():
+    builders = (
+        lambda creature: creature.change_mouth("happy", run_time=2),
+        lambda creature: creature.blend_expression(squint_amount=0.4, mouth_weights={"sad": 1.0}),
+    )
+    for build in builders:
+        psi, reference = PsiCreature().start_idle(seed=3), PsiCreature()
+        for creature in (psi, reference):
+            animation = build(creature)
+            animation.begin()
+            for alpha in np.linspace(0, 1, 121)[1:]:
+                animation.interpolate(alpha)
+                if creature is psi:
+                    psi.update(1 / 60)
+            animation.finish()
+        psi.update(1 / 60)
+        psi.stop_idle()
+        np.testing.assert_allclose(psi.mouth.get_center(), reference.mouth.get_center(), atol=1e-9)
+        for part, reference_part in zip(psi.family_members_with_points(), reference.family_members_with_points()):
+            np.testing.assert_allclose(part.points, reference_part.points, atol=1e-9)
+
+def test_performance_script_merges_overlapping_actions():
+    import pytest
+    from performance_script import compile_script
+
+    script = {
+        "creatures": {"psi": {}, "bob": {}},
+        "timeline": [
+            {"at": 0, "creature": "psi", "action": "change_state", "state": "pondering"},
+            {"at": 0.5, "creature": "psi", "action": "change_mouth", "emotion": "happy"},
+            {"at": 0.5, "creature": "bob", "action": "look_at", "target": "psi"},
+            {"at": 3, "creature": "psi", "action": "move_anchor_to", "position": [1, 0, 0]},
+            {"at": 3, "creature": "psi", "action": "resize", "factor": 2},
+        ],
+    }
+    segments = compile_script(script)
+    assert [(segment["start"], segment["end"]) for segment in segments] == [(0, 1.5), (3, 4)]
+    assert [[action["action"] for action in call["actions"]] for call in segments[0]["calls"]] == [
+        ["change_state", "change_mouth"], ["look_at"]
+    ]
+
+    script["timeline"].append({"at": 3.5, "creature": "psi", "action": "blink"})
+    with pytest.raises(ValueError):
+        compile_script(script)
+
+    # Every action's own fields are checked up front, by entry
+    from performance_script import validate_script
+    validate_script(script)
+    script["timeline"].insert(2, {"at": 1, "creature": "psi", "action": "change_state"})
+    with pytest.raises(ValueError, match="Timeline entry 2: 'change_state' is missing 'state'"):
+        validate_script(script)
+    script["timeline"][2] = {"at": 1, "creature": "bob", "action": "resize"}
+    with pytest.raises(ValueError, match="Timeline entry 2: 'resize' is missing 'factor'"):
+        validate_script(script)
+
+def test_performance_script_builds_merged_calls():
+    import pytest
+    from performance_script import build_animation, build_creatures, compile_script
+
+    def play(script: dict) -> dict:
+        creatures = build_creatures(script)
+        for segment in compile_script(script):
+            for call in segment["calls"]:
+                animation = build_animation(call, creatures)
+                animation.begin()
+                animation.interpolate(0.5)
+                animation.finish()
+        return creatures
+
+    # An overlapping move and resize end at the new anchor and the new size, in either order
+    height = PsiCreature().body.height
+    for first, second in (("move_anchor_to", "resize"), ("resize", "move_anchor_to")):
+        actions = {
+            "move_anchor_to": {"creature": "psi", "action": "move_anchor_to", "position": [2, 1, 0]},
+            "resize": {"creature": "psi", "action": "resize", "factor": 2},
+        }
+        script = {"creatures": {"psi": {}}, "timeline": [dict(actions[first], at=0), dict(actions[second], at=0.2)]}
+        psi = play(script)["psi"]
+        assert psi.body.height == pytest.approx(2 * height)
+        np.testing.assert_allclose(psi.anchor_pos, [2, 1, 0])
+        np.testing.assert_allclose(psi.body.get_center() + psi.anchor_vectors[psi.current_state_name], [2, 1, 0], atol=1e-9)
+
+    # Merged face actions keep their own times within the call
+    script = {
+        "creatures": {"psi": {}},
+        "timeline": [
+            {"at": 0, "creature": "psi", "action": "change_state", "state": "pondering"},
+            {"at": 0.5, "creature": "psi", "action": "change_mouth", "emotion": "happy"},
+        ],
+    }
+    creatures = build_creatures(script)
+    (call,) = compile_script(script)[0]["calls"]
+    animation = build_animation(call, creatures)
+    animation.begin()
+    animation.interpolate(0.3)
+    assert creatures["psi"].mouth.blend_weights == {"neutral": 1.0}
+    animation.interpolate(0.9)
+    assert 0 < creatures["psi"].mouth.blend_weights["happy"] < 1
+    animation.finish()
+    assert creatures["psi"].mouth.blend_weights == {"happy": 1.0}
+
+    # Two overlapping state changes to different states conflict
+    script["timeline"][1] = {"at": 0.5, "creature": "psi", "action": "change_state", "state": "hand_up"}
+    (call,) = compile_script(script)[0]["calls"]
+    with pytest.raises(ValueError):
+        build_animation(call, build_creatures(script))
+
+def test_render_runner_splits_at_sections_or_evenly():
+    from render_runner import plan_chunks
+
+    assert plan_chunks(40, [0, 10, 25], target_chunks=4) == [(0, 9), (10, 24), (25, 39)]
+    assert plan_chunks(40, [], target_chunks=4) == [(0, 9), (10, 19), (20, 29), (30, 39)]
+    assert plan_chunks(3, [], target_chunks=1) == [(0, 2)]
+
+def test_render_runner_chunks_add_up_to_a_single_render():
+    from render_runner import count_plays, plan_chunks, render_chunk, _render_config
+
+    # Under dry_run nothing is written, but every rendered play is still hashed
+    # from the animations and the scene's mobjects as they stand when it starts
+    with tempconfig({"dry_run": True}):
+        num_plays, section_starts = count_plays("tests.py", "MultiPartTest", "low_quality")
+        chunks = plan_chunks(num_plays, section_starts, target_chunks=3)
+        assert len(chunks) == 3
+        chunked = [play_hash for chunk in chunks for play_hash in render_chunk("tests.py", "MultiPartTest", "low_quality", *chunk)]
+        with tempconfig(_render_config("tests.py", "low_quality")):
+            scene = MultiPartTest()
+            scene.render()
+    assert len(chunked) == num_plays == len(scene.renderer.animations_hashes)
+    assert None not in chunked and chunked == scene.renderer.animations_hashes
+
+def test_play_hash_follows_visible_state_only():
+    import inspect
+    import pytest
+    from manim.utils.hashing import get_hash_from_play_call
+    from psi_creature import FINGERPRINT_HASHING
+
+    fresh, seasoned = PsiCreature(), PsiCreature()
+    # Loading templates and leaving a body target behind changes nothing visible
+    seasoned.change_state("pondering")
+    seasoned.change_state("default")
+    assert fresh.get_fingerprint() == seasoned.get_fingerprint()
+
+    moved = PsiCreature(initial_anchor_pos=RIGHT)
+    assert moved.get_fingerprint()["digest"] != PsiCreature().get_fingerprint()["digest"]
+    assert PsiCreature().start_idle(seed=1).get_fingerprint() != PsiCreature().start_idle(seed=2).get_fingerprint()
+
+    if not FINGERPRINT_HASHING:
+        pytest.skip("this manim version has no play-call encoder to hash fingerprints with")
+    scene = Scene()
+    # Newer manim versions also key the hash on the backend and encoder settings
+    parameters = inspect.signature(get_hash_from_play_call).parameters
+    cache_identity = {"backend": "cairo", "encoder_fingerprint": "test", "renderer_state": None}
+    cache_identity = {key: value for key, value in cache_identity.items() if key in parameters}
+    def play_hash(psi, animation):
+        return get_hash_from_play_call(scene, scene.renderer.camera, [animation], [psi], **cache_identity)
+
+    assert play_hash(fresh, fresh.change_mouth("happy")) == play_hash(seasoned, seasoned.change_mouth("happy"))
+    assert play_hash(fresh, fresh.change_mouth("sad")) != play_hash(seasoned, seasoned.change_mouth("happy"))
+    # Hashing runs back to back without leftovers from the previous call
+    assert play_hash(fresh, fresh.change_mouth("happy")) == play_hash(fresh, fresh.change_mouth("happy"))
+
+def test_benchmark_comparison_flags_regressions_only():
+    from benchmarks import compare
+
+    baseline = [{"name": "frame", "seconds": 1.0, "peak_bytes": 100}, {"name": "memory", "retained_bytes": 1000}]
+    results = [
+        {"name": "frame", "seconds": 1.2, "peak_bytes": 200},
+        {"name": "memory", "retained_bytes": 900},
+        {"name": "new benchmark", "seconds": 5.0},
+    ]
+    assert compare(results, baseline, tolerance=0.25) == [("frame", "peak_bytes", 100, 200)]
+
+    # On a machine twice as slow, timings are judged against twice the baseline
+    from benchmarks import CALIBRATION
+    baseline.append({"name": CALIBRATION, "seconds": 0.01, "peak_bytes": 10})
+    slower = [{"name": "frame", "seconds": 2.2, "peak_bytes": 100}, {"name": CALIBRATION, "seconds": 0.02, "peak_bytes": 10}]
+    assert compare(slower, baseline, tolerance=0.25) == []
+    slower[0]["seconds"] = 2.6
+    assert compare(slower, baseline, tolerance=0.25) == [("frame", "seconds", 2.0, 2.6)]
+
+def test_profiler_records_spans_and_unpatches():
+    from profiling import Profiler
+
+    original_change_state = PsiCreature.change_state
+    with Profiler() as profiler:
+        psi = PsiCreature()
+        animation = psi.change_state("pondering", change_mouth_to="happy")
+        animation.begin()
+        animation.interpolate(0.5)
+    assert PsiCreature.change_state is original_change_state
+    totals = profiler.totals()
+    assert totals["PsiCreature()"]["calls"] == 1
+    assert totals["PsiCreature.change_state"]["calls"] == 1
+    assert totals["PsiCreature.change_mouth"]["calls"] == 1
+    assert totals["AnimationGroup.interpolate"]["calls"] == 1
+    events = profiler.chrome_trace()["traceEvents"]
+    assert len(events) == len(profiler.events) and all(event["ph"] == "X" for event in events)
+
+def test_apply_state_matches_played_change_state():
+    import pytest
+
+    options = [
+        dict(look_at_target=LEFT * 3 + UP, change_mouth_to="happy", squint_amount=PI / 5),
+        dict(look_straight=True, change_mouth_to="sad", bend_direction=UP + 0.3 * RIGHT, bend_intensity=0.3),
+        dict(look_at_target=DOWN, squint_amount=0.4, bend_direction=LEFT),
+    ]
+    for kwargs in options:
+        played, applied = PsiCreature(initial_anchor_pos=LEFT), PsiCreature(initial_anchor_pos=LEFT)
+        animation = played.change_state("pondering", **kwargs)
+        animation.begin()
+        animation.finish()
+        assert applied.apply_state("pondering", **kwargs) is applied
+        assert applied.current_state_name == "pondering" and applied.body in applied.submobjects
+        assert applied.eyes.blend_weights == played.eyes.blend_weights
+        # The played body keeps its old subpath structure, aligned to the new shape
+        np.testing.assert_allclose(applied.body.get_critical_point(UL), played.body.get_critical_point(UL), atol=1e-9)
+        np.testing.assert_allclose(applied.body.get_critical_point(DR), played.body.get_critical_point(DR), atol=1e-9)
+        # Played deformations come from the cache, with their parameters quantized
+        for part, atol in (("eyes", 1e-5), ("mouth", 1e-9)):
+            expected_parts = getattr(played, part).family_members_with_points()
+            for expected, actual in zip(expected_parts, getattr(applied, part).family_members_with_points()):
+                np.testing.assert_allclose(actual.points, expected.points, atol=atol)
+    with pytest.raises(ValueError):
+        PsiCreature().apply_state("no_such_state")
+
+def test_fused_change_state_shares_one_buffer_and_matches_the_group():
+    import pytest
+    from psi_creature import CreatureTransform
+
+    options = dict(look_at_target=LEFT * 3 + UP, change_mouth_to="happy", squint_amount=PI / 5, bend_direction=UP)
+    grouped, fused = PsiCreature(initial_anchor_pos=LEFT), PsiCreature(initial_anchor_pos=LEFT)
+    group = grouped.change_state("pondering", **options)
+    animation = fused.change_state("pondering", fused=True, **options)
+    assert isinstance(animation, CreatureTransform) and fused.current_state_name == "pondering"
+    start = [member.points.copy() for member in fused.family_members_with_points()]
+    animation.begin()
+    # Every part is a view into the one buffer, and begin leaves the start pose in place
+    for member, points in zip(fused.family_members_with_points(), start):
+        assert member.points.base is animation.buffer
+        if member.points.shape == points.shape:
+            np.testing.assert_allclose(member.points, points, atol=1e-12)
+    animation.interpolate(0.5)
+    half = animation.rate_func(0.5)
+    np.testing.assert_allclose(animation.buffer, animation.start + half * animation.delta)
+    group.begin()
+    group.finish()
+    animation.finish()
+    for expected, actual in zip(grouped.family_members_with_points(), fused.family_members_with_points()):
+        assert actual.points.base is None
+        np.testing.assert_allclose(actual.points, expected.points, atol=1e-5)
+    assert fused.eyes.blend_weights == grouped.eyes.blend_weights and fused.mouth.blend_weights == {"happy": 1.0}
+
+    # The logical state is recorded at build time, as the group does, and later builds do not move the end pose
+    grouped, fused = PsiCreature(), PsiCreature()
+    group = grouped.change_state("pondering", **options)
+    animation = fused.change_state("pondering", fused=True, **options)
+    logical_state = lambda psi: (psi.current_state_name, psi.mouth.emotion, psi.eyes.blend_weights)
+    assert logical_state(fused) == logical_state(grouped) == ("pondering", "happy", grouped.eyes.blend_weights)
+    assert grouped.eyes.blend_weights
+    later = fused.squint(0.1)
+    assert fused.eyes.blend_weights == {"squint": pytest.approx(np.sin(0.1))}
+    for psi, played in ((grouped, group), (fused, animation)):
+        played.begin()
+        played.finish()
+    assert fused.eyes.blend_weights == {"squint": pytest.approx(np.sin(0.1))}
+    np.testing.assert_allclose(fused.eyes.left_eye.sclera.points, grouped.eyes.left_eye.sclera.points, atol=1e-5)
+
+def test_body_transitions_reuse_cached_aligned_pairs():
+    from psi_creature import AlignedTransform, Become
+
+    psi, reference = PsiCreature(initial_anchor_pos=LEFT), PsiCreature(initial_anchor_pos=LEFT)
+    pair = psi.assets.get_body_pair("default", "pondering")
+    assert psi.assets.get_body_pair("default", "pondering") is pair
+    start, end = pair[:2]
+    assert [len(m.points) for m in start.family_members_with_points()] == [len(m.points) for m in end.family_members_with_points()]
+    assert not any(member.points.flags.writeable for member in [*start.get_family(), *end.get_family()])
+    for state in ("pondering", "default", "pondering"):
+        animation = psi.change_state(state)
+        assert isinstance(animation.animations[0], AlignedTransform)
+        animation.begin()
+        animation.finish()
+        reference.apply_state(state)
+        for corner in (UL, DR):
+            np.testing.assert_allclose(psi.body.get_critical_point(corner), reference.body.get_critical_point(corner), atol=1e-9)
+    # Once moved to the anchor and back, the cached pair translates with it
+    animation = psi.move_anchor_to(RIGHT * 2)
+    animation.begin()
+    animation.finish()
+    assert isinstance(psi.change_state("default").animations[0], AlignedTransform)
+    # A body that is not an untouched pose of its state falls back to a Become
+    restyled = PsiCreature()
+    restyled.body.set_fill(RED)
+    assert type(restyled.change_state("pondering").animations[0]) is Become
+
+def test_transitions_end_with_the_targets_own_points():
+    from psi_creature import Become
+
+    def point_counts(mobject):
+        return [len(member.points) for member in mobject.family_members_with_points()]
+
+    # The templates of this size differ in point counts, so every transition pads them
+    psi = PsiCreature(body_scale=0.5, detail_level=2)
+    restyled = PsiCreature(body_scale=0.5, detail_level=2)
+    restyled.body.set_fill(RED)
+    for state in ("pondering", "hand_up", "default", "pondering", "default"):
+        for creature, fused in ((psi, False), (psi, True), (restyled, False)):
+            animation = creature.change_state(state, fused=fused)
+            animation.begin()
+            animation.finish()
+            assert point_counts(creature.body) == point_counts(creature.templates[state])
+            np.testing.assert_allclose(
+                creature.body.get_critical_point(UL), creature._create_body_at_anchor(state, creature.anchor_pos).get_critical_point(UL)
+            )
+    # Become hands over the target as it was built, not as aligned with a bigger creature
+    big, small = PsiCreature(), PsiCreature(body_scale=0.5, detail_level=2)
+    expected = point_counts(small)
+    animation = Become(big, small)
+    animation.begin()
+    animation.finish()
+    assert point_counts(big) == expected
+
+def test_lip_sync_streams_wav_and_reshapes_mouth_in_place(tmp_path):
+    import wave
+    import pytest
+    from lip_sync import LipSyncTrack, lip_sync
+
+    # 1 s of silence, then 1 s of a 200 Hz tone, then 1 s of a 3 kHz tone; stereo 16 bit
+    rate = 8000
+    t = np.arange(rate) / rate
+    signal = np.concatenate([np.zeros(rate), 0.5 * np.sin(TAU * 200 * t), 0.5 * np.sin(TAU * 3000 * t)])
+    path = str(tmp_path / "voice.wav")
+    with wave.open(path, "wb") as wav:
+        wav.setnchannels(2)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(np.repeat((signal * 32767).astype("<i2"), 2).tobytes())
+
+    whole = LipSyncTrack.analyse(path, 15, block_seconds=100)
+    streamed = LipSyncTrack.analyse(path, 15, block_seconds=0.05)
+    np.testing.assert_allclose(streamed[0], whole[0], atol=1e-6)
+    np.testing.assert_allclose(streamed[1], whole[1], rtol=1e-4, atol=1e-6)
+
+    track = LipSyncTrack.from_wav(path, frame_rate=15)
+    assert len(track.openness) == 45
+    assert track.evaluate(0.5) == (0.0, 0.0)
+    low, high = track.evaluate(1.5), track.evaluate(2.5)
+    assert low[0] > 0.9 and high[0] > 0.9
+    assert low[1] < -0.9 and high[1] > 0.9
+
+    psi = PsiCreature()
+    rest = psi.mouth.submobjects[0].points.copy()
+    buffer = psi.mouth.submobjects[0].points
+    updater = lip_sync(psi, path, frame_rate=15)
+    for _ in range(22):
+        psi.update(1 / 15)
+    assert psi.mouth.submobjects[0].points is buffer
+    assert not np.allclose(buffer, rest)
+    np.testing.assert_allclose(psi.mouth.get_center(), (rest[0] + rest[3]) / 2, atol=1e-12)
+    for _ in range(30):
+        psi.update(1 / 15)
+    np.testing.assert_allclose(buffer, rest, atol=1e-12)
+    assert updater in psi.mouth.updaters
+
+    # Following the scene, the clock keeps running while an animation holds the mouth
+    class Talk(Scene):
+        def construct(self):
+            psi = PsiCreature()
+            self.add(psi)
+            self.updater = lip_sync(psi, path, frame_rate=15, scene=self)
+            self.wait(1)
+            self.play(psi.change_mouth("happy"), run_time=1)
+            self.wait(1)
+
+    with tempconfig({"dry_run": True, "quality": "low_quality", "verbosity": "WARNING", "progress_bar": "none"}):
+        scene = Talk()
+        scene.render()
+    assert scene.updater.get_time() == pytest.approx(3.0)
+
+def test_gaze_tracking_follows_a_moving_target():
+    target = Dot(RIGHT * 3 + UP)
+    psi = PsiCreature(initial_anchor_pos=LEFT).track(target)
+    eye = psi.eyes.left_eye
+    for shift in (ORIGIN, LEFT * 6, DOWN * 2):
+        target.shift(shift)
+        psi.update(1 / 15)
+        np.testing.assert_allclose(eye.iris.get_center(), eye.get_gaze_position(target), atol=1e-9)
+
+    # Smoothed, the eyes ease towards the target without reaching it in one frame
+    start = eye.iris.get_center()
+    psi.track(target.shift(RIGHT * 6), smoothing=0.2)
+    psi.update(1 / 15)
+    eased = eye.iris.get_center()
+    assert 0 < np.linalg.norm(eased - start) < np.linalg.norm(eye.get_gaze_position(target) - start)
+    # Lagging, they keep looking where the target was
+    psi.track(target, lag=0.2)
+    psi.update(1 / 15)
+    target.shift(LEFT * 6)
+    psi.update(1 / 15)
+    assert eye.iris.get_center()[0] > eye.sclera.get_center()[0]
+    psi.stop_tracking()
+    assert psi.gaze_tracker is None and not psi.updaters
+
+    anchors = np.array([[-3.0, 0.5, 0.0], [2.0, -1.0, 0.0]])
+    crowd = CreatureCrowd(anchors).track(lambda: target.get_center())
+    crowd.update(1 / 15)
+    expected = CreatureCrowd(anchors)
+    animation = expected.look_at(target)
+    animation.begin()
+    animation.finish()
+    np.testing.assert_allclose(crowd.irises.points, expected.irises.points, atol=1e-9)
+
+def test_detail_level_follows_size_and_switches_seamlessly():
+    import pytest
+    from psi_creature import DETAIL_LEVELS, detail_level_for, get_path_tolerance, simplify_bezier_points, _sample_curves
+    from performance_script import build_creatures
+
+    fine_circle = Circle(radius=1.0, num_components=33).points
+    simplified = simplify_bezier_points(fine_circle, 1e-3)
+    assert len(simplified) < len(fine_circle)
+    radii = np.linalg.norm(_sample_curves(simplified.reshape(-1, 4, 3), 32), axis=1)
+    assert np.abs(radii - 1).max() <= 1e-3
+    anchors = lambda points: np.concatenate([points[0::4], points[3::4]])
+    np.testing.assert_allclose(np.ptp(anchors(simplified), axis=0), np.ptp(anchors(fine_circle), axis=0))
+
+    with tempconfig({"quality": "low_quality"}):
+        assert [detail_level_for(height) for height in (4.0, 2.0, 0.5)] == [0, 1, 2]
+        small = PsiCreature(body_scale=0.5, initial_anchor_pos=LEFT)
+        full = PsiCreature(body_scale=0.5, initial_anchor_pos=LEFT, detail_level=0)
+        count = lambda psi: sum(len(member.points) for member in psi.family_members_with_points())
+        assert small.detail_level == 2 and count(small) < count(full)
+        np.testing.assert_allclose(small.body.get_center(), full.body.get_center(), atol=1e-12)
+
+        small.apply_state("pondering", look_at_target=RIGHT * 3, squint_amount=0.5)
+        outline = lambda: _sample_curves(small.eyes.left_eye.sclera.points.reshape(-1, 4, 3), 64)
+        sclera_before, iris_before = outline(), small.eyes.left_eye.iris.get_center()
+        corners_before = small.body.get_critical_point(UL), small.body.get_critical_point(DR)
+        # Growing, the creature switches to the finer level up front, at its small size
+        resize = small.resize(8)
+        resize.begin()
+        assert small.detail_level == 0 and small.eyes.left_eye.num_arcs == DETAIL_LEVELS[0][1]
+        assert small.eyes.blend_weights == {"squint": pytest.approx(np.sin(0.5))}
+        np.testing.assert_allclose(small.eyes.left_eye.iris.get_center(), iris_before, atol=1e-12)
+        np.testing.assert_allclose(small.body.get_critical_point(UL), corners_before[0], atol=1e-9)
+        np.testing.assert_allclose(small.body.get_critical_point(DR), corners_before[1], atol=1e-9)
+        # The redrawn sclera lies on the old outline, to within the coarse level's tolerance
+        distances = np.linalg.norm(outline()[:, None] - sclera_before[None], axis=-1).min(axis=1)
+        assert distances.max() < DETAIL_LEVELS[2][2] / 60
+        resize.finish()
+        # Shrinking, it switches once small again
+        resize = small.resize(1 / 8)
+        resize.begin()
+        assert small.eyes.left_eye.num_arcs == DETAIL_LEVELS[0][1]
+        resize.finish()
+        assert small.detail_level == 2 and small.eyes.left_eye.num_arcs == DETAIL_LEVELS[2][1]
+    with pytest.raises(ValueError):
+        PsiCreature(detail_level=len(DETAIL_LEVELS))
+
+    # Through a camera zoomed in 4x, the same creature covers 4x the pixels
+    with tempconfig({"quality": "low_quality"}):
+        frame = ScreenRectangle(height=config.frame_height / 4)
+        assert detail_level_for(0.5, frame) == 1 and detail_level_for(1.0, frame) == 0
+        zoomed = PsiCreature(body_scale=0.5, frame=frame)
+        assert zoomed.detail_level == 1 and zoomed.assets.path_tolerance == get_path_tolerance(1, frame)
+        resize = zoomed.resize(2, frame=frame)
+        resize.begin()
+        resize.finish()
+        assert zoomed.detail_level == 0
+        assert PsiCreature(body_scale=0.5).resize(2, rebuild=True, frame=frame).target_mobject.detail_level == 0
+        assert build_creatures({"creatures": {"psi": {"body_scale": 0.5}}}, frame)["psi"].detail_level == 1
+
+    # Every level poses the same: equal sclera extents, gaze range and bend strength
+    posed = []
+    for level in range(len(DETAIL_LEVELS)):
+        psi = PsiCreature(body_scale=2.0, detail_level=level)
+        eye = psi.eyes.left_eye
+        extents = (eye.sclera.width, eye.sclera.height, eye.iris.width)
+        psi.apply_state("default", look_at_target=LEFT * 5 + UP, bend_direction=UP)
+        # Bends displace by a fraction of the rest height
+        bend_height = np.ptp(eye.sclera.original_points[:, 1])
+        posed.append((*extents, *(eye.iris.get_center() - eye.sclera.get_center()), bend_height))
+    np.testing.assert_allclose(posed[1:], [posed[0]] * (len(posed) - 1), rtol=1e-9, atol=1e-12)
+
+def test_culling_skips_offscreen_creatures_and_their_frames():
+    from culling import Culled, CullingCamera, CullingScene, cull
+
+    offscreen, reference = PsiCreature(initial_anchor_pos=RIGHT * 20), PsiCreature(initial_anchor_pos=RIGHT * 20)
+    onscreen = PsiCreature(initial_anchor_pos=LEFT * 2)
+    camera = CullingCamera()
+    displayed = camera.get_mobjects_to_display([offscreen, onscreen])
+    assert {id(mobject) for mobject in displayed} == {id(mobject) for mobject in onscreen.family_members_with_points()}
+    assert camera.num_culled == len(offscreen.family_members_with_points())
+
+    # Offscreen, frames are skipped, and the animation still ends exactly where it would have
+    culled = Culled(offscreen.change_state("pondering", look_at_target=LEFT, squint_amount=0.4))
+    played = reference.change_state("pondering", look_at_target=LEFT, squint_amount=0.4)
+    culled.begin()
+    played.begin()
+    start = offscreen.body.points.copy()
+    for alpha in np.linspace(0.1, 0.9, 9):
+        culled.interpolate(alpha)
+        played.interpolate(alpha)
+    assert culled.num_skipped == 9 and np.array_equal(offscreen.body.points, start)
+    culled.finish()
+    played.finish()
+    for actual, expected in zip(offscreen.family_members_with_points(), reference.family_members_with_points()):
+        np.testing.assert_allclose(actual.points, expected.points, atol=1e-12)
+
+    # Coming into view, nothing is skipped
+    entering = Culled(offscreen.move_anchor_to(ORIGIN))
+    entering.begin()
+    entering.interpolate(0.5)
+    assert entering.num_skipped == 0 and offscreen.anchor_pos[0] < 20
+    entering.finish()
+    # Groups get their cullable animations wrapped; others are left alone
+    group = cull(AnimationGroup(onscreen.blink(), Rotate(onscreen, PI)))
+    assert all(isinstance(blink, Culled) for blink in group.animations[0].animations)
+    assert isinstance(group.animations[1], Rotate)
+
+    class Parade(CullingScene):
+        def construct(self):
+            self.creatures = [PsiCreature(initial_anchor_pos=[x, -2, 0], body_scale=1.0) for x in range(-20, 21, 10)]
+            self.add(*self.creatures)
+            self.play(*(psi.change_state("pondering") for psi in self.creatures), run_time=0.2)
+
+    with tempconfig({"dry_run": True, "quality": "low_quality", "verbosity": "WARNING", "progress_bar": "none"}):
+        scene = Parade()
+        scene.render()
+    assert isinstance(scene.camera, CullingCamera) and scene.camera.num_culled > 0
+    assert all(psi.current_state_name == "pondering" for psi in scene.creatures)